@@ -6,23 +6,24 @@ base_js = Bundle('vendor/jquery/dist/jquery.min.js',
                  'lib/qtip/jquery.qtip.js',
                  'js/main.js',
                  filters="jsmin",
-                 output="js/dist/base.js")
+                 output="js/dist/base.%(version)s.js")
 
 profiles_manager_js = Bundle('vendor/angular/angular.js',
                             'js/manager/app.js',
+                            'js/manager/models/bootstrap.js',
                             'js/manager/models/user.js',
                             'js/manager/models/users.js',
                             'js/manager/controllers/profiles.js',
                             'js/manager/controllers/admins.js',
                             'js/manager/controllers/users.js',
                             filters="jsmin",
-                            output="js/dist/profiles-manager.js")
+                            output="js/dist/profiles-manager.%(version)s.js")
 
 base_css = Bundle('vendor/bootstrap/dist/css/bootstrap.css',
                   'lib/qtip/jquery.qtip.css',
                   'css/style.css',
                   filters="cssmin",
-                  output="js/dist/base.css")
+                  output="js/dist/base.%(version)s.css")
 
 # javascript
 register("base-js", base_js)
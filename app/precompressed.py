@@ -0,0 +1,136 @@
+"""
+precompressed static files: `precompress` writes gzip and brotli variants next to built files,
+`serve` sends the smallest variant client accepts, files with content hash in name are cached by clients forever
+
+brotli variants need `brotli` package, without it only gzip ones are written
+"""
+import gzip
+import mimetypes
+import os
+import posixpath
+import re
+import urllib
+from StringIO import StringIO
+from wsgiref.util import FileWrapper
+
+from django.conf import settings
+from django.http import Http404, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+from django.views import static
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# preferred encodings first
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+# names like base.0123abcd.js are given by `build_assets` command, their content never changes
+HASHED_NAME = re.compile(r'\.[0-9a-f]{8,}\.\w+$')
+HASHED_MAX_AGE = 60 * 60 * 24 * 365
+
+CHUNK_SIZE = 64 * 1024
+
+
+def compress_gzip(content):
+    buf = StringIO()
+    # zero mtime, so the same content gives the same file
+    with gzip.GzipFile(fileobj=buf, mode='wb', compresslevel=9, mtime=0) as f:
+        f.write(content)
+    return buf.getvalue()
+
+
+def precompress(path):
+    """
+    writes variants of file for each available encoding, variants which are not smaller than file are skipped
+    :return: list of written paths
+    """
+    with open(path, 'rb') as f:
+        content = f.read()
+    compressors = [('.gz', compress_gzip)]
+    if brotli is not None:
+        compressors.insert(0, ('.br', brotli.compress))
+
+    written = []
+    for suffix, compress in compressors:
+        compressed = compress(content)
+        if len(compressed) < len(content):
+            with open(path + suffix, 'wb') as f:
+                f.write(compressed)
+            written.append(path + suffix)
+    return written
+
+
+def accepted_encodings(header):
+    """
+    :return: set of encodings listed in Accept-Encoding header without zero quality
+    """
+    encodings = set()
+    for item in header.split(','):
+        parts = [part.strip() for part in item.split(';')]
+        quality = 1.0
+        for param in parts[1:]:
+            if param.startswith('q='):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0
+        if parts[0] and quality > 0:
+            encodings.add(parts[0].lower())
+    return encodings
+
+
+def file_response(fullpath, relative_path, size):
+    """
+    web server sends file itself when STATIC_SENDFILE_HEADER is set, otherwise file is streamed by chunks
+    """
+    header = getattr(settings, 'STATIC_SENDFILE_HEADER', None)
+    if header:
+        response = HttpResponse()
+        url = getattr(settings, 'STATIC_SENDFILE_URL', None)
+        response[header] = url.rstrip('/') + '/' + relative_path if url else fullpath
+        return response
+
+    response = StreamingHttpResponse(FileWrapper(open(fullpath, 'rb'), CHUNK_SIZE))
+    response['Content-Length'] = size
+    return response
+
+
+def serve(request, path, document_root=None, show_indexes=False):
+    """
+    serves static files like `django.views.static.serve` does, precompressed variants are sent to clients accepting them
+    """
+    path = posixpath.normpath(urllib.unquote(path)).lstrip('/')
+    try:
+        fullpath = safe_join(document_root, path)
+    except ValueError:
+        raise Http404
+    if not os.path.isfile(fullpath):
+        return static.serve(request, path, document_root, show_indexes)
+
+    content_type, encoding = mimetypes.guess_type(fullpath)
+    sent_path, sent_fullpath = path, fullpath
+    if encoding is None:
+        accepted = accepted_encodings(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        for name, suffix in ENCODINGS:
+            if name in accepted and os.path.isfile(fullpath + suffix):
+                sent_path, sent_fullpath, encoding = path + suffix, fullpath + suffix, name
+                break
+
+    stat = os.stat(sent_fullpath)
+    if not static.was_modified_since(request.META.get('HTTP_IF_MODIFIED_SINCE'), stat.st_mtime, stat.st_size):
+        response = HttpResponseNotModified()
+    else:
+        response = file_response(sent_fullpath, sent_path, stat.st_size)
+    response['Content-Type'] = content_type or 'application/octet-stream'
+    response['Last-Modified'] = http_date(stat.st_mtime)
+    if encoding:
+        response['Content-Encoding'] = encoding
+    if any(os.path.isfile(fullpath + suffix) for name, suffix in ENCODINGS):
+        patch_vary_headers(response, ('Accept-Encoding', ))
+    if HASHED_NAME.search(path):
+        patch_cache_control(response, public=True, max_age=HASHED_MAX_AGE, immutable=True)
+    return response
@@ -38,6 +38,8 @@ ALLOWED_HOSTS = credentials.get("ALLOWED_HOSTS", ['*', ])
 from app.settings.apps import *
 from app.settings.middleware import *
 from app.settings.database import *
+from app.settings.cache import *
+from app.settings.sessions import *
 from app.settings.dirs import *
 from app.settings.assets import *
 
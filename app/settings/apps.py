@@ -13,4 +13,10 @@ INSTALLED_APPS = (
 
     'profiles', # common profiles application
     'bootstrap3', # for bootstraping forms
+    'tastypie', # api keys of machine clients
+)
+
+AUTHENTICATION_BACKENDS = (
+    'profiles.backends.ProfileModelBackend', # loads user profile with user
+    'django.contrib.auth.backends.ModelBackend', # keeps sessions logged in before ProfileModelBackend
 )
@@ -8,8 +8,15 @@ ASSETS_MODULES = [
 
 ASSETS_DEBUG = DEBUG
 ASSETS_CACHE = False
-ASSETS_MANIFEST = False
-if not DEBUG:
-    ASSETS_AUTO_BUILD = False
-
 ASSETS_ROOT = os.path.join(BASE_DIR, 'app/static')
+
+# bundles are built into files named by hash of their content by `build_assets` command,
+# it should be run on deploy before collectstatic, urls are taken from manifest and change only with content,
+# so clients cache files forever
+ASSETS_VERSIONS = 'hash'
+ASSETS_MANIFEST_PATH = os.path.join(ASSETS_ROOT, 'js/dist/manifest.json')
+ASSETS_MANIFEST = 'json:' + ASSETS_MANIFEST_PATH
+ASSETS_URL_EXPIRE = False
+# until bundles are built, e.g. on fresh checkout, they are built by the first request rendering them
+if not DEBUG and os.path.exists(ASSETS_MANIFEST_PATH):
+    ASSETS_AUTO_BUILD = False
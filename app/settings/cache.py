@@ -0,0 +1,27 @@
+# common CACHES settings
+# https://docs.djangoproject.com/en/1.7/topics/cache/
+import sys
+
+from app.settings import credentials
+
+# access sets, rendered pages and admin decisions are dropped by the worker which changes data,
+# per-process cache would keep serving them in other workers, so nothing is cached until a shared cache is set,
+# tests run in a single process and use local memory
+SINGLE_PROCESS = sys.argv[1:2] == ['test']
+
+if SINGLE_PROCESS:
+    DEFAULT_CACHE = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'profiles',
+    }
+else:
+    DEFAULT_CACHE = {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    }
+
+CACHES = {
+    'default': credentials.get("cache", DEFAULT_CACHE)
+}
+
+# default cache is seen by every process which serves requests
+CACHE_SHARED = "cache" in credentials or SINGLE_PROCESS
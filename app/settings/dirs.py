@@ -4,7 +4,7 @@
 # https://docs.djangoproject.com/en/1.7/howto/static-files/
 import os
 
-from app.settings import BASE_DIR, DEBUG
+from app.settings import BASE_DIR, DEBUG, credentials
 
 # URL to use when referring to static files located in STATIC_ROOT.
 STATIC_URL = '/static/'
@@ -17,6 +17,12 @@ STATICFILES_DIRS = (
 # The absolute path to the directory where collectstatic will collect static files for deployment.
 STATIC_ROOT = os.path.join(BASE_DIR, 'static')
 
+# static files are sent by web server when app.precompressed.serve sets this header:
+# 'X-Sendfile' (apache, lighttpd) gets path of file, 'X-Accel-Redirect' (nginx) gets path of file under STATIC_ROOT
+# prefixed by STATIC_SENDFILE_URL, an internal location of web server
+STATIC_SENDFILE_HEADER = credentials.get("STATIC_SENDFILE_HEADER")
+STATIC_SENDFILE_URL = credentials.get("STATIC_SENDFILE_URL")
+
 STATICFILES_FINDERS = (
    "django.contrib.staticfiles.finders.FileSystemFinder",
    "django.contrib.staticfiles.finders.AppDirectoriesFinder",
@@ -1,3 +1,5 @@
+from app.settings import credentials
+
 MIDDLEWARE_CLASSES = (
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -7,3 +9,8 @@ MIDDLEWARE_CLASSES = (
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 )
+
+# queries and time of every request in Server-Timing header and in `timing_stats` command, see profiles.timing
+PROFILES_TIMING = credentials.get("PROFILES_TIMING", "False") == "True"
+if PROFILES_TIMING:
+    MIDDLEWARE_CLASSES = ('profiles.timing.TimingMiddleware', ) + MIDDLEWARE_CLASSES
@@ -0,0 +1,11 @@
+# common SESSION settings
+# https://docs.djangoproject.com/en/1.7/topics/http/sessions/#using-cached-sessions
+from app.settings import credentials
+from app.settings.cache import CACHE_SHARED
+
+# sessions are read on each request, shared cache serves them and database keeps them when cache is restarted,
+# sessions cached by one worker would not see logout or new passkeys made in others, so without shared cache
+# they are read from database
+SESSION_ENGINE = credentials.get("SESSION_ENGINE", 'django.contrib.sessions.backends.cached_db' if CACHE_SHARED
+                                 else 'django.contrib.sessions.backends.db')
+SESSION_CACHE_ALIAS = 'default'
@@ -0,0 +1,44 @@
+$(function () {
+    // next pages of profiles index are loaded when "more" link is scrolled into view
+    var $list = $('.profiles-list'),
+        $more = $('.profiles-more'),
+        loading = false;
+
+    function loadMore(force) {
+        if (loading || !$more.length) {
+            return;
+        }
+        if (!force && $(window).scrollTop() + $(window).height() < $more.offset().top - 200) {
+            return;
+        }
+
+        loading = true;
+        $.getJSON($list.data('more-url'), {after: $more.data('after')}).done(function (data) {
+            var $add = $list.children('.add');
+            if ($add.length) {
+                $add.before(data.html);
+            } else {
+                $list.append(data.html);
+            }
+
+            if (data.next) {
+                $more.data('after', data.next).attr('href', '?after=' + data.next);
+            } else {
+                $more.remove();
+                $more = $();
+            }
+        }).always(function () {
+            loading = false;
+        });
+    }
+
+    if ($more.length) {
+        $(window).on('scroll resize', _.throttle(function () {
+            loadMore(false);
+        }, 200));
+        $more.on('click', function (e) {
+            e.preventDefault();
+            loadMore(true);
+        });
+    }
+});
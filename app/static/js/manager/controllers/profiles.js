@@ -4,11 +4,12 @@
 
 app = angular.module("manager-app");
 
-app.controller("ProfilesCtrl", ['$scope', '$http', 'info', function ($scope, $http, info) {
+app.controller("ProfilesCtrl", ['$scope', 'info', 'Bootstrap', function ($scope, info, bootstrap) {
     $scope.info = info;
+    $scope.profiles = [];
 
-    $http.get(commonUrls.profiles).success(function (data) {
-        $scope.profiles = data.objects;
+    bootstrap.then(function (data) {
+        $scope.profiles = data.profiles;
     });
 
     $scope.setActiveProfile = function (profile) {
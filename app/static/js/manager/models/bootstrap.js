@@ -0,0 +1,35 @@
+/**
+ * data of manager page loaded with single request
+ */
+
+app = angular.module("manager-app");
+
+app.factory("Bootstrap", ['$http', function ($http) {
+    /**
+     * turns {name: [values]} columns returned by server into the list of objects
+     * @param columns
+     * @returns {Array}
+     */
+    function rows(columns) {
+        var names = Object.keys(columns),
+            length = names.length ? columns[names[0]].length : 0,
+            result = [];
+        for (var i = 0; i < length; ++i) {
+            var row = {};
+            for (var j = 0; j < names.length; ++j) {
+                row[names[j]] = columns[names[j]][i];
+            }
+            result.push(row);
+        }
+        return result;
+    }
+
+    // promise of {profiles, users, passkeys} lists
+    return $http.get(commonUrls.bootstrap).then(function (response) {
+        return {
+            profiles: rows(response.data.profiles),
+            users: rows(response.data.users),
+            passkeys: rows(response.data.passkeys)
+        };
+    });
+}]);
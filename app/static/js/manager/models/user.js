@@ -22,8 +22,8 @@ app.factory("User", ['$http', 'info', function ($http, info) {
 
         // map profiles values returned by api
         self.profiles = {};
-        data.profiles.forEach(function (item) {
-            self.profiles[item.id] = true;
+        data.profiles.forEach(function (id) {
+            self.profiles[id] = true;
         });
 
         self.sending_email = false;
@@ -31,7 +31,8 @@ app.factory("User", ['$http', 'info', function ($http, info) {
         for (var i = 0, l = profile_passkeys.length; i < l; ++i) {
             var profile_passkey = profile_passkeys[i];
             if (profile_passkey.user == self.id) {
-                self.passkeys[profile_passkey.profile] = profile_passkey.passkey;
+                // passkeys are stored hashed, only new ones are known here
+                self.passkeys[profile_passkey.profile] = '';
                 self.allowed[profile_passkey.profile] = true;
             }
         }
@@ -143,6 +144,24 @@ app.factory("User", ['$http', 'info', function ($http, info) {
         reset_profiles: function () {
             this.base_profiles = _.clone(this.profiles);
         },
+        applyChange: function (kind, action, profile) {
+            /***
+             * applies change of passkeys matrix loaded from server, values edited on the page are kept
+             */
+            var values = kind == 'passkey' ? this.allowed : this.profiles,
+                base_values = kind == 'passkey' ? this.base_allowed : this.base_profiles;
+            if (values[profile] === base_values[profile]) {
+                values[profile] = action == 'set';
+            }
+            base_values[profile] = action == 'set';
+        },
+        canSendPasskey: function () {
+            /***
+             * stored passkeys are hashed, only new passkey can be sent once it is saved
+             */
+            var id = info.profile && info.profile.id;
+            return !!(id && this.allowed[id] && this.passkeys[id] && this.passkeys[id] === this.base_passkeys[id]);
+        },
         sendPasskeyToEmail: function ($event) {
             /***
              * send notification to user about new password
@@ -167,9 +186,10 @@ app.factory("User", ['$http', 'info', function ($http, info) {
                 });
                 // get  api
                 var api = tooltips.qtip('api');
-                if (!this.allowed[info.profile.id]) {
+                if (!this.canSendPasskey()) {
                     api.set({
-                        'content.text': 'you cant send email for restricted user',
+                        'content.text': !this.allowed[info.profile.id] ? 'you cant send email for restricted user' :
+                            'passkey is stored hashed, generate and save a new one to send it',
                         'style.classes': 'qtip-red qtip-shadow qtip-rounded'
                     });
                     api.show();
@@ -192,7 +212,7 @@ app.factory("User", ['$http', 'info', function ($http, info) {
                     headers: {'Content-Type': 'application/x-www-form-urlencoded'}
                 }).success(function () {
                     api.set({
-                        'content.text': 'email successfully sent'
+                        'content.text': 'email queued for sending'
                     });
 
                 }).error(function () {
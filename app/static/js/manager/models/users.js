@@ -6,19 +6,58 @@
 app = angular.module("manager-app");
 
 // shared data factory
-app.factory("Users", ['$http', 'User', function ($http, User) {
+app.factory("Users", ['$http', '$interval', 'Bootstrap', 'User', function ($http, $interval, bootstrap, User) {
     var self = this;
-    $http.get(commonUrls.profilepasskeys).success(function (data) {
-        var profile_passkeys = data.objects;
+    self.version = null; // version of passkeys matrix loaded to the page
+    self.applied = {}; // log ids of changes applied by the last sync, recent changes are sent again
 
-        $http.get(commonUrls.users).success(function (data) {
-            self.list = data.objects.map(function (item) {
-                return new User(item, profile_passkeys)
-            });
+    bootstrap.then(function (data) {
+        // passkeys grouped by user
+        var profile_passkeys = {};
+        data.passkeys.forEach(function (item) {
+            (profile_passkeys[item.user] = profile_passkeys[item.user] || []).push(item);
         });
+
+        self.list = data.users.map(function (item) {
+            return new User({
+                user: {id: item.id, username: item.username, email: item.email},
+                is_admin: item.is_admin,
+                profiles: item.profiles
+            }, profile_passkeys[item.id] || []);
+        });
+        self.version = data.version;
     });
 
-    return this;
-}]);
+    self.sync = function () {
+        /***
+         * applies changes made by others since loaded version
+         */
+        if (self.version === null) {
+            return;
+        }
+        $http.get(commonUrls.changes, {params: {since: self.version}}).success(function (data) {
+            if (data.reset) {
+                window.location.reload();
+                return;
+            }
+            var users = _.indexBy(self.list, 'id'),
+                applied = {};
+            for (var i = 0, l = data.changes.kind.length; i < l; ++i) {
+                var user = users[data.changes.user[i]];
+                applied[data.changes.id[i]] = true;
+                if (user && !self.applied[data.changes.id[i]]) {
+                    user.applyChange(data.changes.kind[i], data.changes.action[i], data.changes.profile[i]);
+                }
+            }
+            self.applied = applied;
+            self.version = data.version;
+            if (data.more) {
+                self.sync();
+            }
+        });
+    };
 
+    $interval(self.sync, 30000);
 
+    return this;
+}]);
@@ -7,6 +7,6 @@ urlpatterns = patterns('',
     url(r'^accounts/login/$', 'django.contrib.auth.views.login'),
     url(r'^accounts/logout/$', 'django.contrib.auth.views.logout'),
     url(r'^admin/', include(admin.site.urls)),
-    url(r'^static/(?P<path>.*)$', 'django.views.static.serve', {'document_root': settings.STATIC_ROOT, 'show_indexes': settings.DEBUG}),
+    url(r'^static/(?P<path>.*)$', 'app.precompressed.serve', {'document_root': settings.STATIC_ROOT, 'show_indexes': settings.DEBUG}),
     url(r'^', include(profiles.urls))
 )
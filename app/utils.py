@@ -1,6 +1,8 @@
 # coding=utf-8
 import datetime
+from functools import wraps
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.urlresolvers import reverse
 from django.db.models.fields.files import ImageFieldFile
 from django.http import HttpResponseBadRequest, HttpResponse
@@ -9,6 +11,7 @@ from django.test import TestCase
 
 def require_in_POST(*items):
     def decorator(func):
+        @wraps(func)
         def wrapper(request):
             err = ""
             for item in items:
@@ -25,6 +28,7 @@ def require_in_POST(*items):
 
 def require_in_GET(*items):
     def decorator(func):
+        @wraps(func)
         def wrapper(request):
             err = ""
             for item in items:
@@ -117,6 +121,7 @@ class TestCaseEx(TestCase):
     password = '12345'
 
     def setUp(self):
+        cache.clear()
         self.root = User.objects.create_superuser('root', 'mailm@mail.ru', self.password)
         self.user = User.objects.create_user('default', 'admin@admin.ru', self.password)
 
@@ -0,0 +1,143 @@
+"""
+access of user to profiles kept as id sets, each set is loaded with one query on first use
+and cached per user until access version is changed by signals, see `profiles.cache.cached_access`
+"""
+from django.conf import settings
+
+from profiles.cache import cached_access, ACCESS_KEY, MANAGED_KEY, PASSKEYS_KEY
+from profiles.models import Profile, ProfilePasskeys
+
+
+class IdSet(object):
+    """
+    immutable set of ids, dense sets are kept as bitmap with a bit per id up to the biggest one,
+    sparse ones as frozenset, both answer membership in constant time
+    """
+    __slots__ = ('ids', 'bitmap', 'size')
+
+    # pickled frozenset takes about this number of bytes per id
+    ID_BYTES = 5
+
+    def __init__(self, ids=()):
+        ids = frozenset(ids)
+        self.size = len(ids)
+        if ids and max(ids) // 8 < len(ids) * self.ID_BYTES:
+            self.ids = None
+            self.bitmap = bytearray(max(ids) // 8 + 1)
+            for id in ids:
+                self.bitmap[id >> 3] |= 1 << (id & 7)
+        else:
+            self.ids = ids
+            self.bitmap = None
+
+    def __contains__(self, id):
+        id = int(id)
+        if self.bitmap is None:
+            return id in self.ids
+        return 0 <= id < len(self.bitmap) * 8 and bool(self.bitmap[id >> 3] & (1 << (id & 7)))
+
+    def __iter__(self):
+        if self.bitmap is None:
+            return iter(self.ids)
+        return (index * 8 + bit for index, byte in enumerate(self.bitmap) if byte
+                for bit in xrange(8) if byte & (1 << bit))
+
+    def __len__(self):
+        return self.size
+
+    def __getstate__(self):
+        return self.ids, self.bitmap, self.size
+
+    def __setstate__(self, state):
+        self.ids, self.bitmap, self.size = state
+
+
+class AccessMatrix(object):
+    """
+    answers which profiles user can see and manage, sets are shared by requests of user through cache,
+    so checks of views cost no queries once sets are loaded
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self.is_superuser = user.is_superuser
+        self.is_admin = getattr(user, 'is_admin', False)
+        self._managed = None
+        self._passkeys = None
+        self._listing = None
+
+    @property
+    def managed(self):
+        """
+        :return: `IdSet` of profiles admin is allowed to manage, empty for others
+        """
+        if self._managed is None:
+            if self.is_admin and self.user.pk:
+                self._managed = cached_access(self.user, lambda: IdSet(
+                    self.user.profile.profiles.values_list("id", flat=True)), MANAGED_KEY)
+            else:
+                self._managed = IdSet()
+        return self._managed
+
+    @property
+    def passkeys(self):
+        """
+        :return: `IdSet` of profiles user has passkey for
+        """
+        if self._passkeys is None:
+            if self.user.pk:
+                self._passkeys = cached_access(self.user, lambda: IdSet(
+                    ProfilePasskeys.objects.filter(user_id=self.user.pk).values_list("profile_id", flat=True)),
+                    PASSKEYS_KEY)
+            else:
+                self._passkeys = IdSet()
+        return self._passkeys
+
+    @property
+    def listing(self):
+        """
+        :return: `Profile.materialize_access` of user
+        """
+        if self._listing is None:
+            self._listing = cached_access(self.user, lambda: Profile.materialize_access(self.user), ACCESS_KEY)
+        return self._listing
+
+    def can_manage(self, profile_id):
+        return self.is_superuser or (self.is_admin and profile_id in self.managed)
+
+    def can_view(self, profile_id):
+        """
+        :return: True if profile is listed to user, profiles with passkeys are shown after passkey is provided
+        """
+        if self.is_superuser:
+            return True
+        mode, ids = self.listing
+        if mode == 'in':
+            return int(profile_id) in ids
+        if mode == 'not_in':
+            return int(profile_id) not in ids
+        if profile_id in self.passkeys or self.can_manage(profile_id):
+            return True
+        return not ProfilePasskeys.objects.filter(profile_id=profile_id).exists()
+
+    def accessible(self):
+        """
+        :return: queryset of profiles listed to user
+        """
+        if self.is_superuser:
+            return Profile.objects.all()
+        if self._listing is None and not getattr(settings, "CACHE_SHARED", False):
+            # materialized ids would not be kept, single query with subqueries is cheaper than two
+            return Profile.query_accessed_by(self.user)
+        mode, ids = self.listing
+        if mode == 'in':
+            return Profile.objects.filter(pk__in=ids)
+        if mode == 'not_in':
+            return Profile.objects.exclude(pk__in=ids)
+        return Profile.query_accessed_by(self.user)
+
+    def managed_among(self, profile_ids):
+        """
+        :return: set of given ids user can manage
+        """
+        return set(profile_id for profile_id in profile_ids if self.can_manage(profile_id))
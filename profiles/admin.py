@@ -3,11 +3,24 @@ from django.contrib import admin
 # Register your models here.
 from django.contrib.auth.admin import UserAdmin
 from django.contrib.auth.models import User
+from django.forms.models import BaseInlineFormSet
+from profiles.cache import invalidate_access_cache
 from profiles.models.user_profile import UserProfile
 
 
+class UserProfileInlineFormSet(BaseInlineFormSet):
+    """
+    profile of new user is already created by `create_user_profile` signal, inline fills it instead of adding another
+    """
+
+    def save_new(self, form, commit=True):
+        form.instance.pk = self.instance.profile.pk
+        return super(UserProfileInlineFormSet, self).save_new(form, commit)
+
+
 class UserProfileInline(admin.StackedInline):
     model = UserProfile
+    formset = UserProfileInlineFormSet
     can_delete = False
     verbose_name_plural = 'venue user'
 
@@ -18,11 +31,29 @@ class UserAdmin(UserAdmin):
     inlines = (UserProfileInline, )
     list_display = UserAdmin.list_display + ('is_superuser', 'is_admin')
 
+    def get_queryset(self, request):
+        return super(UserAdmin, self).get_queryset(request).select_related('userprofile')
+
     def is_admin(self, user):
         return user.is_admin
 
     is_admin.boolean = True
 
+    # views save in transaction, access sets loaded before it is committed are dropped once more
+    def changeform_view(self, request, *args, **kwargs):
+        try:
+            return super(UserAdmin, self).changeform_view(request, *args, **kwargs)
+        finally:
+            if request.method == 'POST':
+                invalidate_access_cache()
+
+    def delete_view(self, request, *args, **kwargs):
+        try:
+            return super(UserAdmin, self).delete_view(request, *args, **kwargs)
+        finally:
+            if request.method == 'POST':
+                invalidate_access_cache()
+
 # Re-register UserAdmin
 admin.site.unregister(User)
 admin.site.register(User, UserAdmin)
\ No newline at end of file
@@ -1,41 +1,172 @@
+from django.conf import settings
 from django.contrib.auth.models import User, AnonymousUser
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
 from tastypie import fields
-from tastypie.authentication import BasicAuthentication, SessionAuthentication, Authentication
+from tastypie.authentication import BasicAuthentication, SessionAuthentication, Authentication, \
+    ApiKeyAuthentication, MultiAuthentication
 from tastypie.authorization import DjangoAuthorization
+from tastypie.exceptions import ImmediateHttpResponse
+from tastypie.models import ApiKey
+from tastypie.utils.mime import build_content_type
+from profiles.cache import cached_is_admin
 from profiles.models import Profile, ProfilePasskeys
 
 from tastypie.resources import ModelResource
 from profiles.models.user_profile import UserProfile
+from profiles.paginators import KeysetPaginator
+
+# lists with bigger pages are serialized object by object while response is sent
+STREAMING_MIN_LIMIT = getattr(settings, "PROFILES_API_STREAMING_MIN_LIMIT", 200)
 
 
 class SuperuserAuthentication(Authentication):
     """
-    restricts access for all except admins
+    restricts access for all except admins logged in by session
     """
 
     def is_authenticated(self, request, **kwargs):
-        if hasattr(request.user, 'is_admin') and request.user.is_admin:
-            return True
-        return False
+        user = getattr(request, 'user', None)
+        if user is None or not user.is_authenticated():
+            return False
+        return cached_is_admin(user)
 
     # Optional but recommended
     def get_identifier(self, request):
         return request.user.username
 
 
-class ProfileResource(ModelResource):
+class AdminApiKeyAuthentication(ApiKeyAuthentication):
+    """
+    lets in admins sending `Authorization: ApiKey <username>:<key>` header,
+    user is loaded together with its key and profile by one query and session is never read
+    """
+
+    def is_authenticated(self, request, **kwargs):
+        try:
+            username, key = self.extract_credentials(request)
+        except ValueError:
+            return self._unauthorized()
+
+        if not username or not key:
+            return self._unauthorized()
+
+        try:
+            api_key = ApiKey.objects.select_related('user__userprofile').get(user__username=username, key=key)
+        except ApiKey.DoesNotExist:
+            return self._unauthorized()
+
+        if not self.check_active(api_key.user) or not cached_is_admin(api_key.user):
+            return self._unauthorized()
+
+        request.user = api_key.user
+        return True
+
+
+class AdminAuthentication(MultiAuthentication):
+    """
+    admins authenticated by api key or by session,
+    decision is memoized on request, so it is made once however many times tastypie asks for it
+    """
+
+    def __init__(self):
+        # api key goes first, machine clients dont touch session
+        super(AdminAuthentication, self).__init__(AdminApiKeyAuthentication(), SuperuserAuthentication())
+
+    def is_authenticated(self, request, **kwargs):
+        if not hasattr(request, '_profiles_authenticated'):
+            request._profiles_authenticated = super(AdminAuthentication, self).is_authenticated(request, **kwargs)
+        return request._profiles_authenticated
+
+
+class SparseFieldsMixin(object):
+    """
+    supports `fields=id,name` parameter, only requested fields are loaded from database and dehydrated
+    """
+
+    def requested_fields(self, request):
+        """
+        :return: names of requested fields in resource order or None if all fields are requested
+        """
+        value = request.GET.get('fields') if request is not None else None
+        if not value:
+            return None
+        names = set(name.strip() for name in value.split(','))
+        return [name for name in self.fields if name in names]
 
     def get_object_list(self, request):
-        query = super(ProfileResource, self).get_object_list(request)
-        if not request.user.is_superuser:
-            # get list of profiles that can be managed by this user
-            allowed_profiles = request.user.profile.profiles.values("id")
-            query = query.filter(id__in=allowed_profiles)
+        query = super(SparseFieldsMixin, self).get_object_list(request)
+        fields = self.requested_fields(request)
+        if fields is not None:
+            columns = set(field.attname for field in query.model._meta.concrete_fields)
+            query = query.only(*[self.fields[name].attribute for name in fields
+                                 if self.fields[name].attribute in columns])
         return query
 
+    def full_dehydrate(self, bundle, for_list=False):
+        fields = self.requested_fields(bundle.request)
+        if fields is None:
+            return super(SparseFieldsMixin, self).full_dehydrate(bundle, for_list)
+
+        for field_name in fields:
+            field_object = self.fields[field_name]
+            if getattr(field_object, 'dehydrated_type', None) == 'related':
+                field_object.api_name = self._meta.api_name
+                field_object.resource_name = self._meta.resource_name
+
+            bundle.data[field_name] = field_object.dehydrate(bundle, for_list=for_list)
+            method = getattr(self, "dehydrate_%s" % field_name, None)
+            if method:
+                bundle.data[field_name] = method(bundle)
+        return self.dehydrate(bundle)
+
+
+class StreamingListMixin(object):
+    """
+    sends big json lists without building the whole response in memory,
+    objects are dehydrated and serialized one by one
+    """
+
+    def get_list(self, request, **kwargs):
+        desired_format = self.determine_format(request)
+        if desired_format != 'application/json':
+            return super(StreamingListMixin, self).get_list(request, **kwargs)
+
+        base_bundle = self.build_bundle(request=request)
+        objects = self.obj_get_list(bundle=base_bundle, **self.remove_api_resource_names(kwargs))
+        sorted_objects = self.apply_sorting(objects, options=request.GET)
+        paginator = self._meta.paginator_class(request.GET, sorted_objects, resource_uri=self.get_resource_uri(),
+                                               limit=self._meta.limit, max_limit=self._meta.max_limit,
+                                               collection_name=self._meta.collection_name)
+        if 0 < paginator.get_limit() < STREAMING_MIN_LIMIT:
+            return super(StreamingListMixin, self).get_list(request, **kwargs)
+
+        page = paginator.page()
+        serializer = self._meta.serializer
+
+        def stream():
+            yield '{"meta": %s, "%s": [' % (serializer.to_json(page['meta']), self._meta.collection_name)
+            for i, obj in enumerate(page[self._meta.collection_name]):
+                bundle = self.full_dehydrate(self.build_bundle(obj=obj, request=request), for_list=True)
+                yield (', ' if i else '') + serializer.to_json(bundle)
+            yield ']}'
+
+        # dispatch replaces anything but HttpResponse with empty response, the exception is passed through
+        raise ImmediateHttpResponse(response=StreamingHttpResponse(stream(),
+                                                                   content_type=build_content_type(desired_format)))
+
+
+class ProfileResource(SparseFieldsMixin, StreamingListMixin, ModelResource):
+
+    def get_object_list(self, request):
+        query = super(ProfileResource, self).get_object_list(request)
+        # get list of profiles that can be managed by this user
+        return query & Profile.list_managed_by(request.user)
+
     class Meta:
         queryset = Profile.objects.all()
-        authentication = SuperuserAuthentication()
+        authentication = AdminAuthentication()
+        paginator_class = KeysetPaginator
 
 
 class UserResource(ModelResource):
@@ -46,7 +177,7 @@ class UserResource(ModelResource):
     class Meta:
         excludes = ['is_active', 'is_staff', 'is_superuser', 'password']
         queryset = User.objects.filter(is_superuser=False, is_active=True)
-        authentication = SuperuserAuthentication()
+        authentication = AdminAuthentication()
 
 
 class AllowedProfileResource(ModelResource):
@@ -56,7 +187,32 @@ class AllowedProfileResource(ModelResource):
     class Meta:
         excludes = ['created', 'modified', 'name', 'slug', 'text']
         queryset = Profile.objects.all()
-        authentication = SuperuserAuthentication()
+        authentication = AdminAuthentication()
+
+
+class FlatToOneField(fields.ToOneField):
+    """
+    dehydrates related object with plain fields of related resource,
+    no resource or bundle is built for it, so related object should be loaded with select_related
+    """
+
+    def dehydrate(self, bundle, for_list=True):
+        related = getattr(bundle.obj, self.attribute)
+        if related is None:
+            return None
+        return dict((name, field.convert(getattr(related, field.attribute)))
+                    for name, field in self.to_class.base_fields.items()
+                    if isinstance(field.attribute, basestring) and not getattr(field, 'is_related', False))
+
+
+class IdsToManyField(fields.ToManyField):
+    """
+    dehydrates related objects to the list of their ids, no resources or bundles are built for them,
+    so related objects should be prefetched
+    """
+
+    def dehydrate(self, bundle, for_list=True):
+        return [related.pk for related in getattr(bundle.obj, self.attribute).all()]
 
 
 class UserProfileResource(ModelResource):
@@ -64,8 +220,8 @@ class UserProfileResource(ModelResource):
     api resource returning all sensitive info about profile
     excludes superusers, request  user, and unactive users
     """
-    user = fields.ToOneField(UserResource, 'user', full=True)
-    profiles = fields.ToManyField(AllowedProfileResource, "profiles", full=True)
+    user = FlatToOneField(UserResource, 'user', full=True)
+    profiles = IdsToManyField(AllowedProfileResource, "profiles")
 
     def get_object_list(self, request):
         query = super(UserProfileResource, self).get_object_list(request)
@@ -75,14 +231,58 @@ class UserProfileResource(ModelResource):
         return query
 
     class Meta:
-        queryset = UserProfile.objects.filter(user__is_superuser=False, user__is_active=True)
-        authentication = SuperuserAuthentication()
+        # users and ids of their profiles are loaded with two queries for any page size
+        queryset = UserProfile.objects.filter(user__is_superuser=False, user__is_active=True) \
+            .select_related('user').prefetch_related(Prefetch('profiles', queryset=Profile.objects.only('id')))
+        authentication = AdminAuthentication()
 
 
-class ProfilePasskeysResource(ModelResource):
+class CompactListMixin(object):
+    """
+    supports `compact=1` parameter, list is sent as rows of values of `compact_fields`
+    read straight from database, no bundles are built
+
+      {meta: {...}, fields: ['id', ...], objects: [[1, ...], ...]}
+    """
+    compact_fields = ('id', )
+
+    def get_list(self, request, **kwargs):
+        if not request.GET.get('compact'):
+            return super(CompactListMixin, self).get_list(request, **kwargs)
+
+        base_bundle = self.build_bundle(request=request)
+        objects = self.obj_get_list(bundle=base_bundle, **self.remove_api_resource_names(kwargs))
+        sorted_objects = self.apply_sorting(objects, options=request.GET)
+        rows = sorted_objects.values_list(*[self.fields[name].attribute for name in self.compact_fields])
+
+        paginator = self._meta.paginator_class(request.GET, rows, resource_uri=self.get_resource_uri(),
+                                               limit=self._meta.limit, max_limit=self._meta.max_limit,
+                                               collection_name=self._meta.collection_name)
+        to_be_serialized = paginator.page()
+        to_be_serialized[self._meta.collection_name] = list(to_be_serialized[self._meta.collection_name])
+        to_be_serialized['fields'] = list(self.compact_fields)
+        return self.create_response(request, to_be_serialized)
+
+
+class ProfilePasskeysResource(CompactListMixin, ModelResource):
     profile = fields.IntegerField(attribute="profile_id")
     user = fields.IntegerField(attribute="user_id")
 
+    compact_fields = ('id', 'profile', 'user')
+
+    def get_object_list(self, request):
+        query = super(ProfilePasskeysResource, self).get_object_list(request)
+        # passkeys of profiles managed by this user, the same rule as of ProfileResource instead of per row authorization
+        return query.filter(Profile.managed_q(request.user, "profile_id"))
+
     class Meta:
-        queryset = ProfilePasskeys.objects.all()
-        authentication = SuperuserAuthentication()
\ No newline at end of file
+        # stable order for offset pagination
+        queryset = ProfilePasskeys.objects.order_by('id')
+        # passkeys are stored hashed, hashes are not shown to anyone
+        excludes = ['passkey']
+        authentication = AdminAuthentication()
+        # both columns are leading columns of indexes
+        filtering = {
+            'profile': ['exact', 'in'],
+            'user': ['exact', 'in'],
+        }
\ No newline at end of file
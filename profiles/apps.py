@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class ProfilesConfig(AppConfig):
+    name = 'profiles'
+    verbose_name = 'Profiles'
+
+    def ready(self):
+        # connect signal handlers
+        import profiles.signals
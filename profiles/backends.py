@@ -0,0 +1,15 @@
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import User
+
+
+class ProfileModelBackend(ModelBackend):
+    """
+    authentication backend which loads user together with its UserProfile,
+    so request.user.profile and request.user.is_admin dont hit database
+    """
+
+    def get_user(self, user_id):
+        try:
+            return User.objects.select_related('userprofile').get(pk=user_id)
+        except User.DoesNotExist:
+            return None
@@ -0,0 +1,245 @@
+"""
+query count, wall time and peak memory of every view and api resource over seeded data,
+used by `bench_views` command and by query budget test, budgets are kept in `BASELINES_PATH`
+"""
+import json
+import os
+import random
+import resource
+import time
+from collections import namedtuple
+
+from django.contrib.auth.models import User
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.urlresolvers import reverse
+from django.db import connection
+from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
+from tastypie.models import ApiKey
+
+from profiles.bulk import chunks
+from profiles.models import Profile, ProfilePasskeys
+from profiles.passkeys import hash_passkey
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), "benchmark_baselines.json")
+
+# cache is cleared before each request, so benchmark runs with its own one rather than the shared cache of deployment
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'profiles-benchmark',
+    }
+}
+
+# password of seeded users and passkey of their profiles
+PASSWORD = "bench"
+
+Endpoint = namedtuple("Endpoint", "name role method url data")
+
+
+def seed(profiles_count, users_count, density, prefix=None):
+    """
+    creates profiles and users with passkeys between random pairs of them,
+    and users of each role requests are made by, see `endpoints`
+    :param density: share of (user, profile) pairs with passkey
+    :return: dict of created users and profiles endpoints refer to
+    """
+    prefix = prefix or u"bench-%s-" % random.randint(0, 10 ** 6)
+    # the same data for the same arguments, so runs can be compared
+    rnd = random.Random(0)
+
+    User.objects.bulk_create([User(username="%s%s" % (prefix, i)) for i in xrange(users_count)])
+    for chunk in chunks(xrange(profiles_count), 1000):
+        Profile.objects.bulk_create([Profile(name="%s%s" % (prefix, i), slug="%s%s" % (prefix, i),
+                                             text="bench profile number %s" % i,
+                                             created="2015-01-01", modified="2015-01-01") for i in chunk])
+
+    user_ids = list(User.objects.filter(username__startswith=prefix).values_list("id", flat=True))
+    profile_ids = list(Profile.objects.filter(slug__startswith=prefix).values_list("id", flat=True))
+    pairs = set()
+    for i in xrange(int(len(user_ids) * len(profile_ids) * density)):
+        pairs.add((rnd.choice(profile_ids), rnd.choice(user_ids)))
+    # the same hash for all pairs, hashing is slow
+    passkey = hash_passkey(PASSWORD)
+    for chunk in chunks(pairs, 500):
+        ProfilePasskeys.objects.bulk_create([ProfilePasskeys(profile_id=profile_id, user_id=user_id, passkey=passkey)
+                                             for profile_id, user_id in chunk])
+
+    root = User.objects.create_superuser(prefix + "root", "root@example.com", PASSWORD)
+    admin = User.objects.create_user(prefix + "admin", "admin@example.com", PASSWORD)
+    user = User.objects.create_user(prefix + "user", "user@example.com", PASSWORD)
+    admin.profile.is_admin = True
+    admin.profile.save()
+    ApiKey.objects.create(user=admin)
+
+    public = Profile.objects.create(name=prefix + "public", text="bench public profile")
+    private = Profile.objects.create(name=prefix + "private", text="bench private profile")
+    mailed = Profile.objects.create(name=prefix + "mailed", text="bench profile with mailed passkeys")
+    for profile, owner in ((private, user), (private, admin), (mailed, admin)):
+        ProfilePasskeys.objects.create(profile=profile, user=owner, passkey=PASSWORD)
+    managed = [private.pk] + rnd.sample(profile_ids, min(len(profile_ids), 10))
+    admin.profile.profiles.add(*managed)
+
+    return {
+        'root': root, 'admin': admin, 'user': user, 'other': User.objects.get(pk=rnd.choice(user_ids)),
+        'public': public, 'private': private, 'mailed': mailed, 'managed': managed,
+        'prefix': prefix,
+    }
+
+
+def clients(fixtures):
+    """
+    :return: dict of test clients by role, user has provided passkey of private profile
+    """
+    result = {'guest': Client()}
+    for role in ('root', 'admin', 'user'):
+        result[role] = Client()
+        result[role].login(username=fixtures[role].username, password=PASSWORD)
+    result['user'].post(reverse("profiles.views.profile.provide_passkey", args=[fixtures['private'].pk]),
+                        {'passkey': PASSWORD})
+    admin = fixtures['admin']
+    result['apikey'] = Client(HTTP_AUTHORIZATION="ApiKey %s:%s" % (admin.username, admin.api_key.key))
+    return result
+
+
+def api_url(resource_name, **kwargs):
+    kwargs.update(api_name='v1', resource_name=resource_name)
+    return reverse("api_dispatch_detail" if 'pk' in kwargs else "api_dispatch_list", kwargs=kwargs)
+
+
+def endpoints(fixtures):
+    """
+    every url of `profiles.urls` requested as it is in usual work,
+    remove endpoint deletes a profile created for it, so the list is built for every run
+    :return: list of `Endpoint`
+    """
+    public, private, mailed = fixtures['public'], fixtures['private'], fixtures['mailed']
+    removed = Profile.objects.create(name=fixtures['prefix'] + "removed")
+
+    def url(view, *args):
+        return reverse("profiles.views." + view, args=args)
+
+    return [
+        Endpoint("index guest", 'guest', 'get', url("profile.index"), {}),
+        Endpoint("index user", 'user', 'get', url("profile.index"), {}),
+        Endpoint("index more", 'user', 'get', url("profile.index_more"), {'after': private.pk}),
+        Endpoint("search", 'user', 'get', url("profile.search"), {'q': "bench profile"}),
+        Endpoint("export", 'user', 'get', url("profile.export"), {}),
+        Endpoint("show public", 'guest', 'get', url("profile.show", public.pk), {}),
+        Endpoint("show private", 'user', 'get', url("profile.show", private.pk), {}),
+        Endpoint("show by slug", 'guest', 'get', url("profile.show_by_slug", public.slug), {}),
+        Endpoint("show managed by slug", 'admin', 'get', url("profile.show_by_slug", private.slug), {}),
+        Endpoint("enter passkey page", 'user', 'get', url("profile.provide_passkey", private.pk), {}),
+        Endpoint("enter passkey", 'user', 'post', url("profile.provide_passkey", private.pk), {'passkey': PASSWORD}),
+        Endpoint("update page", 'admin', 'get', url("profile.update", private.pk), {}),
+        Endpoint("update", 'admin', 'post', url("profile.update", private.pk),
+                 {'name': private.name, 'text': private.text}),
+        Endpoint("add page", 'root', 'get', url("profile.add"), {}),
+        Endpoint("remove", 'root', 'get', url("profile.remove", removed.pk), {}),
+        Endpoint("manager", 'admin', 'get', url("manager.manager"), {}),
+        Endpoint("manager bootstrap", 'admin', 'get', url("manager.bootstrap"), {}),
+        Endpoint("manager changes", 'admin', 'get', url("manager.changes"), {'since': 0}),
+        Endpoint("update profile passkeys", 'admin', 'post', url("manager.update_profile_passkeys"), {
+            'profile_passkeys': json.dumps([{'profile': private.pk, 'user': fixtures['other'].pk,
+                                             'passkey': PASSWORD}])}),
+        Endpoint("update allowed profiles", 'root', 'post', url("manager.update_allowed_profiles"), {
+            'admins': json.dumps([{'user': fixtures['admin'].pk, 'profiles': fixtures['managed']}])}),
+        Endpoint("send passkey email", 'root', 'post', url("manager.send_passkey_to_email"), {
+            'user_id': fixtures['user'].pk, 'profile_id': private.pk, 'passkey': PASSWORD}),
+        Endpoint("send profile passkey emails", 'root', 'post', url("manager.send_profile_passkeys_to_email"),
+                 {'profile_id': mailed.pk}),
+        Endpoint("api profiles", 'admin', 'get', api_url("profile"), {'format': 'json'}),
+        Endpoint("api profiles by key", 'apikey', 'get', api_url("profile"), {'format': 'json'}),
+        Endpoint("api profile", 'admin', 'get', api_url("profile", pk=private.pk), {'format': 'json'}),
+        Endpoint("api users", 'admin', 'get', api_url("user"), {'format': 'json'}),
+        Endpoint("api user profiles", 'admin', 'get', api_url("userprofile"), {'format': 'json'}),
+        Endpoint("api profile passkeys", 'admin', 'get', api_url("profilepasskeys"), {'format': 'json'}),
+    ]
+
+
+def reset_peak_memory():
+    """
+    linux resets peak resident size of process on writing 5 to clear_refs,
+    elsewhere peak of the whole run is reported
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except IOError:
+        pass
+
+
+def peak_memory():
+    """
+    :return: peak resident size of process in kilobytes
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except IOError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(client, endpoint):
+    """
+    makes request with empty cache, streamed responses are read to the end,
+    only local memory cache is cleared, see `CACHES`
+    :return: dict of status, queries, ms and peak_kb
+    """
+    if not isinstance(caches['default'], LocMemCache):
+        raise ImproperlyConfigured("benchmark clears cache before requests, it should run with benchmark.CACHES")
+    cache.clear()
+    reset_peak_memory()
+    with CaptureQueriesContext(connection) as queries:
+        started = time.time()
+        response = getattr(client, endpoint.method)(endpoint.url, endpoint.data)
+        if response.streaming:
+            "".join(response.streaming_content)
+        seconds = time.time() - started
+    return {
+        'status': response.status_code,
+        'queries': len(queries),
+        'ms': round(seconds * 1000, 3),
+        'peak_kb': peak_memory(),
+    }
+
+
+def run(fixtures, repeat=1):
+    """
+    :return: dict of measures by endpoint name: the biggest number of queries and peak memory, the median time
+    """
+    by_role = clients(fixtures)
+    runs = {}
+    for i in xrange(repeat):
+        for endpoint in endpoints(fixtures):
+            runs.setdefault(endpoint.name, []).append(measure(by_role[endpoint.role], endpoint))
+
+    results = {}
+    for name, measures in runs.items():
+        times = sorted(m['ms'] for m in measures)
+        results[name] = {
+            'status': measures[-1]['status'],
+            'queries': max(m['queries'] for m in measures),
+            'ms': times[len(times) // 2],
+            'peak_kb': max(m['peak_kb'] for m in measures),
+        }
+    return results
+
+
+def load_baselines(path=BASELINES_PATH):
+    """
+    :return: dict with dataset arguments of `seed` and measures of endpoints
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baselines(dataset, results, path=BASELINES_PATH):
+    with open(path, "w") as f:
+        json.dump({'dataset': dataset, 'endpoints': results}, f, indent=2, sort_keys=True, separators=(',', ': '))
+        f.write("\n")
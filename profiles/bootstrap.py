@@ -0,0 +1,54 @@
+"""
+data of manager page loaded with single request, see `profiles.views.manager.bootstrap`
+"""
+from collections import defaultdict
+
+from profiles.models import Profile, ProfilePasskeys
+from profiles.models.user_profile import UserProfile
+
+
+def columns(rows, names):
+    """
+    turns the list of tuples into {name: [values]}, so names are sent once instead of in every row
+    """
+    return dict((name, [row[i] for row in rows]) for i, name in enumerate(names))
+
+
+def manager_bootstrap(user):
+    """
+    collects profiles, users with their allowed profiles and passkeys pairs, all values are ids or plain strings
+    profiles are limited to those managed by user, the same way as in `profiles.api.ProfileResource`
+
+    :param user: admin
+    :return: {version, profiles: {id, name}, users: {id, username, email, is_admin, profiles},
+      passkeys: {profile, user}}, version is the last change of the matrix, see `profiles.changes.changes_since`
+    """
+    # changes are sent in columns built here
+    from profiles.changes import current_version
+
+    # read before the data, so changes made in the meantime are sent again by changes_since rather than lost
+    version = current_version()
+
+    profiles = Profile.list_managed_by(user)
+    passkeys = ProfilePasskeys.objects.all()
+    allowed = UserProfile.profiles.through.objects.all()
+    if not user.is_superuser:
+        managed = profiles.values("id")
+        passkeys = passkeys.filter(profile_id__in=managed)
+        allowed = allowed.filter(profile_id__in=managed)
+
+    allowed_profiles = defaultdict(list)
+    for userprofile_id, profile_id in allowed.order_by("profile_id").values_list("userprofile_id", "profile_id"):
+        allowed_profiles[userprofile_id].append(profile_id)
+
+    users = UserProfile.objects.filter(user__is_superuser=False, user__is_active=True).exclude(user=user) \
+        .order_by("user_id").values_list("id", "user_id", "user__username", "user__email", "is_admin")
+
+    return {
+        'version': version,
+        'profiles': columns(profiles.order_by("id").values_list("id", "name"), ("id", "name")),
+        'users': columns([row[1:] + (allowed_profiles[row[0]], ) for row in users],
+                         ("id", "username", "email", "is_admin", "profiles")),
+        'passkeys': columns(passkeys.order_by("profile_id", "user_id").values_list("profile_id", "user_id"),
+                            ("profile", "user")),
+    }
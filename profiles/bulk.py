@@ -0,0 +1,381 @@
+"""
+batched write operations used by manager views
+"""
+import datetime
+import uuid
+from collections import defaultdict
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import Q
+from django.utils.text import slugify
+
+from profiles.cache import invalidate_access_cache, purge_page_cache
+from profiles.changes import collect_changes, record
+from profiles.models import Profile, ProfilePasskeys, MatrixChange, SLUG_LENGTH, unique_slugs, \
+    save_with_free_slugs
+from profiles.models.user_profile import UserProfile
+from profiles.passkeys import hash_passkey, is_hashed
+
+# statuses of processed rows
+CREATED = 'created'
+UPDATED = 'updated'
+DELETED = 'deleted'
+SKIPPED = 'skipped'
+FORBIDDEN = 'forbidden'
+INVALID = 'invalid'
+
+# max number of (profile, user) pairs in one statement, keeps sqlite under its variables limit
+BATCH_SIZE = 300
+
+
+def chunks(items, size=BATCH_SIZE):
+    items = list(items)
+    for i in xrange(0, len(items), size):
+        yield items[i:i + size]
+
+
+def pairs_q(pairs, first='profile_id', second='user_id'):
+    """
+    builds filter matching the list of (first, second) pairs,
+    pairs are grouped by the first value to keep the condition short
+    """
+    grouped = defaultdict(list)
+    for first_id, second_id in pairs:
+        grouped[first_id].append(second_id)
+
+    q = Q()
+    for first_id, second_ids in grouped.items():
+        q |= Q(**{first: first_id, second + '__in': second_ids})
+    return q
+
+
+def case_update(model, field_name, values, extra=""):
+    """
+    sets field of existing rows to their own values with one UPDATE per chunk
+    :param values: list of (pk, value) tuples
+    :param extra: additional assignment appended to SET clause
+    """
+    qn = connection.ops.quote_name
+    table = qn(model._meta.db_table)
+    pk = qn(model._meta.pk.column)
+    column = qn(model._meta.get_field(field_name).column)
+
+    cursor = connection.cursor()
+    for chunk in chunks(values):
+        sql = "UPDATE %s SET %s = CASE %s %s END%s WHERE %s IN (%s)" % (
+            table, column, pk,
+            " ".join(["WHEN %s THEN %s"] * len(chunk)),
+            ", " + extra if extra else "",
+            pk, ", ".join(["%s"] * len(chunk)),
+        )
+        params = [value for row in chunk for value in row] + [row[0] for row in chunk]
+        cursor.execute(sql, params)
+
+
+def update_passkeys(passkeys):
+    """
+    sets passkeys of existing rows and bumps their versions with one UPDATE per chunk
+    :param passkeys: list of (pk, hashed passkey) tuples
+    """
+    version = connection.ops.quote_name(ProfilePasskeys._meta.get_field('passkey_version').column)
+    case_update(ProfilePasskeys, 'passkey', passkeys, "%s = %s + 1" % (version, version))
+
+
+def parse_profile_passkey(profile_passkey):
+    """
+    :return: (profile_id, user_id) or None if triple is malformed
+    """
+    try:
+        return int(profile_passkey['profile']), int(profile_passkey['user'])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def apply_profile_passkeys(user, profiles_passkeys, hashed=False):
+    """
+    applies the list of triples posted to `profiles.views.manager.update_profile_passkeys`
+    with a fixed number of bulk statements, when the same pair is posted several times the last one wins
+
+    :param user: user who makes changes, None for management commands
+    :param profiles_passkeys: list of {profile: 'profile_id', user: 'user_id', passkey: 'some_passkey', allowed: bool}
+    :param hashed: passkeys which are already hashed are stored as is, set by import of exported passkeys only,
+     posted values are always hashed
+    :return: list of {profile, user, status} for each posted triple
+    """
+    results = []
+    operations = {}  # (profile_id, user_id) -> (index of result, passkey or None to delete)
+
+    allowed_profiles = None
+    if user is not None and not user.is_superuser:
+        allowed_profiles = set(user.profile.profiles.values_list("id", flat=True))
+
+    for profile_passkey in profiles_passkeys:
+        key = parse_profile_passkey(profile_passkey)
+        if key is None:
+            results.append({'profile': None, 'user': None, 'status': INVALID})
+            continue
+
+        result = {'profile': key[0], 'user': key[1], 'status': SKIPPED}
+        results.append(result)
+
+        # check for user can update profiles passkeys
+        if allowed_profiles is not None and key[0] not in allowed_profiles:
+            result['status'] = FORBIDDEN
+            continue
+
+        if profile_passkey.get('allowed', True) == False:
+            passkey = None
+        else:
+            passkey = profile_passkey.get('passkey', '')
+            if passkey == '':
+                continue
+            if not (hashed and is_hashed(passkey)):
+                passkey = hash_passkey(passkey)
+
+        if key in operations:
+            results[operations[key][0]]['status'] = SKIPPED
+        operations[key] = (len(results) - 1, passkey)
+
+    if not operations:
+        return results
+
+    # drop pairs pointing to missing profiles or users
+    profile_ids = set(Profile.objects.filter(pk__in=set(key[0] for key in operations)).values_list("id", flat=True))
+    user_ids = set(User.objects.filter(pk__in=set(key[1] for key in operations)).values_list("id", flat=True))
+    for key in operations.keys():
+        if key[0] not in profile_ids or key[1] not in user_ids:
+            results[operations.pop(key)[0]]['status'] = INVALID
+
+    to_delete = [key for key, (index, passkey) in operations.items() if passkey is None]
+    to_upsert = dict((key, passkey) for key, (index, passkey) in operations.items() if passkey is not None)
+
+    existing = {}
+    for chunk in chunks(to_upsert):
+        for pk, profile_id, user_id, passkey in ProfilePasskeys.objects.filter(pairs_q(chunk)) \
+                .values_list("id", "profile_id", "user_id", "passkey"):
+            existing[(profile_id, user_id)] = (pk, passkey)
+
+    to_create = []
+    to_update = []
+    changed = []
+    for key, passkey in to_upsert.items():
+        if key in existing:
+            pk, current = existing[key]
+            if current != passkey:
+                to_update.append((pk, passkey))
+                changed.append(key)
+            results[operations[key][0]]['status'] = UPDATED
+        else:
+            to_create.append(ProfilePasskeys(profile_id=key[0], user_id=key[1], passkey=passkey))
+            changed.append(key)
+            results[operations[key][0]]['status'] = CREATED
+
+    # deleted rows are logged by signals, all changes are saved with one insert
+    with collect_changes():
+        for chunk in chunks(to_delete):
+            ProfilePasskeys.objects.filter(pairs_q(chunk)).delete()
+        for key in to_delete:
+            results[operations[key][0]]['status'] = DELETED
+
+        ProfilePasskeys.objects.bulk_create(to_create, batch_size=BATCH_SIZE)
+        update_passkeys(to_update)
+
+        # bulk statements dont send signals
+        record(MatrixChange.PASSKEY, MatrixChange.SET, changed)
+    invalidate_access_cache()
+    purge_page_cache(*set(passkey.profile_id for passkey in to_create))
+    return results
+
+
+def parse_allowed_profiles(admin):
+    """
+    :return: (user_id, set of profile ids) or None if entry is malformed
+    """
+    try:
+        return int(admin['user']), set(int(profile_id) for profile_id in admin['profiles'])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def apply_allowed_profiles(admins):
+    """
+    rewrites the lists of profiles managed by admins posted to `profiles.views.manager.update_allowed_profiles`
+    with a fixed number of queries, entries with empty or unknown profiles are rejected like AllowedProfilesForm does
+
+    :param admins: list of {user: 'user_id', profiles: ['profile_id', ...]}
+    :return: list of {user, status} for each posted entry
+    """
+    results = []
+    entries = {}  # user_id -> (index of result, profile ids)
+
+    for admin in admins:
+        entry = parse_allowed_profiles(admin)
+        if entry is None or not entry[1]:
+            results.append({'user': entry and entry[0], 'status': INVALID})
+            continue
+
+        results.append({'user': entry[0], 'status': SKIPPED})
+        if entry[0] in entries:
+            results[entries[entry[0]][0]]['status'] = SKIPPED
+        entries[entry[0]] = (len(results) - 1, entry[1])
+
+    if not entries:
+        return results
+
+    users = User.objects.filter(pk__in=entries.keys()).select_related('userprofile')
+    userprofiles = {}
+    missing = []
+    for user in users:
+        try:
+            userprofiles[user.pk] = user.userprofile.pk
+        except UserProfile.DoesNotExist:
+            missing.append(user.pk)
+
+    if missing:
+        # users created before profiles were created eagerly
+        UserProfile.objects.bulk_create([UserProfile(user_id=user_id) for user_id in missing])
+        userprofiles.update(UserProfile.objects.filter(user_id__in=missing).values_list("user_id", "id"))
+
+    all_profiles = set()
+    for index, profile_ids in entries.values():
+        all_profiles |= profile_ids
+    valid_profiles = set(Profile.objects.filter(pk__in=all_profiles).values_list("id", flat=True))
+
+    for user_id in entries.keys():
+        if user_id not in userprofiles or not entries[user_id][1] <= valid_profiles:
+            results[entries.pop(user_id)[0]]['status'] = INVALID
+
+    if not entries:
+        return results
+
+    Through = UserProfile.profiles.through
+    existing = defaultdict(set)
+    for userprofile_id, profile_id in Through.objects.filter(
+            userprofile_id__in=[userprofiles[user_id] for user_id in entries]) \
+            .values_list("userprofile_id", "profile_id"):
+        existing[userprofile_id].add(profile_id)
+
+    to_create = []
+    to_delete = []
+    for user_id, (index, profile_ids) in entries.items():
+        userprofile_id = userprofiles[user_id]
+        added = profile_ids - existing[userprofile_id]
+        removed = existing[userprofile_id] - profile_ids
+        to_create.extend(Through(userprofile_id=userprofile_id, profile_id=profile_id) for profile_id in added)
+        to_delete.extend((userprofile_id, profile_id) for profile_id in removed)
+        if added or removed:
+            results[index]['status'] = UPDATED
+
+    for chunk in chunks(to_delete):
+        Through.objects.filter(pairs_q(chunk, 'userprofile_id', 'profile_id')).delete()
+    Through.objects.bulk_create(to_create, batch_size=BATCH_SIZE)
+
+    # through table changes dont send m2m_changed
+    users = dict((userprofile_id, user_id) for user_id, userprofile_id in userprofiles.items())
+    with collect_changes():
+        record(MatrixChange.ALLOWED, MatrixChange.DELETE,
+               [(profile_id, users[userprofile_id]) for userprofile_id, profile_id in to_delete])
+        record(MatrixChange.ALLOWED, MatrixChange.SET,
+               [(row.profile_id, users[row.userprofile_id]) for row in to_create])
+    invalidate_access_cache()
+    return results
+
+
+def parse_profile(record):
+    """
+    :return: (name, wanted slug, text) or None if record is malformed
+    """
+    try:
+        name = record['name']
+        slug = record.get('slug') or name
+        text = record.get('text') or ''
+    except (KeyError, TypeError, AttributeError):
+        return None
+    if not isinstance(name, basestring) or not name or len(name) > Profile._meta.get_field('name').max_length:
+        return None
+    return name, slugify(unicode(slug))[:SLUG_LENGTH], text
+
+
+def create_profiles(records):
+    """
+    inserts new profiles with one bulk statement per chunk, slugs and timestamps are allocated here
+    for the whole list in the same way `ProfileBase.save` does for single profile
+
+    :param records: list of {name, slug, text}, slug is optional and is made from name by default
+    :return: list of {slug, status} for each record
+    """
+    results = []
+    profiles = []
+    now = datetime.datetime.today()
+    for record in records:
+        profile = parse_profile(record)
+        if profile is None:
+            results.append({'slug': None, 'status': INVALID})
+            continue
+        results.append({'slug': profile[1], 'status': CREATED})
+        profiles.append((len(results) - 1, Profile(name=profile[0], slug=profile[1], text=profile[2],
+                                                   created=now, modified=now)))
+
+    named = [profile for index, profile in profiles if profile.slug]
+    wanted = [profile.slug for profile in named]
+
+    def allocate_named(rejected):
+        for profile, slug in zip(named, unique_slugs(Profile, wanted)):
+            profile.slug = slug
+        # it is not known which of slugs was taken, rows taking them are found by the next check
+        return []
+
+    # profiles without slug get their ids as slugs, until ids are known temporary slugs keep index unique
+    unnamed = [profile for index, profile in profiles if not profile.slug]
+    for profile in unnamed:
+        profile.slug = uuid.uuid4().hex
+
+    save_with_free_slugs(allocate_named, lambda: Profile.objects.bulk_create(
+        [profile for index, profile in profiles], batch_size=BATCH_SIZE))
+
+    if unnamed:
+        ids = dict(Profile.objects.filter(slug__in=[profile.slug for profile in unnamed]).values_list("slug", "id"))
+        ids = [ids[profile.slug] for profile in unnamed]
+
+        def allocate_unnamed(rejected):
+            for profile, slug in zip(unnamed, unique_slugs(Profile, [unicode(id) for id in ids])):
+                profile.slug = slug
+            return []
+
+        save_with_free_slugs(allocate_unnamed, lambda: case_update(
+            Profile, 'slug', [(id, profile.slug) for id, profile in zip(ids, unnamed)]))
+
+    for index, profile in profiles:
+        results[index]['slug'] = profile.slug
+
+    # bulk statements dont send signals, new public profiles change access of everybody
+    invalidate_access_cache()
+    return results
+
+
+def import_profile_passkeys(records):
+    """
+    applies passkeys referring to profiles by slug and users by username, see `apply_profile_passkeys`
+    :param records: list of {profile: 'slug', user: 'username', passkey: 'passkey or its hash'}
+    :return: list of {profile, user, status} for each record
+    """
+    slugs = set()
+    usernames = set()
+    for record in records:
+        if isinstance(record, dict):
+            slugs.add(record.get('profile'))
+            usernames.add(record.get('user'))
+
+    profile_ids = dict(Profile.objects.filter(slug__in=slugs - set([None])).values_list("slug", "id"))
+    user_ids = dict(User.objects.filter(username__in=usernames - set([None])).values_list("username", "id"))
+
+    profiles_passkeys = []
+    for record in records:
+        if not isinstance(record, dict) or record.get('profile') not in profile_ids \
+                or record.get('user') not in user_ids:
+            profiles_passkeys.append(None)
+            continue
+        profiles_passkeys.append({'profile': profile_ids[record['profile']], 'user': user_ids[record['user']],
+                                  'passkey': record.get('passkey') or ''})
+    return apply_profile_passkeys(None, profiles_passkeys, hashed=True)
@@ -0,0 +1,189 @@
+"""
+cache helpers for profiles application
+"""
+import calendar
+import hashlib
+import uuid
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.transaction import atomic
+
+ACCESS_VERSION_KEY = "profiles:access:version"
+ACCESS_KEY = "profiles:access:user:%s"
+MANAGED_KEY = "profiles:access:managed:%s"
+PASSKEYS_KEY = "profiles:access:passkeys:%s"
+ACCESS_TIMEOUT = getattr(settings, "PROFILES_ACCESS_CACHE_TIMEOUT", 60 * 60 * 24)
+
+# biggest id set which is stored in cache, larger sets fall back to plain subqueries
+ACCESS_MAX_IDS = getattr(settings, "PROFILES_ACCESS_CACHE_MAX_IDS", 900)
+
+
+def invalidate_access_cache():
+    """
+    bumps access version, so every materialized access set becomes stale
+    """
+    try:
+        cache.incr(ACCESS_VERSION_KEY)
+    except ValueError:
+        cache.set(ACCESS_VERSION_KEY, 1, None)
+
+
+def access_transaction(fn):
+    """
+    runs fn in transaction and bumps access version once more after it is committed:
+    version bumped by changes inside transaction is not enough, concurrent requests may still read data
+    of before the commit and store sets loaded from it under the new version
+    """
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            with atomic():
+                return fn(*args, **kwargs)
+        finally:
+            invalidate_access_cache()
+    return wrapper
+
+
+def get_access_version():
+    version = cache.get(ACCESS_VERSION_KEY)
+    if version is None:
+        cache.add(ACCESS_VERSION_KEY, 1, None)
+        version = cache.get(ACCESS_VERSION_KEY, 1)
+    return version
+
+
+def cached_access(user, loader, key=ACCESS_KEY):
+    """
+    returns access set of user stored in cache, calls loader on miss or when access version was changed
+    version and access set are fetched with single cache lookup
+    :param user:
+    :param loader: callable returning value to store
+    :param key: key template of the set, see `profiles.access.AccessMatrix`
+    :return:
+    """
+    key = key % (user.pk or 'guest')
+    values = cache.get_many([ACCESS_VERSION_KEY, key])
+    version = values.get(ACCESS_VERSION_KEY)
+    if version is None:
+        version = get_access_version()
+
+    cached = values.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    value = loader()
+    cache.set(key, (version, value), ACCESS_TIMEOUT)
+    return value
+
+
+# longer values of urls are hashed in keys, memcached refuses keys longer than 250 chars
+KEY_PART_LENGTH = 64
+
+
+def key_part(value):
+    """
+    :return: value from url usable in cache key, long or not ascii values are replaced by their hash
+    """
+    value = unicode(value)
+    try:
+        value.encode('ascii')
+    except UnicodeEncodeError:
+        pass
+    else:
+        if len(value) <= KEY_PART_LENGTH:
+            return value
+    return "sha1-" + hashlib.sha1(value.encode('utf-8')).hexdigest()
+
+
+PAGE_KEY = "profiles:page:%s:%s"
+PAGE_GENERATION_KEY = "profiles:page:generation:%s"
+PAGE_TIMEOUT = getattr(settings, "PROFILES_PAGE_CACHE_TIMEOUT", 60 * 60 * 24)
+
+
+def page_generation(profile_id):
+    """
+    :return: random token which is changed each time pages of profile are purged
+    """
+    key = PAGE_GENERATION_KEY % profile_id
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, uuid.uuid4().hex, None)
+        generation = cache.get(key)
+    return generation
+
+
+def purge_page_cache(*profile_ids):
+    """
+    makes all cached pages of profiles stale
+    """
+    cache.set_many(dict((PAGE_GENERATION_KEY % profile_id, uuid.uuid4().hex) for profile_id in profile_ids), None)
+
+
+def get_cached_page(kind, value):
+    """
+    :param kind: 'id' or 'slug'
+    :return: (page or None, id of profile which was cached under that key last time or None)
+    """
+    page = cache.get(PAGE_KEY % (kind, key_part(value)))
+    if page is None:
+        return None, None
+    if page['generation'] is not None and cache.get(PAGE_GENERATION_KEY % page['profile']) == page['generation']:
+        return page, page['profile']
+    return None, page['profile']
+
+
+def set_cached_page(kind, value, profile, generation, response):
+    """
+    stores rendered page of profile
+    :param generation: page generation read before profile was fetched,
+     page rendered in the meantime of purge is never served
+    :return: stored page
+    """
+    page = {
+        'profile': profile.pk,
+        'generation': generation,
+        'etag': hashlib.md5("%s:%s" % (profile.pk, profile.modified.isoformat())).hexdigest(),
+        'last_modified': calendar.timegm(profile.modified.utctimetuple()),
+        'content': response.content,
+        'content_type': response['Content-Type'],
+    }
+    cache.set(PAGE_KEY % (kind, key_part(value)), page, PAGE_TIMEOUT)
+    return page
+
+
+SLUG_REDIRECT_KEY = "profiles:slug-redirect:%s"
+SLUG_REDIRECT_TIMEOUT = getattr(settings, "PROFILES_SLUG_REDIRECT_CACHE_TIMEOUT", 60 * 60 * 24)
+
+
+def get_slug_redirect(slug):
+    return cache.get(SLUG_REDIRECT_KEY % key_part(slug))
+
+
+def set_slug_redirect(slug, current_slug):
+    cache.set(SLUG_REDIRECT_KEY % key_part(slug), current_slug, SLUG_REDIRECT_TIMEOUT)
+
+
+def forget_slug_redirects(*slugs):
+    cache.delete_many([SLUG_REDIRECT_KEY % key_part(slug) for slug in slugs])
+
+
+ADMIN_KEY = "profiles:admin:user:%s"
+ADMIN_TIMEOUT = getattr(settings, "PROFILES_ADMIN_CACHE_TIMEOUT", 60)
+
+
+def cached_is_admin(user):
+    """
+    admin decision for user, stored for ADMIN_TIMEOUT seconds and forgotten when user or its profile is changed
+    """
+    key = ADMIN_KEY % user.pk
+    decision = cache.get(key)
+    if decision is None:
+        decision = user.is_admin
+        cache.set(key, decision, ADMIN_TIMEOUT)
+    return decision
+
+
+def forget_is_admin(*user_ids):
+    cache.delete_many([ADMIN_KEY % user_id for user_id in user_ids])
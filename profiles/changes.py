@@ -0,0 +1,128 @@
+"""
+change log of passkeys and allowed profiles, lets manager clients sync the matrix incrementally
+"""
+import datetime
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from profiles.bootstrap import columns
+from profiles.models import MatrixChange, Profile
+
+# max number of log rows returned by one `changes_since` call
+PAGE_SIZE = getattr(settings, "PROFILES_CHANGES_PAGE_SIZE", 5000)
+
+# ids are given on insert, so a transaction may commit rows with ids below the version already sent to clients,
+# rows logged within this number of seconds before the request are sent again and clients skip ones they applied
+WINDOW = getattr(settings, "PROFILES_CHANGES_WINDOW", 300)
+
+_collected = threading.local()
+
+
+@contextmanager
+def collect_changes():
+    """
+    changes recorded inside the block are saved with single insert at its end,
+    used around bulk operations which would otherwise log rows one by one from signals
+    """
+    if getattr(_collected, 'changes', None) is not None:
+        # nested block, outer one saves everything
+        yield
+        return
+
+    _collected.changes = []
+    try:
+        yield
+    except Exception:
+        _collected.changes = None
+        raise
+    changes, _collected.changes = _collected.changes, None
+    MatrixChange.objects.bulk_create(changes)
+
+
+def record(kind, action, pairs):
+    """
+    logs changes of the matrix
+    :param kind: MatrixChange.PASSKEY or MatrixChange.ALLOWED
+    :param action: MatrixChange.SET or MatrixChange.DELETE
+    :param pairs: list of (profile_id, user_id)
+    """
+    changes = [MatrixChange(kind=kind, action=action, profile_id=profile_id, user_id=user_id)
+               for profile_id, user_id in pairs]
+    if getattr(_collected, 'changes', None) is not None:
+        _collected.changes.extend(changes)
+    elif changes:
+        MatrixChange.objects.bulk_create(changes)
+
+
+def current_version():
+    return MatrixChange.objects.order_by('-id').values_list('id', flat=True).first() or 0
+
+
+def changes_since(user, since, limit=PAGE_SIZE, window=WINDOW):
+    """
+    returns changes made after since version, several changes of the same pair are squashed to the last one,
+    changes of profiles not managed by user are left out
+    recent changes up to since version are returned again, see `WINDOW`
+
+    :param user: admin
+    :param since: version returned by previous call or by `profiles.bootstrap.manager_bootstrap`
+    :param window: seconds to look back before since version
+    :return: {version, more, reset, changes: {id, kind, action, profile, user}}
+      version - version to ask for next time
+      more - there are more changes after version
+      reset - log was pruned after since version, client should load the whole matrix again
+      id - id of the last squashed log row, the same change may be returned by several calls
+    """
+    fields = ('id', 'kind', 'action', 'profile', 'user')
+    oldest = MatrixChange.objects.order_by('id').values_list('id', flat=True).first()
+    if oldest is not None and since < oldest - 1:
+        return {'version': since, 'more': False, 'reset': True, 'changes': columns([], fields)}
+
+    condition = Q(id__gt=since)
+    if window:
+        # at most limit rows are looked back, so new rows always fit into the page
+        condition |= Q(id__gt=since - limit, created__gte=timezone.now() - datetime.timedelta(seconds=window))
+    rows = list(MatrixChange.objects.filter(condition).order_by('id')
+                .values_list('id', 'kind', 'action', 'profile_id', 'user_id')[:2 * limit + 1])
+    recent = [row for row in rows if row[0] <= since]
+    rows = [row for row in rows if row[0] > since]
+    more = len(rows) > limit
+    rows = rows[:limit]
+
+    managed = None
+    if not user.is_superuser:
+        managed = set(Profile.list_managed_by(user).values_list('id', flat=True))
+
+    last = OrderedDict()
+    for pk, kind, action, profile_id, user_id in recent + rows:
+        if managed is not None and profile_id not in managed:
+            continue
+        key = (kind, profile_id, user_id)
+        last.pop(key, None)
+        last[key] = (pk, action)
+
+    changes = [(pk, kind, action, profile_id, user_id)
+               for (kind, profile_id, user_id), (pk, action) in last.items()]
+    return {
+        'version': rows[-1][0] if rows else since,
+        'more': more,
+        'reset': False,
+        'changes': columns(changes, fields),
+    }
+
+
+def prune_changes(days):
+    """
+    deletes log rows older than days, the last row is always kept so versions keep growing
+    :return: number of deleted rows
+    """
+    last = current_version()
+    old = MatrixChange.objects.filter(created__lt=timezone.now() - datetime.timedelta(days=days), id__lt=last)
+    count = old.count()
+    old.delete()
+    return count
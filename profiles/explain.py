@@ -0,0 +1,61 @@
+"""
+helpers to inspect query plans of hot queries, used by index tests and `bench_passkey_lookups` command
+"""
+import re
+
+from django.db import connection
+
+from profiles.models import Profile, ProfilePasskeys
+from profiles.paginators import KeysetPaginator
+from profiles.passkeys import hash_passkey
+from profiles.search import search
+
+# vendors which query plans are read by `explain` and `full_scans`
+PLAN_VENDORS = ('sqlite', 'postgresql')
+
+
+def hot_queries(user, profile):
+    """
+    queries issued on each access check
+    :return: list of (name, queryset)
+    """
+    return [
+        ("passkeys of user", ProfilePasskeys.objects.filter(user_id=user.pk).values("profile_id").distinct()),
+        ("passkeys of profile", ProfilePasskeys.objects.filter(profile_id=profile.pk)),
+        ("passkey check", ProfilePasskeys.objects.filter(passkey=hash_passkey("passkey"), user=user, profile=profile)),
+        ("profile with access flags", Profile.with_access_flags(user).filter(pk=profile.pk)),
+        ("profile by slug", Profile.objects.filter(slug=profile.slug)),
+        ("managed profile", user.profile.profiles.filter(pk=profile.pk)),
+        ("api page after cursor", KeysetPaginator({'cursor': KeysetPaginator.make_cursor(profile)},
+                                                  Profile.objects.all()).get_ordered()[:20]),
+        ("search", search(user, profile.name)[:20]),
+    ]
+
+
+def explain(queryset):
+    """
+    :return: query plan of queryset as text, None if plans of database vendor are not supported
+    """
+    if connection.vendor not in PLAN_VENDORS:
+        return None
+    sql, params = queryset.query.sql_with_params()
+    cursor = connection.cursor()
+    if connection.vendor == 'sqlite':
+        cursor.execute("EXPLAIN QUERY PLAN " + sql, params)
+        return "\n".join(row[-1] for row in cursor.fetchall())
+    # small tables are always scanned sequentially by postgresql otherwise
+    cursor.execute("SET LOCAL enable_seqscan = off")
+    cursor.execute("EXPLAIN " + sql, params)
+    return "\n".join(row[0] for row in cursor.fetchall())
+
+
+def full_scans(plan):
+    """
+    :return: list of tables read without index according to plan, empty for unsupported plan
+    """
+    if plan is None:
+        return []
+    if connection.vendor == 'sqlite':
+        # "SCAN table" without index, or "SCAN table AS alias"
+        return [match.group(1) for match in re.finditer(r'SCAN (?:TABLE )?(\w+)(?: AS \w+)?\s*$', plan, re.M)]
+    return re.findall(r'Seq Scan on (\w+)', plan)
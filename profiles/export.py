@@ -0,0 +1,48 @@
+"""
+json export of profiles which user can see, served by `profiles.views.profile.export`
+"""
+import json
+
+from django.conf import settings
+
+from app.utils import json_encoder
+from profiles.access import AccessMatrix
+from profiles.models import Profile
+from profiles.transfer import iterate_rows, read_chunks
+
+EXPORT_FIELDS = ('id', 'name', 'slug', 'text', 'created', 'modified')
+ACCESS_FLAGS = ('has_any_passkey', 'user_passkey', 'user_passkey_version')
+
+# rows read with one query and sent as one piece of response, bigger pieces are compressed better
+EXPORT_CHUNK_SIZE = getattr(settings, "PROFILES_EXPORT_CHUNK_SIZE", 500)
+
+
+def export_chunks(request, passkey_verified, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    yields json array of profiles piece by piece, rows are read by keyset chunks, so memory use is constant,
+    passkey protected profiles are exported only if they can be shown, see `profiles.views.profile.show_profile`
+    :param passkey_verified: `profiles.views.profile.passkey_verified`, session is only read by it,
+      rows are yielded after SessionMiddleware has saved the session
+    """
+    user = request.user
+    access = AccessMatrix(user)
+    profiles = Profile.with_access_flags(user) & access.accessible()
+
+    def visible(row):
+        has_any_passkey, user_passkey, user_passkey_version = row[len(EXPORT_FIELDS):]
+        if not has_any_passkey or access.can_manage(row[0]):
+            return True
+        return user_passkey is not None and bool(
+            passkey_verified(request, row[0], user_passkey, user_passkey_version, update_session=False))
+
+    yield "["
+    separator = ""
+    for chunk in read_chunks(iterate_rows(profiles, EXPORT_FIELDS + ACCESS_FLAGS, chunk_size), chunk_size):
+        items = []
+        for row in chunk:
+            if visible(row):
+                items.append(json.dumps(dict(zip(EXPORT_FIELDS, row)), default=json_encoder))
+        if items:
+            yield separator + ",".join(items)
+            separator = ","
+    yield "]"
@@ -0,0 +1,61 @@
+import random
+import timeit
+from optparse import make_option
+
+from django.contrib.auth.models import User
+from django.core.management.base import NoArgsCommand
+from django.db import connection, transaction
+
+from profiles.bulk import chunks
+from profiles.explain import hot_queries, explain, full_scans
+from profiles.models import Profile, ProfilePasskeys
+from profiles.passkeys import hash_passkey
+
+
+class Command(NoArgsCommand):
+    help = "Seeds temporary profiles and passkeys and measures hot access queries, data is rolled back at the end"
+
+    option_list = NoArgsCommand.option_list + (
+        make_option('--users', action='store', type='int', dest='users', default=1000),
+        make_option('--profiles', action='store', type='int', dest='profiles', default=1000),
+        make_option('--density', action='store', type='float', dest='density', default=0.05,
+                    help='Share of (user, profile) pairs with passkey.'),
+        make_option('--repeat', action='store', type='int', dest='repeat', default=200,
+                    help='Number of runs of each query.'),
+    )
+
+    def handle_noargs(self, **options):
+        verbosity = int(options.get('verbosity', 1))
+        with transaction.atomic():
+            user, profile = self.seed(options['users'], options['profiles'], options['density'])
+
+            for name, queryset in hot_queries(user, profile):
+                plan = explain(queryset)
+                seconds = timeit.timeit(lambda: list(queryset.all()), number=options['repeat'])
+                self.stdout.write("%-28s %8.3f ms%s" % (
+                    name, seconds * 1000 / options['repeat'],
+                    "  FULL SCAN: %s" % ", ".join(full_scans(plan)) if full_scans(plan) else ""))
+                if verbosity > 1:
+                    self.stdout.write(plan or "query plans are not supported for %s" % connection.vendor)
+
+            transaction.set_rollback(True)
+
+    def seed(self, users_count, profiles_count, density):
+        prefix = "bench-%s-" % random.randint(0, 10 ** 6)
+        User.objects.bulk_create([User(username="%s%s" % (prefix, i)) for i in xrange(users_count)])
+        Profile.objects.bulk_create([Profile(name="%s%s" % (prefix, i), slug="%s%s" % (prefix, i),
+                                             created="2015-01-01", modified="2015-01-01")
+                                     for i in xrange(profiles_count)])
+
+        user_ids = list(User.objects.filter(username__startswith=prefix).values_list("id", flat=True))
+        profile_ids = list(Profile.objects.filter(slug__startswith=prefix).values_list("id", flat=True))
+        pairs = set()
+        for i in xrange(int(len(user_ids) * len(profile_ids) * density)):
+            pairs.add((random.choice(profile_ids), random.choice(user_ids)))
+        for chunk in chunks(pairs, 500):
+            ProfilePasskeys.objects.bulk_create([ProfilePasskeys(profile_id=profile_id, user_id=user_id,
+                                                                 passkey=hash_passkey("passkey"))
+                                                 for profile_id, user_id in chunk])
+
+        pair = random.choice(list(pairs))
+        return User.objects.get(pk=pair[1]), Profile.objects.get(pk=pair[0])
@@ -0,0 +1,70 @@
+import random
+import timeit
+from bisect import bisect_left
+from optparse import make_option
+
+from django.contrib.auth.models import User
+from django.core.management.base import NoArgsCommand
+from django.db import connection, transaction
+
+from profiles.bulk import chunks
+from profiles.explain import explain
+from profiles.models import Profile
+from profiles.search import search, get_backend
+
+
+class Command(NoArgsCommand):
+    help = "Seeds temporary profiles of random words and measures search queries, data is rolled back at the end"
+
+    option_list = NoArgsCommand.option_list + (
+        make_option('--profiles', action='store', type='int', dest='profiles', default=100000),
+        make_option('--words', action='store', type='int', dest='words', default=20000,
+                    help='Size of vocabulary profiles are made of.'),
+        make_option('--repeat', action='store', type='int', dest='repeat', default=50,
+                    help='Number of runs of each query.'),
+        make_option('--limit', action='store', type='int', dest='limit', default=50,
+                    help='Number of results fetched by each query.'),
+    )
+
+    def handle_noargs(self, **options):
+        verbosity = int(options.get('verbosity', 1))
+        vocabulary = ["w%sx%s" % (i, random.randint(0, 10 ** 6)) for i in xrange(options['words'])]
+        with transaction.atomic():
+            user = self.seed(options['profiles'], vocabulary)
+            self.stdout.write("%s, %s profiles" % (type(get_backend()).__name__, options['profiles']))
+
+            # first words of vocabulary are the most frequent ones
+            queries = [
+                ("rare word", vocabulary[-1]),
+                ("common word", vocabulary[0]),
+                ("two words", "%s %s" % (vocabulary[1], vocabulary[len(vocabulary) // 2])),
+                ("medium word", vocabulary[len(vocabulary) // 100]),
+            ]
+            for name, query in queries:
+                queryset = search(user, query)[:options['limit']]
+                seconds = timeit.timeit(lambda: list(queryset.all()), number=options['repeat'])
+                self.stdout.write("%-12s %-24s %8.3f ms" % (name, query, seconds * 1000 / options['repeat']))
+                if verbosity > 1:
+                    self.stdout.write(explain(queryset) or "query plans are not supported for %s" % connection.vendor)
+
+            transaction.set_rollback(True)
+
+    def seed(self, profiles_count, vocabulary):
+        prefix = "bench-%s-" % random.randint(0, 10 ** 6)
+        # zipf-like frequencies, like in natural texts
+        weights = [1.0 / (rank + 1) for rank in xrange(len(vocabulary))]
+        cumulative = []
+        total = 0
+        for weight in weights:
+            total += weight
+            cumulative.append(total)
+
+        def words(count):
+            return " ".join(vocabulary[min(bisect_left(cumulative, random.random() * total), len(vocabulary) - 1)]
+                            for _ in xrange(count))
+
+        for chunk in chunks(xrange(profiles_count), 1000):
+            Profile.objects.bulk_create([Profile(name=words(3)[:50], slug="%s%s" % (prefix, i), text=words(30),
+                                                 created="2015-01-01", modified="2015-01-01") for i in chunk])
+        return User.objects.create_user(prefix)
+
@@ -0,0 +1,52 @@
+import json
+from optparse import make_option
+
+from django.core.management.base import NoArgsCommand
+from django.db import transaction
+from django.test.utils import override_settings
+
+from profiles import benchmark
+
+
+class Command(NoArgsCommand):
+    help = "Seeds temporary profiles, users and passkeys and measures queries, time and peak memory of every view " \
+           "and api resource, data is rolled back at the end, shared cache is left untouched"
+
+    option_list = NoArgsCommand.option_list + (
+        make_option('--profiles', action='store', type='int', dest='profiles', default=None,
+                    help='Number of seeded profiles, the one of baselines by default.'),
+        make_option('--users', action='store', type='int', dest='users', default=None,
+                    help='Number of seeded users, the one of baselines by default.'),
+        make_option('--density', action='store', type='float', dest='density', default=None,
+                    help='Share of (user, profile) pairs with passkey, the one of baselines by default.'),
+        make_option('--repeat', action='store', type='int', dest='repeat', default=5,
+                    help='Number of requests to each endpoint.'),
+        make_option('--output', action='store', dest='output', default=None,
+                    help='File to write measures to as json.'),
+        make_option('--update-baselines', action='store_true', dest='update_baselines', default=False,
+                    help='Store measures as new baselines, query budget test checks views against them.'),
+    )
+
+    def handle_noargs(self, **options):
+        baselines = benchmark.load_baselines()
+        dataset = dict((key, options[key] if options[key] is not None else value)
+                       for key, value in baselines['dataset'].items())
+
+        with override_settings(CACHES=benchmark.CACHES), transaction.atomic():
+            fixtures = benchmark.seed(dataset['profiles'], dataset['users'], dataset['density'])
+            results = benchmark.run(fixtures, options['repeat'])
+            transaction.set_rollback(True)
+
+        self.stdout.write("%(profiles)s profiles, %(users)s users, %(density)s density" % dataset)
+        budgets = baselines['endpoints'] if dataset == baselines['dataset'] else {}
+        for name, measures in sorted(results.items()):
+            budget = budgets.get(name, {}).get('queries')
+            self.stdout.write("%-28s %3s %4s queries %9.3f ms %8s kB%s" % (
+                name, measures['status'], measures['queries'], measures['ms'], measures['peak_kb'],
+                "  OVER BUDGET OF %s" % budget if budget is not None and measures['queries'] > budget else ""))
+
+        if options['output']:
+            with open(options['output'], "w") as f:
+                json.dump({'dataset': dataset, 'endpoints': results}, f, indent=2, sort_keys=True)
+        if options['update_baselines']:
+            benchmark.save_baselines(dataset, results)
@@ -0,0 +1,22 @@
+import os
+
+from django.core.management.base import NoArgsCommand
+from django_assets.env import get_env
+
+from app.precompressed import precompress, brotli
+
+
+class Command(NoArgsCommand):
+    help = "Builds asset bundles into files named by hash of their content, keeps their versions in manifest " \
+           "and writes gzip and brotli variants of them, should be run before collectstatic"
+
+    def handle_noargs(self, **options):
+        env = get_env()
+        if brotli is None:
+            self.stderr.write("brotli package is not installed, only gzip variants are written")
+
+        for bundle in env:
+            bundle.build(force=True)
+            path = bundle.resolve_output()
+            sizes = [os.path.getsize(variant) for variant in [path] + precompress(path)]
+            self.stdout.write("%s %s" % (os.path.relpath(path, env.directory), " / ".join(map(str, sizes))))
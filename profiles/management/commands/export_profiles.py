@@ -0,0 +1,46 @@
+import sys
+import time
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+
+from profiles.models import Profile, ProfilePasskeys
+from profiles.transfer import FORMATS, PROFILE_FIELDS, PASSKEY_FIELDS, guess_format, write_records, iterate_rows
+
+
+class Command(BaseCommand):
+    help = "Exports profiles or passkeys to JSONL or CSV file readable by import_profiles, " \
+           "rows are read by chunks in order of ids"
+    args = "[path, stdout by default]"
+
+    option_list = BaseCommand.option_list + (
+        make_option('--passkeys', action='store_true', dest='passkeys', default=False,
+                    help='Export passkeys (profile slug, username, hashed passkey) instead of profiles.'),
+        make_option('--format', action='store', type='choice', choices=FORMATS, dest='format', default=None,
+                    help='jsonl or csv, guessed from file extension by default.'),
+        make_option('--chunk-size', action='store', type='int', dest='chunk_size', default=1000,
+                    help='Number of rows read with one query.'),
+    )
+
+    def handle(self, path='-', **options):
+        if options['passkeys']:
+            fields = PASSKEY_FIELDS
+            rows = iterate_rows(ProfilePasskeys.objects.all(), ('profile__slug', 'user__username', 'passkey'),
+                                options['chunk_size'])
+        else:
+            fields = PROFILE_FIELDS
+            rows = iterate_rows(Profile.objects.all(), PROFILE_FIELDS, options['chunk_size'])
+
+        started = time.time()
+        stream = sys.stdout if path == '-' else open(path, 'wb')
+        try:
+            count = write_records(stream, options['format'] or guess_format(path), fields, rows)
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
+
+        seconds = max(time.time() - started, 0.001)
+        if int(options.get('verbosity', 1)):
+            # report does not get mixed with exported rows
+            report = self.stderr if path == '-' else self.stdout
+            report.write("%s rows in %.1f s, %.0f rows/s" % (count, seconds, count / seconds))
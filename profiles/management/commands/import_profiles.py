@@ -0,0 +1,57 @@
+import sys
+import time
+from collections import Counter
+from optparse import make_option
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import reset_queries
+
+from profiles.bulk import create_profiles, import_profile_passkeys
+from profiles.cache import access_transaction
+from profiles.transfer import FORMATS, guess_format, read_records, read_chunks
+
+
+class Command(BaseCommand):
+    help = "Imports profiles or passkeys from JSONL or CSV file, records are read and saved by chunks, " \
+           "each chunk in its own transaction"
+    args = "<path, - for stdin>"
+
+    option_list = BaseCommand.option_list + (
+        make_option('--passkeys', action='store_true', dest='passkeys', default=False,
+                    help='File contains passkeys (profile slug, username, passkey) instead of profiles.'),
+        make_option('--format', action='store', type='choice', choices=FORMATS, dest='format', default=None,
+                    help='jsonl or csv, guessed from file extension by default.'),
+        make_option('--chunk-size', action='store', type='int', dest='chunk_size', default=1000,
+                    help='Number of records saved in one transaction.'),
+    )
+
+    def handle(self, path=None, **options):
+        if path is None:
+            raise CommandError("path of file is required")
+        verbosity = int(options.get('verbosity', 1))
+        load = access_transaction(import_profile_passkeys if options['passkeys'] else create_profiles)
+
+        counts = Counter()
+        started = time.time()
+        stream = sys.stdin if path == '-' else open(path, 'rb')
+        try:
+            records = read_records(stream, options['format'] or guess_format(path))
+            for chunk in read_chunks(records, options['chunk_size']):
+                results = load(chunk)
+                counts.update(result['status'] for result in results)
+                # queries are remembered in DEBUG mode, memory use should not grow with file
+                reset_queries()
+                if verbosity > 1:
+                    self.stdout.write("%s records, %.0f records/s" % (
+                        sum(counts.values()), sum(counts.values()) / max(time.time() - started, 0.001)))
+        except ValueError as e:
+            raise CommandError("malformed record after %s records: %s" % (sum(counts.values()), e))
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        seconds = max(time.time() - started, 0.001)
+        if verbosity:
+            self.stdout.write("%s; %s records in %.1f s, %.0f records/s" % (
+                ", ".join("%s: %s" % item for item in sorted(counts.items())),
+                sum(counts.values()), seconds, sum(counts.values()) / seconds))
@@ -0,0 +1,19 @@
+from optparse import make_option
+
+from django.core.management.base import NoArgsCommand
+
+from profiles.changes import prune_changes
+
+
+class Command(NoArgsCommand):
+    help = "Deletes old rows of passkeys change log, clients synced before them reload the whole matrix"
+
+    option_list = NoArgsCommand.option_list + (
+        make_option('--days', action='store', type='int', dest='days', default=30,
+                    help='Keep changes made during this number of days.'),
+    )
+
+    def handle_noargs(self, **options):
+        deleted = prune_changes(options['days'])
+        if int(options.get('verbosity', 1)):
+            self.stdout.write("deleted: %s" % deleted)
@@ -0,0 +1,14 @@
+from django.core.management.base import NoArgsCommand
+from django.db import connection
+
+from profiles.search import get_backend
+
+
+class Command(NoArgsCommand):
+    help = "Recreates full-text search index of profiles and indexes all of them again"
+
+    def handle_noargs(self, **options):
+        backend = get_backend()
+        installed = backend.install(connection)
+        if int(options.get('verbosity', 1)):
+            self.stdout.write("%s: %s" % (type(backend).__name__, "rebuilt" if installed else "not supported"))
@@ -0,0 +1,44 @@
+import time
+from optparse import make_option
+
+from django.core.management.base import NoArgsCommand
+
+from profiles import outbox
+
+
+class Command(NoArgsCommand):
+    help = "Delivers queued passkey emails, old sent and failed ones are deleted once the queue is empty"
+
+    option_list = NoArgsCommand.option_list + (
+        make_option('--batch-size', action='store', type='int', dest='batch_size', default=100,
+                    help='Number of emails claimed at once.'),
+        make_option('--workers', action='store', type='int', dest='workers', default=4,
+                    help='Number of threads sending emails, each one uses its own SMTP connection.'),
+        make_option('--loop', action='store_true', dest='loop', default=False,
+                    help='Keep polling the queue instead of exiting when it is empty.'),
+        make_option('--interval', action='store', type='float', dest='interval', default=5,
+                    help='Seconds to sleep between polls of empty queue in --loop mode.'),
+        make_option('--keep-days', action='store', type='int', dest='keep_days', default=outbox.KEEP_DAYS,
+                    help='Days to keep sent and failed emails.'),
+    )
+
+    # seconds between deletions of old emails in --loop mode
+    prune_interval = 60 * 60
+
+    def handle_noargs(self, **options):
+        verbosity = int(options.get('verbosity', 1))
+        pruned_at = None
+        while True:
+            sent, failed = outbox.dispatch(options['batch_size'], options['workers'])
+            if verbosity and (sent or failed):
+                self.stdout.write("sent: %s, failed: %s" % (sent, failed))
+
+            if not sent and not failed:
+                if pruned_at is None or time.time() - pruned_at > self.prune_interval:
+                    deleted = outbox.prune(options['keep_days'])
+                    pruned_at = time.time()
+                    if verbosity and deleted:
+                        self.stdout.write("deleted old emails: %s" % deleted)
+                if not options['loop']:
+                    break
+                time.sleep(options['interval'])
@@ -0,0 +1,42 @@
+from optparse import make_option
+
+from django.core.management.base import NoArgsCommand
+
+from profiles import timing
+
+
+class Command(NoArgsCommand):
+    help = "Prints median and 95th percentile of request measures per url name collected by TimingMiddleware"
+
+    option_list = NoArgsCommand.option_list + (
+        make_option('--reset', action='store_true', dest='reset', default=False,
+                    help='Forget collected measures after printing them.'),
+    )
+
+    def handle_noargs(self, **options):
+        verbosity = int(options.get('verbosity', 1))
+        warning = timing.shared_cache_warning()
+        if warning:
+            self.stderr.write(warning)
+        stats = timing.histograms()
+        if not stats:
+            self.stdout.write("no requests were timed, is PROFILES_TIMING on?")
+
+        self.stdout.write("%-48s %8s %s" % ("url", "requests", " ".join("%15s" % metric for metric, _ in timing.METRICS)))
+        for name, histograms in sorted(stats.items(), key=lambda item: -sum(item[1]['total'])):
+            self.stdout.write("%-48s %8s %s" % (name, sum(histograms['total']), " ".join(
+                "%15s" % ("%s/%s" % (self.bound(histograms[metric], bounds, 0.5),
+                                     self.bound(histograms[metric], bounds, 0.95)))
+                for metric, bounds in timing.METRICS)))
+            if verbosity > 1:
+                for metric, bounds in timing.METRICS:
+                    self.stdout.write("    %-10s %s" % (metric, " ".join(
+                        "<=%s:%s" % (bound, count) for bound, count in zip(bounds + ("inf", ), histograms[metric])
+                        if count)))
+
+        if options['reset']:
+            timing.reset()
+
+    def bound(self, counts, bounds, share):
+        value = timing.percentile(counts, bounds, share)
+        return ">%s" % bounds[-1] if value is None else value
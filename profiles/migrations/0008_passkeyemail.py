@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+import django.utils.timezone
+from django.conf import settings
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('profiles', '0007_create_missing_userprofiles'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PasskeyEmail',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('to', models.EmailField(max_length=254)),
+                ('subject', models.CharField(max_length=255)),
+                ('body_html', models.TextField()),
+                ('status', models.CharField(default=b'pending', max_length=16, choices=[(b'pending', b'pending'), (b'sending', b'sending'), (b'sent', b'sent'), (b'failed', b'failed')])),
+                ('claim', models.CharField(default=b'', help_text=b'token of dispatcher which is sending the email', max_length=32, db_index=True, blank=True)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('next_attempt', models.DateTimeField(default=django.utils.timezone.now, help_text=b'time of next delivery attempt, or claim time while sending')),
+                ('last_error', models.TextField(default=b'', blank=True)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('sent', models.DateTimeField(null=True, blank=True)),
+                ('profile', models.ForeignKey(to='profiles.Profile')),
+                ('user', models.ForeignKey(to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+            },
+            bases=(models.Model,),
+        ),
+        migrations.AlterIndexTogether(
+            name='passkeyemail',
+            index_together=set([('status', 'next_attempt')]),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+def deduplicate_slugs(apps, schema_editor):
+    """
+    gives suffixes to duplicated slugs and ids to profiles without slug, so unique index can be created
+    """
+    Profile = apps.get_model('profiles', 'Profile')
+    taken = set()
+    for pk, slug in Profile.objects.order_by('pk').values_list('pk', 'slug'):
+        base = slug if slug and slug != 'None' else unicode(pk)
+        candidate = base
+        n = 1
+        while candidate in taken:
+            n += 1
+            suffix = "-%s" % n
+            candidate = base[:50 - len(suffix)] + suffix
+        taken.add(candidate)
+        if candidate != slug:
+            Profile.objects.filter(pk=pk).update(slug=candidate)
+
+
+def noop(apps, schema_editor):
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0008_passkeyemail'),
+    ]
+
+    operations = [
+        migrations.RunPython(deduplicate_slugs, noop),
+        migrations.CreateModel(
+            name='ProfileSlugHistory',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('slug', models.SlugField(unique=True)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('profile', models.ForeignKey(related_name='slug_history', to='profiles.Profile')),
+            ],
+            options={
+            },
+            bases=(models.Model,),
+        ),
+        migrations.AlterField(
+            model_name='profile',
+            name='slug',
+            field=models.SlugField(default=b'', unique=True, editable=False),
+            preserve_default=True,
+        ),
+    ]
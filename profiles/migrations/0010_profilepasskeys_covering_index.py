@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0009_unique_profile_slug'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='profilepasskeys',
+            index_together=set([('user', 'profile', 'passkey')]),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import hashlib
+import hmac
+
+from django.conf import settings
+from django.db import models, migrations
+from django.utils.encoding import force_bytes
+
+
+def hash_passkeys(apps, schema_editor):
+    """
+    replaces plain passkeys with keyed hashes, same as `profiles.passkeys.hash_passkey` at the time of migration
+    """
+    ProfilePasskeys = apps.get_model('profiles', 'ProfilePasskeys')
+    secret = getattr(settings, "PROFILES_PASSKEY_SECRET", settings.SECRET_KEY)
+    key = hashlib.sha256(force_bytes("profiles.passkeys" + secret)).digest()
+    for pk, passkey in ProfilePasskeys.objects.exclude(passkey__startswith="hmac-sha256$").values_list('pk', 'passkey'):
+        hashed = "hmac-sha256$" + hmac.new(key, force_bytes(passkey), hashlib.sha256).hexdigest()
+        ProfilePasskeys.objects.filter(pk=pk).update(passkey=hashed)
+
+
+def noop(apps, schema_editor):
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0010_profilepasskeys_covering_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profilepasskeys',
+            name='passkey_version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+            preserve_default=True,
+        ),
+        migrations.RunPython(hash_passkeys, noop),
+    ]
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0011_hashed_passkeys'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='profile',
+            index_together=set([('modified', 'id')]),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0012_profile_modified_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MatrixChange',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('kind', models.CharField(max_length=8, choices=[(b'passkey', b'passkey of user for profile'), (b'allowed', b'profile managed by admin')])),
+                ('action', models.CharField(max_length=8, choices=[(b'set', b'created or updated'), (b'delete', b'deleted')])),
+                ('profile_id', models.IntegerField()),
+                ('user_id', models.IntegerField()),
+                ('created', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+            },
+            bases=(models.Model,),
+        ),
+    ]
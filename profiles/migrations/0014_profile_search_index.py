@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+def install_search_index(apps, schema_editor):
+    """
+    index is not a part of models state, it is kept by `profiles.search` backend of database,
+    table of profiles is taken from models state of this migration rather than from current models
+    """
+    from profiles.search import get_backend
+    table = apps.get_model('profiles', 'Profile')._meta.db_table
+    get_backend(schema_editor.connection.vendor).install(schema_editor.connection, table)
+
+
+def uninstall_search_index(apps, schema_editor):
+    from profiles.search import get_backend
+    get_backend(schema_editor.connection.vendor).uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0013_matrixchange'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_search_index, uninstall_search_index),
+    ]
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import datetime
+
+from django.db import migrations
+
+# profiles.models.RESERVED_SLUGS at the time of migration
+RESERVED_SLUGS = ('export', 'more', 'search', 'add', 'manager', 'api')
+
+
+def rename_reserved_slugs(apps, schema_editor):
+    """
+    profiles having slugs shadowed by urls get the smallest free suffix, old slugs are kept in history
+    """
+    Profile = apps.get_model('profiles', 'Profile')
+    ProfileSlugHistory = apps.get_model('profiles', 'ProfileSlugHistory')
+    for pk, slug in Profile.objects.filter(slug__in=RESERVED_SLUGS).values_list('pk', 'slug'):
+        taken = set(Profile.objects.filter(slug__startswith=slug + '-').values_list('slug', flat=True))
+        n = 2
+        while "%s-%s" % (slug, n) in taken:
+            n += 1
+        candidate = "%s-%s" % (slug, n)
+        Profile.objects.filter(pk=pk).update(slug=candidate, modified=datetime.datetime.today())
+        ProfileSlugHistory.objects.filter(slug=candidate).delete()
+        ProfileSlugHistory.objects.update_or_create(slug=slug, defaults={'profile_id': pk})
+
+
+def noop(apps, schema_editor):
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0014_profile_search_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(rename_reserved_slugs, noop),
+    ]
@@ -1,2 +1,4 @@
 from profiles.models.profile import *
-from profiles.models.user_profile import *
\ No newline at end of file
+from profiles.models.user_profile import *
+from profiles.models.outbox import *
+from profiles.models.changes import *
\ No newline at end of file
@@ -0,0 +1,29 @@
+from django.db import models
+
+
+class MatrixChange(models.Model):
+    """
+    log of changes of passkeys and allowed profiles, id of the row is a version of the matrix,
+    clients load the matrix once and then fetch only changes made after its version
+    rows are written by `profiles.changes`
+    """
+    PASSKEY = 'passkey'
+    ALLOWED = 'allowed'
+    KIND_CHOICES = (
+        (PASSKEY, 'passkey of user for profile'),
+        (ALLOWED, 'profile managed by admin'),
+    )
+
+    SET = 'set'
+    DELETE = 'delete'
+    ACTION_CHOICES = (
+        (SET, 'created or updated'),
+        (DELETE, 'deleted'),
+    )
+
+    kind = models.CharField(max_length=8, choices=KIND_CHOICES)
+    action = models.CharField(max_length=8, choices=ACTION_CHOICES)
+    # plain ids, the log outlives deleted rows
+    profile_id = models.IntegerField()
+    user_id = models.IntegerField()
+    created = models.DateTimeField(auto_now_add=True)
@@ -0,0 +1,41 @@
+from django.contrib.auth.models import User
+from django.db import models
+from django.utils import timezone
+
+from profiles.models.profile import Profile
+
+
+class PasskeyEmail(models.Model):
+    """
+    outbox of emails with passkeys, delivered by `send_passkey_emails` management command
+    """
+    PENDING = 'pending'
+    SENDING = 'sending'
+    SENT = 'sent'
+    FAILED = 'failed'
+    STATUS_CHOICES = (
+        (PENDING, 'pending'),
+        (SENDING, 'sending'),
+        (SENT, 'sent'),
+        (FAILED, 'failed'),
+    )
+
+    user = models.ForeignKey(User)
+    profile = models.ForeignKey(Profile)
+    to = models.EmailField(max_length=254)
+    subject = models.CharField(max_length=255)
+    body_html = models.TextField()
+
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=PENDING)
+    claim = models.CharField(max_length=32, default='', blank=True, db_index=True,
+                             help_text="token of dispatcher which is sending the email")
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt = models.DateTimeField(default=timezone.now,
+                                        help_text="time of next delivery attempt, or claim time while sending")
+    last_error = models.TextField(default='', blank=True)
+
+    created = models.DateTimeField(auto_now_add=True)
+    sent = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        index_together = ('status', 'next_attempt')
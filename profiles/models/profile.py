@@ -1,9 +1,110 @@
 import datetime
+import re
+import uuid
+from collections import OrderedDict
 
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import models, connection, transaction, IntegrityError
 from django.db.models import Q
 from django.utils.text import slugify
+from profiles.cache import ACCESS_MAX_IDS, get_slug_redirect, set_slug_redirect, \
+    forget_slug_redirects
+from profiles.models.user_profile import UserProfile
+from profiles.passkeys import hash_passkey, is_hashed, passkey_matches
+
+
+SLUG_LENGTH = 50
+SLUG_SUFFIX_LENGTH = 6  # room for suffixes up to -99999
+SLUG_SAVE_ATTEMPTS = 5
+# first parts of urls of profiles.urls, profiles with these slugs couldn't be shown by slug
+RESERVED_SLUGS = frozenset(('export', 'more', 'search', 'add', 'manager', 'api'))
+
+
+def free_slug(slug, taken):
+    """
+    :return: slug or slug with the smallest -N suffix which is neither in taken nor reserved
+    """
+    candidate = slug
+    n = 1
+    while candidate in taken or candidate in RESERVED_SLUGS:
+        n += 1
+        suffix = "-%s" % n
+        candidate = slug[:SLUG_LENGTH - len(suffix)] + suffix
+    return candidate
+
+
+def slug_candidates_q(slug):
+    """
+    :return: filter matching slug and all its suffixed variants
+    """
+    if len(slug) <= SLUG_LENGTH - SLUG_SUFFIX_LENGTH:
+        return Q(slug=slug) | Q(slug__startswith=slug + '-')
+    return Q(slug__startswith=slug[:SLUG_LENGTH - SLUG_SUFFIX_LENGTH])
+
+
+def is_slug_variant(current, slug):
+    """
+    :return: True if current is slug itself or one of its suffixed variants
+    """
+    if current == slug:
+        return True
+    match = re.match(r'^(.*)(-\d+)$', current)
+    return bool(match) and slug[:SLUG_LENGTH - len(match.group(2))] == match.group(1)
+
+
+def unique_slug(model, slug, exclude_pk=None, rejected=()):
+    """
+    returns slug, or slug with the smallest -N suffix, which is not used by other rows of model
+    all candidates are checked with single query
+    :param rejected: slugs refused by unique index, though the query may not see rows taking them yet
+    """
+    slug = slug[:SLUG_LENGTH]
+    taken = model.objects.filter(slug_candidates_q(slug)).exclude(pk=exclude_pk).values_list("slug", flat=True)
+    return free_slug(slug, set(taken) | set(rejected))
+
+
+def unique_slugs(model, slugs, batch_size=100):
+    """
+    bulk version of `unique_slug` for new rows, allocates distinct free slugs for the list of wanted ones,
+    candidates of batch_size slugs are checked with single query
+    :return: list of allocated slugs in order of wanted ones
+    """
+    slugs = [slug[:SLUG_LENGTH] for slug in slugs]
+    distinct = list(set(slugs))
+    taken = set()
+    for i in xrange(0, len(distinct), batch_size):
+        q = Q()
+        for slug in distinct[i:i + batch_size]:
+            q |= slug_candidates_q(slug)
+        taken.update(model.objects.filter(q).values_list("slug", flat=True))
+
+    allocated = []
+    for slug in slugs:
+        slug = free_slug(slug, taken)
+        taken.add(slug)
+        allocated.append(slug)
+    return allocated
+
+
+def save_with_free_slugs(allocate, save, attempts=SLUG_SAVE_ATTEMPTS):
+    """
+    free slugs are checked before insert, concurrent save may take the same slug in between,
+    unique index rejects it then, so save is done inside savepoint and retried with newly allocated slugs
+    :param allocate: function allocating slugs, gets set of slugs rejected so far,
+                     returns slugs to be rejected if save fails
+    :param save: function saving rows with allocated slugs
+    :return: result of save
+    """
+    rejected = set()
+    for attempt in xrange(attempts):
+        allocated = allocate(rejected)
+        try:
+            with transaction.atomic():
+                return save()
+        except IntegrityError:
+            if attempt == attempts - 1:
+                raise
+            rejected.update(allocated)
 
 
 class ProfileBase(models.Model):
@@ -12,7 +113,7 @@ class ProfileBase(models.Model):
     """
     text = models.TextField(default='')
     name = models.CharField(max_length=50)
-    slug = models.SlugField(default="", editable=False)
+    slug = models.SlugField(default="", editable=False, unique=True)
 
     created = models.DateTimeField(editable=False)
     modified = models.DateTimeField()
@@ -27,21 +128,60 @@ class ProfileBase(models.Model):
         self.modified = datetime.datetime.today()
 
         # For automatic slug generation.
-        if self.name:
-            self.slug = slugify(self.name)[:50]
-        else:
-            self.slug = unicode(self.pk)
-        return super(ProfileBase, self).save(*args, **kwargs)
+        slug = slugify(self.name)[:SLUG_LENGTH] if self.name else ''
+        if not slug and self.pk:
+            slug = unicode(self.pk)
+        if slug:
+            if not self.slug or self.slug in RESERVED_SLUGS or not is_slug_variant(self.slug, slug):
+                return save_with_free_slugs(lambda rejected: self.allocate_slug(slug, rejected),
+                                            lambda: super(ProfileBase, self).save(*args, **kwargs))
+            return super(ProfileBase, self).save(*args, **kwargs)
+
+        # profile without name gets its id as slug, until id is known temporary slug keeps index unique
+        self.slug = uuid.uuid4().hex
+        result = super(ProfileBase, self).save(*args, **kwargs)
+        save_with_free_slugs(lambda rejected: self.allocate_slug(unicode(self.pk), rejected),
+                             lambda: type(self).objects.filter(pk=self.pk).update(slug=self.slug))
+        return result
+
+    def allocate_slug(self, slug, rejected=()):
+        """
+        sets free variant of slug, see `unique_slug`
+        :return: list with allocated slug
+        """
+        self.slug = unique_slug(type(self), slug, self.pk, rejected)
+        return [self.slug]
 
 
 # Create your models here.
 class Profile(ProfileBase):
+    class Meta:
+        # keyset pagination of api, see `profiles.paginators.KeysetPaginator`
+        index_together = ('modified', 'id')
+
+    def save(self, *args, **kwargs):
+        old_slug = self.slug if self.pk else None
+        result = super(Profile, self).save(*args, **kwargs)
+        if old_slug and old_slug != self.slug:
+            ProfileSlugHistory.remember(self, old_slug)
+        return result
+
     @staticmethod
     def list_accessed_by(user):
         """
         :param user:
         :return: profiles which can be accessed by user
         """
+        # access matrix is built on top of models
+        from profiles.access import AccessMatrix
+        return AccessMatrix(user).accessible()
+
+    @staticmethod
+    def query_accessed_by(user):
+        """
+        :param user:
+        :return: profiles which can be accessed by user, built with subqueries only
+        """
         profiles_for_user = ProfilePasskeys.objects.filter(user_id=user.id).values("profile_id").distinct()
         profiles_with_passkeys = ProfilePasskeys.objects.values("profile_id").distinct()
         profiles_without_passkeys = Profile.objects.exclude(pk__in=profiles_with_passkeys).values("id")
@@ -53,19 +193,134 @@ class Profile(ProfileBase):
         else:
             return Profile.objects.filter(Q(pk__in=profiles_for_user) | Q(pk__in=profiles_without_passkeys))
 
+    @staticmethod
+    def materialize_access(user):
+        """
+        evaluates access of user into the smallest of two id lists
+        :return: ('in', accessible ids), ('not_in', restricted ids) or (None, None) if both lists are too big
+        """
+        accessible = Profile.query_accessed_by(user).values_list("id", flat=True).distinct()
+        ids = list(accessible[:ACCESS_MAX_IDS + 1])
+        if len(ids) <= ACCESS_MAX_IDS:
+            return 'in', frozenset(ids)
+
+        ids = list(Profile.objects.exclude(pk__in=accessible).values_list("id", flat=True)[:ACCESS_MAX_IDS + 1])
+        if len(ids) <= ACCESS_MAX_IDS:
+            return 'not_in', frozenset(ids)
+        return None, None
+
+    @staticmethod
+    def list_managed_by(user):
+        """
+        :param user: admin
+        :return: profiles which can be managed by user
+        """
+        return Profile.objects.filter(Profile.managed_q(user))
+
+    @staticmethod
+    def managed_q(user, field="id"):
+        """
+        :param user: admin
+        :param field: field of filtered model referring to profile
+        :return: filter of rows referring to profiles which can be managed by user, checked by one subquery
+        """
+        if user.is_superuser:
+            return Q()
+        return Q(**{field + "__in": user.profile.profiles.values("id")})
+
+    @staticmethod
+    def with_access_flags(user):
+        """
+        annotates profiles with everything needed to decide whether user can see them:
+
+          has_any_passkey - profile is restricted by passkeys
+          user_passkey - hashed passkey assigned to user for this profile or None
+          user_passkey_version - version of that passkey
+          user_is_manager - user is allowed to manage profile
+
+        :param user:
+        :return: queryset
+        """
+        qn = connection.ops.quote_name
+        profile_id = "%s.%s" % (qn(Profile._meta.db_table), qn(Profile._meta.pk.column))
+        passkeys = qn(ProfilePasskeys._meta.db_table)
+        managers = qn(UserProfile.profiles.through._meta.db_table)
+        userprofiles = qn(UserProfile._meta.db_table)
+        # select_params follow the order of select
+        return Profile.objects.extra(select=OrderedDict([
+            ('has_any_passkey', "EXISTS (SELECT 1 FROM %s pp WHERE pp.profile_id = %s)" % (passkeys, profile_id)),
+            ('user_passkey', "SELECT pp.passkey FROM %s pp WHERE pp.profile_id = %s AND pp.user_id = %%s"
+                             % (passkeys, profile_id)),
+            ('user_passkey_version', "SELECT pp.passkey_version FROM %s pp "
+                                     "WHERE pp.profile_id = %s AND pp.user_id = %%s" % (passkeys, profile_id)),
+            ('user_is_manager', "EXISTS (SELECT 1 FROM %s upp INNER JOIN %s up ON up.id = upp.userprofile_id "
+                                "WHERE upp.profile_id = %s AND up.user_id = %%s)"
+                                % (managers, userprofiles, profile_id)),
+        ]), select_params=(user.pk, user.pk, user.pk))
+
     def can_be_accessed(self, passkey, user):
         """
         :return: True if user can access profile using provided passkey
         """
-        return ProfilePasskeys.objects.filter(passkey=passkey, user=user, profile=self).count() > 0
+        return ProfilePasskeys.objects.filter(passkey=hash_passkey(passkey), user=user, profile=self).count() > 0
 
 
 class ProfilePasskeys(models.Model):
     profile = models.ForeignKey(Profile)
     user = models.ForeignKey(User)
-    passkey = models.CharField(max_length=128)
+    passkey = models.CharField(max_length=128)  # keyed hash, raw passkeys are hashed on save
+    passkey_version = models.PositiveIntegerField(default=1, editable=False)
 
     class Meta:
         unique_together = ('profile', 'user')
+        # covers lookups by user and by (user, profile, passkey) without reading the table
+        index_together = ('user', 'profile', 'passkey')
+
+    def save(self, *args, **kwargs):
+        if not is_hashed(self.passkey):
+            self.set_passkey(self.passkey)
+        return super(ProfilePasskeys, self).save(*args, **kwargs)
 
+    def set_passkey(self, passkey):
+        """
+        stores hash of passkey, new version makes tokens of previous passkey invalid
+        """
+        if self.pk:
+            self.passkey_version += 1
+        self.passkey = hash_passkey(passkey)
+
+    def check_passkey(self, passkey):
+        return passkey_matches(passkey, self.passkey)
 
+
+class ProfileSlugHistory(models.Model):
+    """
+    previous slugs of profiles, keeps old links working after profile is renamed
+    """
+    slug = models.SlugField(unique=True)
+    profile = models.ForeignKey(Profile, related_name='slug_history')
+    created = models.DateTimeField(auto_now_add=True)
+
+    @staticmethod
+    def remember(profile, old_slug):
+        """
+        stores old slug of renamed profile
+        """
+        # current slug is resolved directly
+        ProfileSlugHistory.objects.filter(slug=profile.slug).delete()
+        ProfileSlugHistory.objects.update_or_create(slug=old_slug, defaults={'profile': profile})
+        forget_slug_redirects(*profile.slug_history.values_list("slug", flat=True))
+
+    @staticmethod
+    def resolve(slug):
+        """
+        :return: current slug of profile which had provided slug before or None
+        """
+        current = get_slug_redirect(slug)
+        if current is None:
+            try:
+                current = ProfileSlugHistory.objects.select_related('profile').get(slug=slug).profile.slug
+            except ProfileSlugHistory.DoesNotExist:
+                return None
+            set_slug_redirect(slug, current)
+        return current
@@ -11,8 +11,22 @@ def is_admin(user):
     else:
         return user.is_superuser or user.profile.is_admin
 
+
+def get_profile(user):
+    """
+    returns UserProfile of user, it is cached on user instance after first access
+    and can be loaded together with user by select_related('userprofile')
+    """
+    try:
+        return user.userprofile
+    except UserProfile.DoesNotExist:
+        # profiles are created on user creation, but keep working for rows created before
+        profile, _ = UserProfile.objects.get_or_create(user=user)
+        user.userprofile = profile
+        return profile
+
 # extend user with some helpers methods
-User.profile = property(lambda u: UserProfile.objects.get_or_create(user=u)[0])
+User.profile = property(get_profile)
 User.add_to_class('is_admin', property(is_admin))
 
 
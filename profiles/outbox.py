@@ -0,0 +1,170 @@
+"""
+queue of passkey emails, views enqueue messages and `send_passkey_emails` command delivers them
+"""
+import datetime
+import uuid
+from multiprocessing.pool import ThreadPool
+
+from django.conf import settings
+from django.core.mail import get_connection, EmailMultiAlternatives
+from django.db.models import Q, F
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+from profiles.models import PasskeyEmail
+
+MAX_ATTEMPTS = getattr(settings, "PASSKEY_EMAIL_MAX_ATTEMPTS", 5)
+RETRY_DELAY = getattr(settings, "PASSKEY_EMAIL_RETRY_DELAY", 60)  # seconds, doubled on each attempt
+CLAIM_TIMEOUT = getattr(settings, "PASSKEY_EMAIL_CLAIM_TIMEOUT", 10 * 60)  # seconds before crashed claims expire
+KEEP_DAYS = getattr(settings, "PASSKEY_EMAIL_KEEP_DAYS", 30)  # days to keep delivered and failed emails
+
+
+def build_passkey_email(passkey, plain_passkey, profile_update_url):
+    """
+    renders email about passkey, the row is not saved
+    :param passkey: ProfilePasskeys instance with loaded user and profile
+    :param plain_passkey: passkey itself, only its hash is stored in ProfilePasskeys
+    :param profile_update_url: absolute url of profile
+    :rtype: PasskeyEmail
+    """
+    body_html = render_to_string("profiles/emails/passkey_update.html", {
+        "user": passkey.user,
+        "profile": passkey.profile,
+        "passkey": passkey,
+        "plain_passkey": plain_passkey,
+        "profile_update_url": profile_update_url,
+    })
+    return PasskeyEmail(user=passkey.user, profile=passkey.profile, to=passkey.user.email,
+                        subject="New passkey", body_html=body_html)
+
+
+def enqueue(emails):
+    """
+    saves emails to outbox in one statement
+    :param emails: list of unsaved PasskeyEmail
+    """
+    PasskeyEmail.objects.bulk_create(emails)
+
+
+def retry_delay(attempts):
+    return datetime.timedelta(seconds=RETRY_DELAY * 2 ** (attempts - 1))
+
+
+def claim_batch(batch_size):
+    """
+    marks the batch of due emails as being sent by this dispatcher,
+    emails claimed by crashed dispatchers are taken again after CLAIM_TIMEOUT
+    :return: list of claimed PasskeyEmail
+    """
+    now = timezone.now()
+    due = PasskeyEmail.objects.filter(
+        Q(status=PasskeyEmail.PENDING, next_attempt__lte=now) |
+        Q(status=PasskeyEmail.SENDING, next_attempt__lte=now - datetime.timedelta(seconds=CLAIM_TIMEOUT))
+    )
+    ids = list(due.order_by('next_attempt').values_list('id', flat=True)[:batch_size])
+    if not ids:
+        return []
+
+    # rows taken by concurrent dispatcher in the meantime are filtered out by status condition
+    claim = uuid.uuid4().hex
+    due.filter(pk__in=ids).update(status=PasskeyEmail.SENDING, claim=claim, next_attempt=now)
+    return list(PasskeyEmail.objects.filter(claim=claim, status=PasskeyEmail.SENDING))
+
+
+def send_chunk(emails):
+    """
+    sends emails through one connection
+    :return: list of (email id, error message or None)
+    """
+    results = []
+    connection = get_connection()
+    try:
+        connection.open()
+        for email in emails:
+            message = EmailMultiAlternatives(email.subject, strip_tags(email.body_html), settings.EMAIL_USERNAME,
+                                             [email.to], connection=connection)
+            message.attach_alternative(email.body_html, "text/html")
+            try:
+                message.send()
+                results.append((email.pk, None))
+            except Exception as e:
+                results.append((email.pk, repr(e) or 'error'))
+    except Exception as e:
+        # connection is broken, everything not sent yet should be retried
+        sent = set(pk for pk, error in results)
+        results.extend((email.pk, repr(e) or 'error') for email in emails if email.pk not in sent)
+    finally:
+        try:
+            connection.close()
+        except Exception:
+            pass
+    return results
+
+
+def store_results(emails, results):
+    """
+    marks sent emails and schedules retries for failed ones,
+    bodies of sent and finally failed emails are cleared, they contain plain passkeys
+    """
+    now = timezone.now()
+    by_pk = dict((email.pk, email) for email in emails)
+
+    sent = [pk for pk, error in results if error is None]
+    PasskeyEmail.objects.filter(pk__in=sent).update(status=PasskeyEmail.SENT, sent=now, claim='', body_html='',
+                                                    attempts=F('attempts') + 1, last_error='')
+
+    for pk, error in results:
+        if error is None:
+            continue
+        email = by_pk[pk]
+        email.attempts += 1
+        email.last_error = error
+        email.claim = ''
+        if email.attempts >= MAX_ATTEMPTS:
+            email.status = PasskeyEmail.FAILED
+            email.body_html = ''
+        else:
+            email.status = PasskeyEmail.PENDING
+            email.next_attempt = now + retry_delay(email.attempts)
+        email.save(update_fields=['attempts', 'last_error', 'claim', 'status', 'next_attempt', 'body_html'])
+    return len(sent), len(results) - len(sent)
+
+
+def prune(days=KEEP_DAYS):
+    """
+    deletes emails sent or finally failed more than days ago
+    :return: number of deleted emails
+    """
+    before = timezone.now() - datetime.timedelta(days=days)
+    # the last attempt of failed email is its claim time
+    old = PasskeyEmail.objects.filter(Q(status=PasskeyEmail.SENT, sent__lt=before) |
+                                      Q(status=PasskeyEmail.FAILED, next_attempt__lt=before))
+    count = old.count()
+    old.delete()
+    return count
+
+
+def dispatch(batch_size=100, workers=4):
+    """
+    delivers one batch of due emails, the batch is split between workers,
+    each worker reuses single SMTP connection for its part
+    :return: (sent, failed) numbers
+    """
+    emails = claim_batch(batch_size)
+    if not emails:
+        return 0, 0
+
+    workers = max(1, min(workers, len(emails)))
+    parts = [emails[i::workers] for i in range(workers)]
+    if workers == 1:
+        results = send_chunk(parts[0])
+    else:
+        pool = ThreadPool(workers)
+        try:
+            results = [result for part in pool.map(send_chunk, parts) for result in part]
+        finally:
+            pool.close()
+            pool.join()
+
+    return store_results(emails, results)
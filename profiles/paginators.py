@@ -0,0 +1,87 @@
+"""
+tastypie paginators used by profiles api
+"""
+import base64
+from urllib import urlencode
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from tastypie.exceptions import BadRequest
+from tastypie.paginator import Paginator
+
+
+class KeysetPaginator(Paginator):
+    """
+    pages through objects ordered by (modified, id) using cursor of the last shown object instead of offset,
+    so every page is a short range scan of (modified, id) index however deep it is
+
+    next page is requested with `cursor` parameter taken from meta.next,
+    requests with `offset` parameter are paged by offset as before
+    """
+    ordering = ('modified', 'id')
+
+    def page(self):
+        if 'offset' in self.request_data:
+            return super(KeysetPaginator, self).page()
+
+        limit = self.get_limit()
+        objects = self.get_ordered()
+        if limit:
+            # one more object tells whether next page exists
+            objects = list(objects[:limit + 1])
+            has_next = len(objects) > limit
+            objects = objects[:limit]
+        else:
+            objects = list(objects)
+            has_next = False
+
+        return {
+            self.collection_name: objects,
+            'meta': {
+                'limit': limit,
+                'previous': None,
+                'next': self._generate_cursor_uri(limit, objects[-1]) if has_next else None,
+            },
+        }
+
+    def get_ordered(self):
+        """
+        :return: objects following the cursor in pagination order
+        """
+        objects = self.objects.order_by(*self.ordering)
+        cursor = self.get_cursor()
+        if cursor is not None:
+            modified, pk = cursor
+            # leading condition lets database seek in the index instead of scanning it from the start
+            objects = objects.filter(Q(modified__gte=modified), Q(modified__gt=modified) | Q(pk__gt=pk))
+        return objects
+
+    def get_cursor(self):
+        """
+        :return: (modified, id) of the last object of previous page or None for the first page
+        """
+        value = self.request_data.get('cursor')
+        if not value:
+            return None
+        try:
+            modified, pk = base64.urlsafe_b64decode(str(value)).rsplit(',', 1)
+            modified = parse_datetime(modified)
+            pk = int(pk)
+        except (TypeError, ValueError):
+            modified = None
+        if modified is None:
+            raise BadRequest("Invalid cursor '%s' provided." % value)
+        return modified, pk
+
+    @staticmethod
+    def make_cursor(obj):
+        return base64.urlsafe_b64encode("%s,%s" % (obj.modified.isoformat(), obj.pk))
+
+    def _generate_cursor_uri(self, limit, obj):
+        if self.resource_uri is None:
+            return None
+
+        request_params = dict((key, value.encode('utf-8') if isinstance(value, unicode) else value)
+                              for key, value in self.request_data.items())
+        request_params.update({'limit': limit, 'cursor': self.make_cursor(obj)})
+        return '%s?%s' % (self.resource_uri, urlencode(request_params))
@@ -0,0 +1,113 @@
+"""
+passkeys are stored as keyed hashes, checked on each view of private profile so slow password hashers are not used
+once passkey is checked session keeps signed token instead of it, see `profiles.views.profile.passkey_verified`
+"""
+import hashlib
+import hmac
+
+from django.conf import settings
+from django.core import signing
+from django.utils.crypto import constant_time_compare
+from django.utils.encoding import force_bytes
+
+PREFIX = "hmac-sha256$"
+KEY_SALT = "profiles.passkeys"
+TOKEN_SALT = "profiles.passkeys.token"
+
+# changing the secret makes all stored passkeys invalid, so it can be kept apart from SECRET_KEY
+SECRET = getattr(settings, "PROFILES_PASSKEY_SECRET", settings.SECRET_KEY)
+
+
+def hash_passkey(passkey):
+    key = hashlib.sha256(force_bytes(KEY_SALT + SECRET)).digest()
+    return PREFIX + hmac.new(key, force_bytes(passkey), hashlib.sha256).hexdigest()
+
+
+def is_hashed(value):
+    return value.startswith(PREFIX)
+
+
+def passkey_matches(passkey, hashed):
+    """
+    :return: True if raw passkey matches stored hash, compared in constant time
+    """
+    if not passkey or not hashed:
+        return False
+    return constant_time_compare(hash_passkey(passkey), hashed)
+
+
+def make_token(profile_id, user_id, version):
+    """
+    :return: signed token proving that user provided correct passkey of given version
+    """
+    return signing.dumps([int(profile_id), int(user_id), int(version)], salt=TOKEN_SALT)
+
+
+def read_token(value):
+    """
+    :return: [profile_id, user_id, version] or None if value is not a valid token
+    """
+    try:
+        return signing.loads(value, salt=TOKEN_SALT)
+    except signing.BadSignature:
+        return None
+
+
+# profiles kept in session of one user, the least recently used ones are forgotten
+SESSION_MAX_PASSKEYS = getattr(settings, "PROFILES_SESSION_MAX_PASSKEYS", 50)
+
+
+class SessionPasskeys(object):
+    """
+    tokens of profiles kept in session as [profile_id, value] pairs, False marks a wrong passkey,
+    the most recently used last, list is bounded by SESSION_MAX_PASSKEYS, the least recently used are dropped first,
+    used entry is moved to the end only from the older half of list, so reads rarely make session to be saved
+    """
+
+    def __init__(self, session, key):
+        self.session = session
+        self.key = key
+        entries = session.get(key) or []
+        if isinstance(entries, dict):
+            # sessions written before entries were ordered
+            entries = [[int(profile_id), value] for profile_id, value in entries.items()]
+        self.entries = entries
+
+    def position(self, profile_id):
+        profile_id = int(profile_id)
+        for i, entry in enumerate(self.entries):
+            if entry[0] == profile_id:
+                return i
+        return None
+
+    def peek(self, profile_id):
+        """
+        :return: value kept for profile or None, session is left as is
+        """
+        i = self.position(profile_id)
+        return None if i is None else self.entries[i][1]
+
+    def get(self, profile_id):
+        """
+        :return: value kept for profile or None
+        """
+        i = self.position(profile_id)
+        if i is None:
+            return None
+        entry = self.entries[i]
+        if i < len(self.entries) // 2:
+            del self.entries[i]
+            self.entries.append(entry)
+            self.save()
+        return entry[1]
+
+    def set(self, profile_id, value):
+        i = self.position(profile_id)
+        if i is not None:
+            del self.entries[i]
+        self.entries.append([int(profile_id), value])
+        del self.entries[:-SESSION_MAX_PASSKEYS]
+        self.save()
+
+    def save(self):
+        self.session[self.key] = self.entries
@@ -0,0 +1,224 @@
+"""
+full-text search over name and text of profiles, the index is kept by database itself:
+sqlite FTS5 table maintained by triggers, postgresql GIN index over tsvector expression,
+so bulk statements of `profiles.bulk` are indexed as well as saved models
+
+other databases and sqlite builds without FTS5 fall back to LIKE filters
+"""
+import re
+
+from django.conf import settings
+from django.db import connection, DatabaseError
+from django.db.models import Q
+from django.utils.module_loading import import_string
+
+from profiles.models import Profile
+
+SEARCH_LIMIT = getattr(settings, "PROFILES_SEARCH_LIMIT", 50)
+# only this number of the newest matches is ranked, so common words cost about the same as rare ones,
+# matches hidden from user by access rules take their places among candidates too
+SEARCH_CANDIDATES = getattr(settings, "PROFILES_SEARCH_CANDIDATES", 500)
+MAX_TERMS = 8
+# weight of name matches against text matches
+NAME_WEIGHT = 10.0
+
+SEARCH_TABLE = "profiles_profile_search"
+
+
+def search_terms(query):
+    """
+    :return: words of query, punctuation and query syntax of databases are dropped
+    """
+    return re.findall(r'\w+', query, re.U)[:MAX_TERMS]
+
+
+class SearchBackend(object):
+    """
+    base class of search backends, `filter` narrows queryset of profiles to matching ones ordered by rank
+    """
+
+    def install(self, connection, table=None):
+        """
+        creates or recreates index, existing profiles are indexed
+        :param table: table of profiles, migrations pass the one of their models state
+        :return: False if database does not support this backend
+        """
+        return True
+
+    def uninstall(self, connection):
+        pass
+
+    def is_current(self, connection):
+        """
+        :return: False if index is missing or incomplete and should be installed again
+        """
+        return True
+
+    def filter(self, queryset, terms):
+        raise NotImplementedError
+
+
+class LikeSearchBackend(SearchBackend):
+    """
+    every term should be found in name or text, profiles are ordered by id, no index is used
+    """
+
+    def filter(self, queryset, terms):
+        for term in terms:
+            queryset = queryset.filter(Q(name__icontains=term) | Q(text__icontains=term))
+        return queryset.order_by('pk')
+
+
+class SqliteSearchBackend(SearchBackend):
+    """
+    external content FTS5 table over profiles table, the newest SEARCH_CANDIDATES matches are ranked by bm25
+
+    sqlite recreates the table when columns of profiles are altered and drops its triggers,
+    they are installed again after migrations, see `profiles.signals.ensure_search_index`
+    """
+    TRIGGERS = tuple(SEARCH_TABLE + "_" + action for action in ("insert", "delete", "update"))
+
+    def install(self, connection, table=None):
+        cursor = connection.cursor()
+        qn = connection.ops.quote_name
+        profiles = qn(table or Profile._meta.db_table)
+        table = qn(SEARCH_TABLE)
+        self.uninstall(connection)
+        try:
+            cursor.execute("CREATE VIRTUAL TABLE %s USING fts5(name, text, content=%s, content_rowid=id)"
+                           % (table, profiles))
+        except DatabaseError:
+            # sqlite is built without FTS5
+            return False
+
+        delete = "INSERT INTO %s(%s, rowid, name, text) VALUES ('delete', old.id, old.name, old.text);" % (table, table)
+        insert = "INSERT INTO %s(rowid, name, text) VALUES (new.id, new.name, new.text);" % table
+        on_insert, on_delete, on_update = self.TRIGGERS
+        cursor.execute("CREATE TRIGGER %s AFTER INSERT ON %s BEGIN %s END" % (qn(on_insert), profiles, insert))
+        cursor.execute("CREATE TRIGGER %s AFTER DELETE ON %s BEGIN %s END" % (qn(on_delete), profiles, delete))
+        cursor.execute("CREATE TRIGGER %s AFTER UPDATE OF name, text ON %s BEGIN %s %s END"
+                       % (qn(on_update), profiles, delete, insert))
+        cursor.execute("INSERT INTO %s(%s) VALUES ('rebuild')" % (table, table))
+        return True
+
+    def drop_triggers(self, connection):
+        cursor = connection.cursor()
+        for trigger in self.TRIGGERS:
+            cursor.execute("DROP TRIGGER IF EXISTS %s" % connection.ops.quote_name(trigger))
+
+    def uninstall(self, connection):
+        self.drop_triggers(connection)
+        connection.cursor().execute("DROP TABLE IF EXISTS %s" % connection.ops.quote_name(SEARCH_TABLE))
+
+    def is_current(self, connection):
+        names = (SEARCH_TABLE, ) + self.TRIGGERS
+        cursor = connection.cursor()
+        cursor.execute("SELECT count(*) FROM sqlite_master WHERE name IN (%s)" % ", ".join(["%s"] * len(names)), names)
+        return cursor.fetchone()[0] == len(names)
+
+    # databases known to have the index, each database is checked once per process
+    installed = set()
+
+    def is_installed(self, connection):
+        name = connection.settings_dict['NAME']
+        if name not in self.installed:
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [SEARCH_TABLE])
+            if cursor.fetchone() is not None:
+                self.installed.add(name)
+        return name in self.installed
+
+    def filter(self, queryset, terms):
+        qn = connection.ops.quote_name
+        table = qn(SEARCH_TABLE)
+        # every term is a quoted phrase, prefix queries are not used,
+        # they merge whole lists of matches of all words with prefix before the newest ones can be taken
+        match = " ".join('"%s"' % term for term in terms)
+        return queryset.extra(
+            select={'rank': "bm25(%s, %s, 1.0)" % (table, NAME_WEIGHT)},
+            tables=[SEARCH_TABLE],
+            where=["%s.rowid = %s.%s" % (table, qn(Profile._meta.db_table), qn(Profile._meta.pk.column)),
+                   "%s MATCH %%s" % table,
+                   "%s.rowid >= (SELECT min(rowid) FROM (SELECT rowid FROM %s WHERE %s MATCH %%s "
+                   "ORDER BY rowid DESC LIMIT %%s))" % (table, table, table)],
+            params=[match, match, SEARCH_CANDIDATES],
+            order_by=['rank'],
+        )
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    GIN index over weighted tsvector of name and text, the newest SEARCH_CANDIDATES matches are ranked by ts_rank,
+    queries use the same expression, so no extra column or triggers are needed
+    """
+    config = getattr(settings, "PROFILES_SEARCH_CONFIG", "simple")
+
+    def vector(self, connection, table=None):
+        qn = connection.ops.quote_name
+        prefix = qn(table) + "." if table else ""
+        return "(setweight(to_tsvector('%(config)s', coalesce(%(prefix)sname, '')), 'A') || " \
+               "setweight(to_tsvector('%(config)s', coalesce(%(prefix)stext, '')), 'B'))" % {
+                   'config': self.config, 'prefix': prefix}
+
+    def install(self, connection, table=None):
+        self.uninstall(connection)
+        connection.cursor().execute("CREATE INDEX %s ON %s USING GIN (%s)" % (
+            connection.ops.quote_name(SEARCH_TABLE), connection.ops.quote_name(table or Profile._meta.db_table),
+            self.vector(connection)))
+        return True
+
+    def uninstall(self, connection):
+        connection.cursor().execute("DROP INDEX IF EXISTS %s" % connection.ops.quote_name(SEARCH_TABLE))
+
+    def is_current(self, connection):
+        cursor = connection.cursor()
+        cursor.execute("SELECT 1 FROM pg_class WHERE relname = %s AND relkind = 'i'", [SEARCH_TABLE])
+        return cursor.fetchone() is not None
+
+    def filter(self, queryset, terms):
+        qn = connection.ops.quote_name
+        table = qn(Profile._meta.db_table)
+        pk = qn(Profile._meta.pk.column)
+        vector = self.vector(connection, Profile._meta.db_table)
+        query = "to_tsquery('%s', %%s)" % self.config
+        # terms are plain words, like in sqlite backend
+        value = " & ".join(terms)
+        return queryset.extra(
+            select={'rank': "ts_rank(%s, %s)" % (vector, query)},
+            select_params=[value],
+            where=["%s @@ %s" % (vector, query),
+                   "%s.%s >= (SELECT min(c.%s) FROM (SELECT %s FROM %s WHERE %s @@ %s ORDER BY %s DESC LIMIT %%s) c)"
+                   % (table, pk, pk, pk, table, self.vector(connection), query, pk)],
+            params=[value, value, SEARCH_CANDIDATES],
+            order_by=['-rank'],
+        )
+
+
+BACKENDS = {
+    'sqlite': SqliteSearchBackend,
+    'postgresql': PostgresSearchBackend,
+}
+
+
+def get_backend(vendor=None):
+    """
+    :return: backend set by PROFILES_SEARCH_BACKEND setting or the one of database vendor
+    """
+    path = getattr(settings, "PROFILES_SEARCH_BACKEND", None)
+    if path:
+        return import_string(path)()
+    return BACKENDS.get(vendor or connection.vendor, LikeSearchBackend)()
+
+
+def search(user, query):
+    """
+    :return: queryset of profiles matching query among `Profile.list_accessed_by(user)`, best first
+    """
+    terms = search_terms(query)
+    if not terms:
+        return Profile.objects.none()
+
+    backend = get_backend()
+    if isinstance(backend, SqliteSearchBackend) and not backend.is_installed(connection):
+        backend = LikeSearchBackend()
+    return backend.filter(Profile.list_accessed_by(user), terms)
@@ -0,0 +1,135 @@
+from django.contrib.auth.models import User
+from django.db import connections
+from django.db.migrations.recorder import MigrationRecorder
+from django.db.models.signals import post_save, post_delete, pre_delete, m2m_changed, post_migrate
+from django.dispatch import receiver
+
+from profiles.cache import invalidate_access_cache, purge_page_cache, forget_slug_redirects, forget_is_admin
+from profiles.changes import record
+from profiles.models import Profile, ProfilePasskeys, ProfileSlugHistory, MatrixChange
+from profiles.models.user_profile import UserProfile
+from profiles.search import get_backend
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+@receiver(post_save, sender=ProfilePasskeys)
+@receiver(post_delete, sender=ProfilePasskeys)
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def invalidate_access_on_change(sender, **kwargs):
+    """
+    any change of profiles, passkeys or admins makes cached access sets stale
+    """
+    invalidate_access_cache()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def forget_user_admin_decision(sender, instance, **kwargs):
+    forget_is_admin(instance.pk)
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def forget_profile_admin_decision(sender, instance, **kwargs):
+    forget_is_admin(instance.user_id)
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def purge_profile_pages(sender, instance, **kwargs):
+    purge_page_cache(instance.pk)
+
+
+@receiver(post_save, sender=ProfilePasskeys)
+@receiver(post_delete, sender=ProfilePasskeys)
+def purge_restricted_profile_pages(sender, instance, **kwargs):
+    """
+    profile with passkeys is not public anymore
+    """
+    purge_page_cache(instance.profile_id)
+
+
+@receiver(post_delete, sender=ProfileSlugHistory)
+def forget_removed_slug_redirect(sender, instance, **kwargs):
+    forget_slug_redirects(instance.slug)
+
+
+@receiver(m2m_changed, sender=UserProfile.profiles.through)
+def invalidate_access_on_allowed_profiles_change(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_access_cache()
+
+
+@receiver(post_save, sender=ProfilePasskeys)
+def log_passkey_save(sender, instance, **kwargs):
+    record(MatrixChange.PASSKEY, MatrixChange.SET, [(instance.profile_id, instance.user_id)])
+
+
+@receiver(post_delete, sender=ProfilePasskeys)
+def log_passkey_delete(sender, instance, **kwargs):
+    record(MatrixChange.PASSKEY, MatrixChange.DELETE, [(instance.profile_id, instance.user_id)])
+
+
+@receiver(m2m_changed, sender=UserProfile.profiles.through)
+def log_allowed_profiles_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    logs profiles added to or removed from admins from both sides of relation
+    """
+    if action == 'pre_clear':
+        change = MatrixChange.DELETE
+        if reverse:
+            pairs = [(instance.pk, user_id) for user_id in instance.userprofile_set.values_list('user_id', flat=True)]
+        else:
+            pairs = [(profile_id, instance.user_id) for profile_id in instance.profiles.values_list('id', flat=True)]
+    elif action in ('post_add', 'post_remove') and pk_set:
+        change = MatrixChange.SET if action == 'post_add' else MatrixChange.DELETE
+        if reverse:
+            user_ids = UserProfile.objects.filter(pk__in=pk_set).values_list('user_id', flat=True)
+            pairs = [(instance.pk, user_id) for user_id in user_ids]
+        else:
+            pairs = [(profile_id, instance.user_id) for profile_id in pk_set]
+    else:
+        return
+    record(MatrixChange.ALLOWED, change, pairs)
+
+
+@receiver(pre_delete, sender=Profile)
+def log_allowed_profiles_of_deleted_profile(sender, instance, **kwargs):
+    """
+    rows of through table are removed by cascade without m2m_changed
+    """
+    user_ids = UserProfile.objects.filter(profiles=instance).values_list('user_id', flat=True)
+    record(MatrixChange.ALLOWED, MatrixChange.DELETE, [(instance.pk, user_id) for user_id in user_ids])
+
+
+@receiver(pre_delete, sender=UserProfile)
+def log_allowed_profiles_of_deleted_admin(sender, instance, **kwargs):
+    profile_ids = instance.profiles.values_list('id', flat=True)
+    record(MatrixChange.ALLOWED, MatrixChange.DELETE, [(profile_id, instance.user_id) for profile_id in profile_ids])
+
+
+@receiver(post_save, sender=User)
+def create_user_profile(sender, instance, created, raw=False, **kwargs):
+    """
+    creates UserProfile together with user, so it is never created on read
+    """
+    if created and not raw:
+        instance.userprofile = UserProfile.objects.create(user=instance)
+
+
+@receiver(post_migrate)
+def ensure_search_index(sender, using, **kwargs):
+    """
+    sqlite silently drops triggers of search index when a migration recreates profiles table,
+    index is installed again if it is incomplete after migrations
+    """
+    if sender.label != 'profiles':
+        return
+    connection = connections[using]
+    if ('profiles', '0014_profile_search_index') not in MigrationRecorder(connection).applied_migrations():
+        return
+    backend = get_backend(connection.vendor)
+    if not backend.is_current(connection):
+        backend.install(connection)
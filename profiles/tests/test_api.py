@@ -1,6 +1,14 @@
+import json
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.urlresolvers import reverse
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from tastypie.models import ApiKey
 from tastypie.test import ResourceTestCase
+from profiles.api import STREAMING_MIN_LIMIT, AdminAuthentication
+from profiles.models import Profile, ProfilePasskeys
 
 
 class TestProfilePasskeysResource(ResourceTestCase):
@@ -73,3 +81,186 @@ class TestUserResource(ResourceTestCase):
         url = "/api/v1/user/?format=json"
         resp = self.client.get(url)
         self.assertHttpOK(resp)
+
+
+class TestProfileResourcePagination(ResourceTestCase):
+    def setUp(self):
+        super(TestProfileResourcePagination, self).setUp()
+        self.root = User.objects.create_superuser('root', 'mailm@mail.ru', "12345")
+        self.profiles = [Profile.objects.create(name=u"name %s" % i, text=u"text %s" % i) for i in range(7)]
+        self.client.login(username=self.root.username, password="12345")
+
+    def get_objects(self, url):
+        resp = self.client.get(url)
+        self.assertHttpOK(resp)
+        return self.deserialize(resp)
+
+    def test_pages_are_followed_by_cursor(self):
+        ids = []
+        url = "/api/v1/profile/?format=json&limit=3"
+        while url:
+            data = self.get_objects(url)
+            self.assertLessEqual(len(data['objects']), 3)
+            ids.extend(obj['id'] for obj in data['objects'])
+            url = data['meta']['next']
+
+        self.assertEqual(ids, [profile.pk for profile in self.profiles])
+
+    def test_cursor_page_is_fetched_with_single_query(self):
+        data = self.get_objects("/api/v1/profile/?format=json&limit=3")
+        # user with profile and the page, session is read from cache
+        with self.assertNumQueries(2):
+            self.get_objects(data['meta']['next'])
+
+    def test_offset_pagination_is_still_supported(self):
+        data = self.get_objects("/api/v1/profile/?format=json&limit=3&offset=3")
+        self.assertEqual(data['meta']['total_count'], len(self.profiles))
+        self.assertEqual([obj['id'] for obj in data['objects']], [profile.pk for profile in self.profiles[3:6]])
+
+    def test_invalid_cursor_is_rejected(self):
+        resp = self.client.get("/api/v1/profile/?format=json&cursor=abc")
+        self.assertHttpBadRequest(resp)
+
+    def test_sparse_fields_dont_load_text(self):
+        with CaptureQueriesContext(connection) as queries:
+            data = self.get_objects("/api/v1/profile/?format=json&fields=id,name")
+
+        self.assertEqual(data['objects'][0], {"id": self.profiles[0].pk, "name": u"name 0"})
+        self.assertFalse([query for query in queries.captured_queries if '"text"' in query['sql']])
+
+    def test_big_pages_are_streamed(self):
+        resp = self.client.get("/api/v1/profile/?format=json&fields=id&limit=%s" % STREAMING_MIN_LIMIT)
+
+        self.assertTrue(resp.streaming)
+        data = json.loads("".join(resp.streaming_content))
+        self.assertEqual([obj['id'] for obj in data['objects']], [profile.pk for profile in self.profiles])
+        self.assertIsNone(data['meta']['next'])
+
+
+class TestUserProfileResource(ResourceTestCase):
+    def setUp(self):
+        super(TestUserProfileResource, self).setUp()
+        self.root = User.objects.create_superuser('root', 'mailm@mail.ru', "12345")
+        self.profiles = [Profile.objects.create(name=u"name %s" % i) for i in range(3)]
+        self.client.login(username=self.root.username, password="12345")
+
+    def add_users(self, count):
+        for i in range(count):
+            user = User.objects.create_user('user %s %s' % (count, i), 'user%s@mail.ru' % i, "12345")
+            user.profile.profiles.add(*self.profiles)
+
+    def get_list(self):
+        resp = self.client.get("/api/v1/userprofile/?format=json&limit=0")
+        self.assertHttpOK(resp)
+        return self.deserialize(resp)['objects']
+
+    def test_nested_user_and_profile_ids_are_returned(self):
+        self.add_users(1)
+
+        data = self.get_list()
+
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]['user']['username'], u'user 1 0')
+        self.assertEqual(data[0]['user']['email'], u'user0@mail.ru')
+        self.assertNotIn('password', data[0]['user'])
+        self.assertEqual(sorted(data[0]['profiles']), [profile.pk for profile in self.profiles])
+
+    def test_query_count_does_not_depend_on_page_size(self):
+        self.add_users(2)
+        with CaptureQueriesContext(connection) as small_page:
+            self.assertEqual(len(self.get_list()), 2)
+
+        self.add_users(10)
+        # session, user with profile, count, page, profiles of page
+        with self.assertNumQueries(len(small_page.captured_queries)):
+            self.assertEqual(len(self.get_list()), 12)
+
+
+class TestProfilePasskeysResourceScope(ResourceTestCase):
+    def setUp(self):
+        super(TestProfilePasskeysResourceScope, self).setUp()
+        self.admin = User.objects.create_user('admin', 'admin@admin.ru', "12345")
+        self.admin.profile.is_admin = True
+        self.admin.profile.save()
+        self.profiles = [Profile.objects.create(name=u"name %s" % i) for i in range(2)]
+        self.admin.profile.profiles.add(self.profiles[0])
+        self.users = [User.objects.create_user('user %s' % i, 'user%s@mail.ru' % i, "12345") for i in range(3)]
+        for profile in self.profiles:
+            for user in self.users:
+                ProfilePasskeys.objects.create(profile=profile, user=user, passkey=u"12345")
+        self.client.login(username=self.admin.username, password="12345")
+
+    def get_data(self, params=""):
+        resp = self.client.get("/api/v1/profilepasskeys/?format=json" + params)
+        self.assertHttpOK(resp)
+        return self.deserialize(resp)
+
+    def test_admin_gets_passkeys_of_managed_profiles_only(self):
+        data = self.get_data()
+
+        self.assertEqual(data['meta']['total_count'], len(self.users))
+        self.assertEqual(set(obj['profile'] for obj in data['objects']), set([self.profiles[0].pk]))
+        self.assertNotIn('passkey', data['objects'][0])
+
+    def test_passkeys_can_be_filtered_by_user(self):
+        data = self.get_data("&user=%s" % self.users[1].pk)
+        self.assertEqual([(obj['profile'], obj['user']) for obj in data['objects']],
+                         [(self.profiles[0].pk, self.users[1].pk)])
+
+        data = self.get_data("&user__in=%s,%s" % (self.users[0].pk, self.users[2].pk))
+        self.assertEqual([obj['user'] for obj in data['objects']], [self.users[0].pk, self.users[2].pk])
+
+    def test_compact_list_is_sent_as_rows(self):
+        data = self.get_data("&compact=1&profile=%s" % self.profiles[0].pk)
+
+        self.assertEqual(data['fields'], ['id', 'profile', 'user'])
+        self.assertEqual([row[1:] for row in data['objects']],
+                         [[self.profiles[0].pk, user.pk] for user in self.users])
+        self.assertEqual(data['meta']['total_count'], len(self.users))
+
+
+class TestAdminAuthentication(ResourceTestCase):
+    def setUp(self):
+        cache.clear()
+        self.root = User.objects.create_superuser('root', 'mailm@mail.ru', "12345")
+        self.user = User.objects.create_user('default', 'admin@admin.ru', "12345")
+        self.user.profile.is_admin = True
+        self.user.profile.save()
+        super(TestAdminAuthentication, self).setUp()
+
+    def test_decision_is_memoized_on_request(self):
+        request = RequestFactory().get("/api/v1/profile/")
+        request.user = User.objects.select_related('userprofile').get(pk=self.user.pk)
+        authentication = AdminAuthentication()
+
+        self.assertTrue(authentication.is_authenticated(request))
+        cache.clear()
+        with self.assertNumQueries(0):
+            self.assertTrue(authentication.is_authenticated(request))
+
+    def test_decision_is_cached_until_admin_flag_is_changed(self):
+        self.client.login(username=self.user.username, password="12345")
+        self.assertHttpOK(self.client.get("/api/v1/profile/?format=json"))
+
+        self.user.profile.is_admin = False
+        self.user.profile.save()
+        self.assertHttpUnauthorized(self.client.get("/api/v1/profile/?format=json"))
+
+    def test_admin_authenticates_by_api_key_without_session(self):
+        api_key = ApiKey.objects.create(user=self.root)
+
+        with CaptureQueriesContext(connection) as queries:
+            resp = self.client.get("/api/v1/profile/?format=json",
+                                   HTTP_AUTHORIZATION="ApiKey root:%s" % api_key.key)
+        self.assertHttpOK(resp)
+        self.assertFalse([query for query in queries if 'django_session' in query['sql']])
+
+    def test_wrong_or_non_admin_api_key_is_rejected(self):
+        ApiKey.objects.create(user=self.root)
+        resp = self.client.get("/api/v1/profile/?format=json", HTTP_AUTHORIZATION="ApiKey root:wrong")
+        self.assertHttpUnauthorized(resp)
+
+        guest = User.objects.create_user('guest', 'guest@guest.ru', "12345")
+        api_key = ApiKey.objects.create(user=guest)
+        resp = self.client.get("/api/v1/profile/?format=json", HTTP_AUTHORIZATION="ApiKey guest:%s" % api_key.key)
+        self.assertHttpUnauthorized(resp)
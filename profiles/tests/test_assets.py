@@ -0,0 +1,69 @@
+import gzip
+import mimetypes
+import os
+import shutil
+import tempfile
+from StringIO import StringIO
+
+from django.http import Http404
+from django.test import RequestFactory, SimpleTestCase
+from django.test.utils import override_settings
+from django.utils.http import http_date
+from app.precompressed import precompress, serve, accepted_encodings
+
+
+class TestPrecompressedStatic(SimpleTestCase):
+    content = "var profiles = {};\n" * 100
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        for name in ("base.0123abcd.js", "plain.js"):
+            with open(os.path.join(self.root, name), "wb") as f:
+                f.write(self.content)
+        self.written = precompress(os.path.join(self.root, "base.0123abcd.js"))
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def get(self, path, **headers):
+        return serve(RequestFactory().get("/static/" + path, **headers), path, self.root)
+
+    def test_compressed_variant_is_sent_to_clients_accepting_it(self):
+        self.assertIn(os.path.join(self.root, "base.0123abcd.js.gz"), self.written)
+
+        response = self.get("base.0123abcd.js", HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+        self.assertEqual(response['Content-Encoding'], "gzip")
+        self.assertEqual(response['Content-Type'], mimetypes.guess_type("base.js")[0])
+        self.assertIn("Accept-Encoding", response['Vary'])
+        body = "".join(response.streaming_content)
+        self.assertEqual(gzip.GzipFile(fileobj=StringIO(body)).read(), self.content)
+
+    def test_plain_file_is_sent_to_other_clients(self):
+        response = self.get("base.0123abcd.js", HTTP_ACCEPT_ENCODING="gzip;q=0")
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(int(response['Content-Length']), len(self.content))
+        self.assertEqual("".join(response.streaming_content), self.content)
+
+    def test_hashed_files_are_cached_forever(self):
+        self.assertIn("max-age=31536000", self.get("base.0123abcd.js")['Cache-Control'])
+        self.assertIn("immutable", self.get("base.0123abcd.js")['Cache-Control'])
+        self.assertFalse(self.get("plain.js").has_header('Cache-Control'))
+
+    def test_unchanged_file_is_not_sent(self):
+        response = self.get("plain.js", HTTP_IF_MODIFIED_SINCE=http_date())
+        self.assertEqual(response.status_code, 304)
+
+    @override_settings(STATIC_SENDFILE_HEADER="X-Accel-Redirect", STATIC_SENDFILE_URL="/protected/")
+    def test_web_server_sends_file_when_sendfile_is_configured(self):
+        response = self.get("base.0123abcd.js", HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(response['X-Accel-Redirect'], "/protected/base.0123abcd.js.gz")
+        self.assertEqual(response.content, "")
+
+    def test_files_outside_of_root_are_not_served(self):
+        self.assertRaises(Http404, self.get, "../" + os.path.basename(self.root) + "-other/file.js")
+
+    def test_accept_encoding_is_parsed(self):
+        self.assertEqual(accepted_encodings("gzip;q=0.5, br, identity;q=0"), set(["gzip", "br"]))
@@ -0,0 +1,131 @@
+import json
+from django.contrib.auth.models import User
+from django.core.urlresolvers import reverse
+from app.utils import TestCaseEx
+from profiles.bulk import apply_profile_passkeys, apply_allowed_profiles
+from profiles.changes import changes_since, current_version, prune_changes
+from profiles.models import Profile, ProfilePasskeys, MatrixChange
+
+
+class TestMatrixChanges(TestCaseEx):
+    def setUp(self):
+        super(TestMatrixChanges, self).setUp()
+        self.profiles = [Profile.objects.create(name=u"name %s" % i) for i in range(3)]
+        self.users = [User.objects.create_user("user %s" % i, password="123") for i in range(3)]
+        self.version = current_version()
+
+    def changes(self, user=None, since=None):
+        data = changes_since(user or self.root, self.version if since is None else since, window=0)
+        changes = data['changes']
+        return zip(changes['kind'], changes['action'], changes['profile'], changes['user'])
+
+    def test_passkey_changes_are_logged(self):
+        passkey = ProfilePasskeys.objects.create(profile=self.profiles[0], user=self.users[0], passkey=u'12345')
+        self.assertEqual(self.changes(), [('passkey', 'set', self.profiles[0].pk, self.users[0].pk)])
+
+        passkey.delete()
+        # changes of the same pair are squashed
+        self.assertEqual(self.changes(), [('passkey', 'delete', self.profiles[0].pk, self.users[0].pk)])
+
+    def test_allowed_profiles_changes_are_logged_from_both_sides(self):
+        userprofile = self.users[0].profile
+        userprofile.profiles.add(self.profiles[0], self.profiles[1])
+        self.profiles[2].userprofile_set.add(self.users[1].profile)
+        userprofile.profiles.remove(self.profiles[1])
+
+        self.assertEqual(sorted(self.changes()), sorted([
+            ('allowed', 'set', self.profiles[0].pk, self.users[0].pk),
+            ('allowed', 'delete', self.profiles[1].pk, self.users[0].pk),
+            ('allowed', 'set', self.profiles[2].pk, self.users[1].pk),
+        ]))
+
+        self.version = current_version()
+        deleted_pk = self.profiles[2].pk
+        self.profiles[2].delete()
+        userprofile.profiles.clear()
+        self.assertEqual(sorted(self.changes()), sorted([
+            ('allowed', 'delete', self.profiles[0].pk, self.users[0].pk),
+            ('allowed', 'delete', deleted_pk, self.users[1].pk),
+        ]))
+
+    def test_bulk_changes_are_logged(self):
+        ProfilePasskeys.objects.create(profile=self.profiles[0], user=self.users[0], passkey=u'12345')
+        self.version = current_version()
+
+        apply_profile_passkeys(self.root, [
+            {"profile": self.profiles[0].pk, "user": self.users[0].pk, "passkey": u'', "allowed": False},
+            {"profile": self.profiles[1].pk, "user": self.users[1].pk, "passkey": u'12345'},
+        ])
+        apply_allowed_profiles([{"user": self.users[2].pk, "profiles": [self.profiles[2].pk]}])
+
+        self.assertEqual(sorted(self.changes()), sorted([
+            ('passkey', 'delete', self.profiles[0].pk, self.users[0].pk),
+            ('passkey', 'set', self.profiles[1].pk, self.users[1].pk),
+            ('allowed', 'set', self.profiles[2].pk, self.users[2].pk),
+        ]))
+
+    def test_changes_are_paged(self):
+        for user in self.users:
+            ProfilePasskeys.objects.create(profile=self.profiles[0], user=user, passkey=u'12345')
+
+        data = changes_since(self.root, self.version, limit=2, window=0)
+        self.assertTrue(data['more'])
+        self.assertEqual(data['changes']['user'], [self.users[0].pk, self.users[1].pk])
+
+        data = changes_since(self.root, data['version'], limit=2, window=0)
+        self.assertFalse(data['more'])
+        self.assertEqual(data['changes']['user'], [self.users[2].pk])
+        self.assertEqual(data['version'], current_version())
+
+    def test_recent_changes_committed_late_are_sent(self):
+        for profile, user in zip(self.profiles, self.users):
+            ProfilePasskeys.objects.create(profile=profile, user=user, passkey=u'12345')
+        # the second row is not committed yet when the client asks for changes
+        late = MatrixChange.objects.order_by('id')[1]
+        MatrixChange.objects.filter(pk=late.pk).delete()
+        version = changes_since(self.root, self.version)['version']
+        late.save(force_insert=True)
+
+        data = changes_since(self.root, version)
+
+        changes = data['changes']
+        self.assertEqual(zip(changes['id'], changes['user']), [
+            (version - 2, self.users[0].pk), (late.pk, self.users[1].pk), (version, self.users[2].pk)])
+        self.assertEqual(data['version'], version)
+        self.assertEqual(changes_since(self.root, version, window=0)['changes']['id'], [])
+
+    def test_admin_gets_changes_of_managed_profiles_only(self):
+        admin = self.users[2].profile
+        admin.is_admin = True
+        admin.save()
+        admin.profiles.add(self.profiles[0])
+        self.version = current_version()
+
+        ProfilePasskeys.objects.create(profile=self.profiles[0], user=self.users[0], passkey=u'12345')
+        ProfilePasskeys.objects.create(profile=self.profiles[1], user=self.users[0], passkey=u'12345')
+
+        self.assertEqual(self.changes(self.users[2]), [('passkey', 'set', self.profiles[0].pk, self.users[0].pk)])
+
+    def test_client_is_asked_to_reload_after_log_is_pruned(self):
+        ProfilePasskeys.objects.create(profile=self.profiles[0], user=self.users[0], passkey=u'12345')
+        ProfilePasskeys.objects.create(profile=self.profiles[1], user=self.users[0], passkey=u'12345')
+        MatrixChange.objects.update(created=MatrixChange.objects.get(pk=current_version()).created.replace(year=2000))
+
+        self.assertEqual(prune_changes(days=30), current_version() - 1)
+        self.assertTrue(changes_since(self.root, 0)['reset'])
+        self.assertFalse(changes_since(self.root, current_version() - 1)['reset'])
+
+    @TestCaseEx.superuser
+    def test_changes_view_returns_changes_after_bootstrap_version(self):
+        version = json.loads(self.client.get(reverse("profiles.views.manager.bootstrap")).content)['version']
+        ProfilePasskeys.objects.create(profile=self.profiles[0], user=self.users[0], passkey=u'12345')
+
+        response = self.can_get("profiles.views.manager.changes", params={"since": version})
+
+        data = json.loads(response.content)
+        self.assertEqual(data['version'], current_version())
+        self.assertEqual(data['changes']['profile'], [self.profiles[0].pk])
+
+    @TestCaseEx.login
+    def test_simple_user_cant_get_changes(self):
+        self.redirect_to_login_on_get("profiles.views.manager.changes")
@@ -0,0 +1,27 @@
+from unittest import skipUnless
+
+from django.db import connection
+from app.utils import TestCaseEx
+from profiles.explain import hot_queries, explain, full_scans, PLAN_VENDORS
+from profiles.models import Profile, ProfilePasskeys
+
+
+@skipUnless(connection.vendor in PLAN_VENDORS, "query plans are not supported for this database")
+class TestHotQueriesUseIndexes(TestCaseEx):
+    def setUp(self):
+        super(TestHotQueriesUseIndexes, self).setUp()
+        self.profile = Profile.objects.create(name=u"name")
+        ProfilePasskeys.objects.create(profile=self.profile, user=self.user, passkey="passkey")
+
+    def test_hot_queries_dont_scan_tables(self):
+        for name, queryset in hot_queries(self.user, self.profile):
+            plan = explain(queryset)
+            self.assertEqual(full_scans(plan), [], "%s reads table without index:\n%s" % (name, plan))
+
+    def test_passkeys_of_user_are_read_from_index_only(self):
+        name, queryset = hot_queries(self.user, self.profile)[0]
+        plan = explain(queryset)
+        if "SEARCH" in plan:  # sqlite
+            self.assertIn("COVERING INDEX", plan)
+        else:
+            self.assertIn("Index Only Scan", plan)
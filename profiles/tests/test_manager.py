@@ -1,7 +1,15 @@
 import json
+import re
 from django.contrib.auth.models import User
+from django.contrib.staticfiles import finders
 from django.core.urlresolvers import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from profiles import bulk
+from profiles.bulk import apply_profile_passkeys, apply_allowed_profiles
 from profiles.models import Profile, ProfilePasskeys
+from profiles.passkeys import hash_passkey
+from app.assets import profiles_manager_js
 from app.utils import TestCaseEx
 
 
@@ -37,6 +45,19 @@ class TestManagerViews(TestCaseEx):
 
         self.can_get("profiles.views.manager.manager")
 
+    @TestCaseEx.superuser
+    def test_manager_page_defines_urls_used_by_scripts(self):
+        used = set()
+        for path in profiles_manager_js.contents:
+            with open(finders.find(path)) as f:
+                used.update(re.findall(r'commonUrls\.(\w+)', f.read()))
+
+        response = self.can_get("profiles.views.manager.manager")
+
+        defined = re.search(r'commonUrls = \{(.*?)\}', response.content, re.S).group(1)
+        self.assertTrue(used)
+        for name in used:
+            self.assertIn("'%s': '/" % name, defined)
 
     def test_guest_cant_update_profile_passkeys(self):
         self.redirect_to_login_on_get("profiles.views.manager.update_profile_passkeys")
@@ -65,7 +86,21 @@ class TestManagerViews(TestCaseEx):
 
         passkey = ProfilePasskeys.objects.get(pk=passkey.pk)
 
-        self.assertEqual(passkey.passkey, u'54321')
+        self.assertTrue(passkey.check_passkey(u'54321'))
+
+    @TestCaseEx.superuser
+    def test_update_profile_passkeys_hashes_values_looking_like_hashes(self):
+        profile = Profile.objects.create(name=u"name")
+        user = User.objects.first()
+        typed = hash_passkey(u'12345')
+
+        self.can_post("profiles.views.manager.update_profile_passkeys", params={
+            "profile_passkeys": json.dumps([{"profile": profile.pk, "user": user.pk, "passkey": typed}])
+        })
+
+        passkey = ProfilePasskeys.objects.get(profile=profile, user=user)
+        self.assertTrue(passkey.check_passkey(typed))
+        self.assertFalse(passkey.check_passkey(u'12345'))
 
     @TestCaseEx.superuser
     def test_update_profile_passkeys_can_create_new_passkey_triple(self):
@@ -84,7 +119,7 @@ class TestManagerViews(TestCaseEx):
 
         passkey = ProfilePasskeys.objects.order_by("-pk").first()
 
-        self.assertEqual(passkey.passkey, u'54321')
+        self.assertTrue(passkey.check_passkey(u'54321'))
 
     @TestCaseEx.superuser
     def test_update_profile_passkeys_can_delete_existing_triples(self):
@@ -105,4 +140,194 @@ class TestManagerViews(TestCaseEx):
         self.can_post("profiles.views.manager.update_profile_passkeys", params=new_values)
 
         self.assertEqual(ProfilePasskeys.objects.filter(profile=profile2).count(), 1)
-        self.assertEqual(ProfilePasskeys.objects.filter(profile=profile).count(), 0)
\ No newline at end of file
+        self.assertEqual(ProfilePasskeys.objects.filter(profile=profile).count(), 0)
+
+
+class TestBulkProfilePasskeys(TestCaseEx):
+    def setUp(self):
+        super(TestBulkProfilePasskeys, self).setUp()
+        self.profiles = [Profile.objects.create(name=u"name %s" % i) for i in range(3)]
+        self.users = [User.objects.create_user("user %s" % i, password="123") for i in range(10)]
+
+    def test_query_count_does_not_depend_on_payload_size(self):
+        ProfilePasskeys.objects.create(profile=self.profiles[0], user=self.users[0], passkey=u'old')
+        ProfilePasskeys.objects.create(profile=self.profiles[1], user=self.users[0], passkey=u'old')
+        rows = [{"profile": profile.pk, "user": user.pk, "passkey": u'new'}
+                for profile in self.profiles for user in self.users]
+        rows.append({"profile": self.profiles[1].pk, "user": self.users[0].pk, "passkey": u'', "allowed": False})
+
+        # profiles, users, existing rows, delete (select + delete), insert, update, change log
+        with self.assertNumQueries(8):
+            results = apply_profile_passkeys(self.root, rows)
+
+        statuses = [result['status'] for result in results]
+        self.assertEqual(statuses.count(bulk.CREATED), len(rows) - 3)
+        self.assertEqual(statuses.count(bulk.UPDATED), 1)
+        self.assertEqual(statuses.count(bulk.SKIPPED), 1)
+        self.assertEqual(statuses[-1], bulk.DELETED)
+
+        self.assertEqual(ProfilePasskeys.objects.count(), len(rows) - 2)
+        self.assertEqual(ProfilePasskeys.objects.filter(passkey=hash_passkey(u'new')).count(), len(rows) - 2)
+        self.assertFalse(ProfilePasskeys.objects.filter(profile=self.profiles[1], user=self.users[0]).exists())
+
+    def test_admin_can_update_only_allowed_profiles(self):
+        userprofile = self.user.profile
+        userprofile.is_admin = True
+        userprofile.save()
+        userprofile.profiles.add(self.profiles[0])
+
+        results = apply_profile_passkeys(self.user, [
+            {"profile": self.profiles[0].pk, "user": self.users[0].pk, "passkey": u'12345'},
+            {"profile": self.profiles[1].pk, "user": self.users[0].pk, "passkey": u'12345'},
+        ])
+
+        self.assertEqual([result['status'] for result in results], [bulk.CREATED, bulk.FORBIDDEN])
+        self.assertEqual(ProfilePasskeys.objects.filter(user=self.users[0]).count(), 1)
+
+    def test_malformed_and_missing_rows_are_reported(self):
+        results = apply_profile_passkeys(self.root, [
+            {"profile": "abc", "user": self.users[0].pk, "passkey": u'12345'},
+            {"profile": self.profiles[0].pk, "user": 100500, "passkey": u'12345'},
+            {"profile": self.profiles[0].pk, "user": self.users[0].pk, "passkey": u''},
+        ])
+
+        self.assertEqual([result['status'] for result in results], [bulk.INVALID, bulk.INVALID, bulk.SKIPPED])
+        self.assertEqual(ProfilePasskeys.objects.count(), 0)
+
+    @TestCaseEx.superuser
+    def test_update_profile_passkeys_returns_results(self):
+        new_values = {
+            "profile_passkeys": json.dumps([
+                {"profile": self.profiles[0].pk, "user": self.users[0].pk, "passkey": u'54321'}
+            ])
+        }
+
+        response = self.can_post("profiles.views.manager.update_profile_passkeys", params=new_values)
+
+        self.assertEqual(json.loads(response.content), [
+            {"profile": self.profiles[0].pk, "user": self.users[0].pk, "status": bulk.CREATED}
+        ])
+
+
+class TestBulkAllowedProfiles(TestCaseEx):
+    def setUp(self):
+        super(TestBulkAllowedProfiles, self).setUp()
+        self.profiles = [Profile.objects.create(name=u"name %s" % i) for i in range(5)]
+        self.admins = [User.objects.create_user("admin %s" % i, password="123") for i in range(10)]
+        for admin in self.admins:
+            admin.profile.profiles.add(self.profiles[0], self.profiles[1])
+
+    def test_query_count_does_not_depend_on_payload_size(self):
+        admins = [{"user": admin.pk, "profiles": [self.profiles[1].pk, self.profiles[2].pk, self.profiles[3].pk]}
+                  for admin in self.admins]
+
+        # users, profiles, existing rows, delete (select + delete), insert, change log
+        with self.assertNumQueries(7):
+            results = apply_allowed_profiles(admins)
+
+        self.assertEqual([result['status'] for result in results], [bulk.UPDATED] * len(self.admins))
+        for admin in self.admins:
+            self.assertEqual(set(admin.profile.profiles.all()), set(self.profiles[1:4]))
+
+    def test_invalid_entries_are_skipped(self):
+        results = apply_allowed_profiles([
+            {"user": self.admins[0].pk, "profiles": [100500]},
+            {"user": self.admins[1].pk, "profiles": []},
+            {"user": 100500, "profiles": [self.profiles[2].pk]},
+            {"user": self.admins[2].pk, "profiles": [self.profiles[0].pk, self.profiles[1].pk]},
+        ])
+
+        self.assertEqual([result['status'] for result in results],
+                         [bulk.INVALID, bulk.INVALID, bulk.INVALID, bulk.SKIPPED])
+        for admin in self.admins[:3]:
+            self.assertEqual(set(admin.profile.profiles.all()), set(self.profiles[:2]))
+
+    @TestCaseEx.superuser
+    def test_update_allowed_profiles_should_update_profiles(self):
+        params = {
+            "admins": json.dumps([
+                {"user": self.admins[0].pk, "profiles": [unicode(self.profiles[4].pk)]}
+            ])
+        }
+
+        response = self.can_post("profiles.views.manager.update_allowed_profiles", params=params)
+
+        self.assertEqual(json.loads(response.content), [{"user": self.admins[0].pk, "status": bulk.UPDATED}])
+        self.assertEqual(list(self.admins[0].profile.profiles.all()), [self.profiles[4]])
+
+
+class TestManagerBootstrap(TestCaseEx):
+    def setUp(self):
+        super(TestManagerBootstrap, self).setUp()
+        self.profiles = [Profile.objects.create(name=u"name %s" % i) for i in range(3)]
+        self.users = [User.objects.create_user("user %s" % i, "user%s@mail.ru" % i, "123") for i in range(3)]
+        ProfilePasskeys.objects.create(profile=self.profiles[0], user=self.users[0], passkey=u'12345')
+        ProfilePasskeys.objects.create(profile=self.profiles[1], user=self.users[1], passkey=u'12345')
+        self.users[2].profile.profiles.add(self.profiles[0], self.profiles[2])
+
+    def get_bootstrap(self, **headers):
+        return self.client.get(reverse("profiles.views.manager.bootstrap"), **headers)
+
+    def test_guest_cant_get_bootstrap(self):
+        self.redirect_to_login_on_get("profiles.views.manager.bootstrap")
+
+    @TestCaseEx.login
+    def test_simple_user_cant_get_bootstrap(self):
+        self.redirect_to_login_on_get("profiles.views.manager.bootstrap")
+
+    @TestCaseEx.superuser
+    def test_bootstrap_returns_columns(self):
+        data = json.loads(self.get_bootstrap().content)
+
+        self.assertEqual(data['profiles'], {
+            "id": [profile.pk for profile in self.profiles],
+            "name": [profile.name for profile in self.profiles],
+        })
+        self.assertEqual(data['passkeys'], {
+            "profile": [self.profiles[0].pk, self.profiles[1].pk],
+            "user": [self.users[0].pk, self.users[1].pk],
+        })
+        users = data['users']
+        self.assertEqual(users['id'], [self.user.pk] + [user.pk for user in self.users])
+        self.assertEqual(users['username'][1], u"user 0")
+        self.assertEqual(users['profiles'][3], [self.profiles[0].pk, self.profiles[2].pk])
+
+    def test_admin_gets_only_managed_profiles(self):
+        userprofile = self.user.profile
+        userprofile.is_admin = True
+        userprofile.save()
+        userprofile.profiles.add(self.profiles[0])
+        self.client.login(username=self.user.username, password=self.password)
+
+        data = json.loads(self.get_bootstrap().content)
+
+        self.assertEqual(data['profiles']['id'], [self.profiles[0].pk])
+        self.assertEqual(data['passkeys']['user'], [self.users[0].pk])
+        self.assertNotIn(self.user.pk, data['users']['id'])
+        self.assertEqual(data['users']['profiles'][2], [self.profiles[0].pk])
+
+    @TestCaseEx.superuser
+    def test_unchanged_bootstrap_is_not_sent_again(self):
+        response = self.get_bootstrap()
+        etag = response['ETag']
+
+        response = self.get_bootstrap(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        ProfilePasskeys.objects.create(profile=self.profiles[2], user=self.users[0], passkey=u'12345')
+        response = self.get_bootstrap(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    @TestCaseEx.superuser
+    def test_bootstrap_query_count_does_not_depend_on_data_size(self):
+        with CaptureQueriesContext(connection) as small:
+            self.get_bootstrap()
+
+        for i in range(10):
+            user = User.objects.create_user("more %s" % i, password="123")
+            ProfilePasskeys.objects.create(profile=self.profiles[0], user=user, passkey=u'12345')
+            user.profile.profiles.add(*self.profiles)
+
+        with self.assertNumQueries(len(small.captured_queries)):
+            self.get_bootstrap()
@@ -0,0 +1,137 @@
+import datetime
+import re
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.management import call_command
+from django.core.urlresolvers import reverse
+from django.test.utils import override_settings
+from django.utils import timezone
+from app.utils import TestCaseEx
+from profiles import outbox
+from profiles.models import Profile, ProfilePasskeys, PasskeyEmail
+
+
+class FailingEmailBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        raise IOError("smtp is down")
+
+
+class TestPasskeyEmailOutbox(TestCaseEx):
+    def setUp(self):
+        super(TestPasskeyEmailOutbox, self).setUp()
+        self.profile = Profile.objects.create(name=u"name")
+        self.users = [User.objects.create_user("user%s" % i, "user%s@mail.ru" % i, "123") for i in range(5)]
+        for user in self.users:
+            ProfilePasskeys.objects.create(profile=self.profile, user=user, passkey=u"passkey %s" % user.pk)
+
+    @TestCaseEx.superuser
+    def test_send_passkey_to_email_only_queues_message(self):
+        response = self.client.post(reverse("profiles.views.manager.send_passkey_to_email"), {
+            "user_id": self.users[0].pk,
+            "profile_id": self.profile.pk,
+            "passkey": u"passkey %s" % self.users[0].pk,
+        })
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(len(mail.outbox), 0)
+        email = PasskeyEmail.objects.get()
+        self.assertEqual(email.to, self.users[0].email)
+        self.assertIn(u"passkey %s" % self.users[0].pk, email.body_html)
+
+    @TestCaseEx.superuser
+    def test_send_passkey_to_email_checks_passkey(self):
+        response = self.client.post(reverse("profiles.views.manager.send_passkey_to_email"), {
+            "user_id": self.users[0].pk,
+            "profile_id": self.profile.pk,
+            "passkey": u"wrong",
+        })
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(PasskeyEmail.objects.count(), 0)
+
+    @TestCaseEx.superuser
+    def test_send_passkey_to_email_asks_for_new_passkey_when_stored_one_is_unknown(self):
+        # manager page posts empty passkey for existing ones, they are stored hashed
+        response = self.client.post(reverse("profiles.views.manager.send_passkey_to_email"), {
+            "user_id": self.users[0].pk,
+            "profile_id": self.profile.pk,
+            "passkey": u"",
+        })
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("generate and save a new one", response.content)
+        self.assertEqual(PasskeyEmail.objects.count(), 0)
+
+    @TestCaseEx.superuser
+    def test_send_profile_passkeys_to_email_queues_message_for_each_user(self):
+        User.objects.filter(pk=self.users[0].pk).update(email='')
+
+        response = self.client.post(reverse("profiles.views.manager.send_profile_passkeys_to_email"),
+                                    {"profile_id": self.profile.pk})
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(PasskeyEmail.objects.count(), len(self.users) - 1)
+
+    @TestCaseEx.superuser
+    def test_send_profile_passkeys_to_email_sends_new_passkeys(self):
+        self.client.post(reverse("profiles.views.manager.send_profile_passkeys_to_email"),
+                         {"profile_id": self.profile.pk})
+
+        for email in PasskeyEmail.objects.select_related('user'):
+            passkey = ProfilePasskeys.objects.get(profile=self.profile, user=email.user)
+            self.assertFalse(passkey.check_passkey(u"passkey %s" % email.user.pk))
+            self.assertEqual(passkey.passkey_version, 2)
+            plain_passkey = re.search(r'<h1>(.*)</h1>', email.body_html).group(1)
+            self.assertTrue(passkey.check_passkey(plain_passkey))
+
+    @TestCaseEx.login
+    def test_simple_user_cant_send_profile_passkeys(self):
+        self.redirect_to_login_on_post("profiles.views.manager.send_profile_passkeys_to_email",
+                                       params={"profile_id": self.profile.pk})
+
+    def test_dispatch_sends_queued_messages(self):
+        outbox.enqueue([outbox.build_passkey_email(passkey, u"passkey", "http://testserver/")
+                        for passkey in ProfilePasskeys.objects.all()])
+
+        self.assertEqual(outbox.dispatch(batch_size=3, workers=2), (3, 0))
+        call_command("send_passkey_emails", workers=2, verbosity=0)
+
+        self.assertEqual(len(mail.outbox), len(self.users))
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), sorted(u.email for u in self.users))
+        self.assertEqual(PasskeyEmail.objects.filter(status=PasskeyEmail.SENT).count(), len(self.users))
+        self.assertEqual(outbox.dispatch(), (0, 0))
+        # sent messages don't keep passkeys
+        self.assertFalse(PasskeyEmail.objects.exclude(body_html='').exists())
+
+    def test_old_sent_and_failed_messages_are_deleted(self):
+        outbox.enqueue([outbox.build_passkey_email(passkey, u"passkey", "http://testserver/")
+                        for passkey in ProfilePasskeys.objects.all()[:3]])
+        failed, sent, pending = PasskeyEmail.objects.order_by('id')
+        long_ago = timezone.now() - datetime.timedelta(days=outbox.KEEP_DAYS + 1)
+        PasskeyEmail.objects.filter(pk=failed.pk).update(status=PasskeyEmail.FAILED, next_attempt=long_ago)
+        PasskeyEmail.objects.filter(pk=sent.pk).update(status=PasskeyEmail.SENT, sent=long_ago)
+
+        call_command("send_passkey_emails", verbosity=0)
+
+        self.assertEqual(list(PasskeyEmail.objects.values_list('id', flat=True)), [pending.pk])
+        self.assertEqual(outbox.prune(days=0), 1)
+
+    @override_settings(EMAIL_BACKEND='profiles.tests.test_outbox.FailingEmailBackend')
+    def test_dispatch_retries_with_backoff(self):
+        outbox.enqueue([outbox.build_passkey_email(ProfilePasskeys.objects.first(), u"passkey", "http://testserver/")])
+
+        self.assertEqual(outbox.dispatch(), (0, 1))
+        email = PasskeyEmail.objects.get()
+        self.assertEqual(email.status, PasskeyEmail.PENDING)
+        self.assertEqual(email.attempts, 1)
+        self.assertIn("smtp is down", email.last_error)
+        self.assertGreater(email.next_attempt, timezone.now())
+
+        # message is not retried before its time
+        self.assertEqual(outbox.dispatch(), (0, 0))
+
+        PasskeyEmail.objects.update(next_attempt=timezone.now(), attempts=outbox.MAX_ATTEMPTS - 1)
+        self.assertEqual(outbox.dispatch(), (0, 1))
+        self.assertEqual(PasskeyEmail.objects.get().status, PasskeyEmail.FAILED)
+        self.assertEqual(PasskeyEmail.objects.get().body_html, '')
@@ -1,9 +1,32 @@
+import datetime
+import gzip
 import json
-from django.contrib.auth.models import User
-from django.core.urlresolvers import reverse
+import pickle
+import warnings
+from importlib import import_module
+from StringIO import StringIO
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY
+from django.contrib.auth.models import User, AnonymousUser
+from django.core.cache.backends.base import CacheKeyWarning
+from django.core.urlresolvers import reverse, resolve
+from django.db import connection
+from django.db.models.signals import pre_save
+from django.http import HttpResponse
+from django.test.utils import CaptureQueriesContext
 from app.utils import TestCaseEx
-from profiles.models import Profile, ProfilePasskeys
-from profiles.views.profile import session_passkeys
+from profiles.access import AccessMatrix, IdSet
+from profiles.bulk import apply_profile_passkeys, apply_allowed_profiles
+from profiles.cache import access_transaction, cached_access, MANAGED_KEY, get_cached_page, set_cached_page
+from profiles.export import export_chunks
+from profiles.models import Profile, ProfilePasskeys, ProfileSlugHistory
+import profiles.models.profile as profile_module
+import profiles.views.profile as profile_views
+from profiles.models.user_profile import UserProfile
+from profiles.passkeys import make_token, read_token, is_hashed, SessionPasskeys
+import profiles.passkeys as passkeys_module
+from profiles.views.profile import session_passkeys, passkey_verified
 
 
 class TestProfilesViews(TestCaseEx):
@@ -333,4 +356,645 @@ class TestProfilesViews(TestCaseEx):
         self.assertEqual(0, Profile.objects.filter(pk=p.pk).count())
 
 
+class TestProfileAccessCache(TestCaseEx):
 
+    def test_list_accessed_by_is_served_from_cache(self):
+        p1 = Profile.objects.create(name=u"public")
+        p2 = Profile.objects.create(name=u"private")
+        ProfilePasskeys.objects.create(user=self.user, profile=p2, passkey="12345")
+
+        guest = AnonymousUser()
+        self.assertEqual(set(Profile.list_accessed_by(guest)), {p1})
+
+        # access set is materialized, only the profiles query is left
+        with self.assertNumQueries(1):
+            self.assertEqual(set(Profile.list_accessed_by(guest)), {p1})
+
+    def test_list_accessed_by_is_invalidated_on_passkeys_change(self):
+        p1 = Profile.objects.create(name=u"public")
+        p2 = Profile.objects.create(name=u"private")
+        self.assertEqual(set(Profile.list_accessed_by(AnonymousUser())), {p1, p2})
+
+        passkey = ProfilePasskeys.objects.create(user=self.user, profile=p2, passkey="12345")
+        self.assertEqual(set(Profile.list_accessed_by(AnonymousUser())), {p1})
+        self.assertEqual(set(Profile.list_accessed_by(self.user)), {p1, p2})
+
+        passkey.delete()
+        self.assertEqual(set(Profile.list_accessed_by(AnonymousUser())), {p1, p2})
+
+    def test_list_accessed_by_is_invalidated_on_allowed_profiles_change(self):
+        p = Profile.objects.create(name=u"private")
+        ProfilePasskeys.objects.create(user=self.root, profile=p, passkey="12345")
+
+        userprofile = self.user.profile
+        userprofile.is_admin = True
+        userprofile.save()
+        self.assertEqual(set(Profile.list_accessed_by(self.user)), set())
+
+        userprofile.profiles.add(p)
+        self.assertEqual(set(Profile.list_accessed_by(self.user)), {p})
+
+        userprofile.profiles.clear()
+        self.assertEqual(set(Profile.list_accessed_by(self.user)), set())
+
+    def test_list_accessed_by_keeps_restricted_ids_for_big_catalogs(self):
+        p = Profile.objects.create(name=u"private")
+        ProfilePasskeys.objects.create(user=self.root, profile=p, passkey="12345")
+        public = [Profile.objects.create(name=u"public %s" % i) for i in range(3)]
+
+        max_ids = profile_module.ACCESS_MAX_IDS
+        profile_module.ACCESS_MAX_IDS = 2
+        try:
+            self.assertEqual(Profile.materialize_access(self.user), ('not_in', frozenset([p.pk])))
+            self.assertEqual(set(Profile.list_accessed_by(self.user)), set(public))
+        finally:
+            profile_module.ACCESS_MAX_IDS = max_ids
+
+
+class TestAccessMatrix(TestCaseEx):
+    def setUp(self):
+        super(TestAccessMatrix, self).setUp()
+        self.public = Profile.objects.create(name=u"public")
+        self.private = Profile.objects.create(name=u"private")
+        self.managed = Profile.objects.create(name=u"managed")
+        ProfilePasskeys.objects.create(user=self.root, profile=self.private, passkey="12345")
+        ProfilePasskeys.objects.create(user=self.root, profile=self.managed, passkey="12345")
+        self.user.profile.is_admin = True
+        self.user.profile.save()
+        self.user.profile.profiles.add(self.managed)
+
+    def test_id_sets_are_kept_as_sets_or_bitmaps(self):
+        sparse, dense = IdSet([3, 10 ** 6]), IdSet(range(1, 100, 2))
+        self.assertIsNone(sparse.bitmap)
+        self.assertIsNone(dense.ids)
+
+        self.assertEqual(sorted(sparse), [3, 10 ** 6])
+        self.assertEqual(sorted(pickle.loads(pickle.dumps(dense, pickle.HIGHEST_PROTOCOL))), range(1, 100, 2))
+        self.assertIn("99", dense)
+        self.assertNotIn(98, dense)
+        self.assertNotIn(-1, dense)
+        self.assertNotIn(10 ** 6, dense)
+        self.assertEqual(len(dense), 50)
+
+    def test_checks_are_answered_from_cache(self):
+        access = AccessMatrix(self.user)
+        self.assertTrue(access.can_manage(self.managed.pk))
+        self.assertTrue(access.can_view(self.managed.pk))
+        self.assertTrue(access.can_view(self.public.pk))
+
+        with self.assertNumQueries(0):
+            access = AccessMatrix(self.user)
+            self.assertTrue(access.can_manage(self.managed.pk))
+            self.assertFalse(access.can_manage(self.private.pk))
+            self.assertFalse(access.can_view(self.private.pk))
+            self.assertTrue(AccessMatrix(self.root).can_manage(self.private.pk))
+
+    def test_sets_loaded_before_commit_are_dropped(self):
+        @access_transaction
+        def revoke():
+            apply_allowed_profiles([{"user": self.user.pk, "profiles": [self.public.pk]}])
+            # concurrent request reads managed set committed before and caches it under the new version
+            cached_access(self.user, lambda: IdSet([self.managed.pk]), MANAGED_KEY)
+
+        revoke()
+
+        self.assertFalse(AccessMatrix(self.user).can_manage(self.managed.pk))
+
+    def test_checks_follow_changes(self):
+        self.assertTrue(AccessMatrix(self.user).can_manage(self.managed.pk))
+        self.assertFalse(AccessMatrix(self.user).can_view(self.private.pk))
+
+        self.user.profile.profiles.remove(self.managed)
+        ProfilePasskeys.objects.create(user=self.user, profile=self.private, passkey="12345")
+
+        self.assertFalse(AccessMatrix(self.user).can_manage(self.managed.pk))
+        self.assertTrue(AccessMatrix(self.user).can_view(self.private.pk))
+
+    def test_checks_work_for_big_catalogs(self):
+        max_ids = profile_module.ACCESS_MAX_IDS
+        profile_module.ACCESS_MAX_IDS = 0
+        try:
+            access = AccessMatrix(self.user)
+            self.assertEqual(access.listing, (None, None))
+            self.assertTrue(access.can_view(self.public.pk))
+            self.assertTrue(access.can_view(self.managed.pk))
+            self.assertFalse(access.can_view(self.private.pk))
+        finally:
+            profile_module.ACCESS_MAX_IDS = max_ids
+
+    def test_listing_is_not_materialized_without_shared_cache(self):
+        with self.settings(CACHE_SHARED=False), self.assertNumQueries(1):
+            self.assertEqual(list(AccessMatrix(AnonymousUser()).accessible()), [self.public])
+
+    def test_update_checks_managed_profiles_without_queries_per_profile(self):
+        self.client.login(username=self.user.username, password=self.password)
+        self.can_get("profiles.views.profile.update", pargs=[self.managed.pk])
+
+        with CaptureQueriesContext(connection) as queries:
+            self.can_get("profiles.views.profile.update", pargs=[self.managed.pk])
+        self.assertFalse([query for query in queries if "profiles_userprofile_profiles" in query['sql']])
+        self.redirect_on_get("profiles.views.profile.update", pargs=[self.private.pk])
+
+
+class TestUserProfile(TestCaseEx):
+
+    def test_profile_is_created_with_user(self):
+        user = User.objects.create_user("E", password="E")
+        self.assertTrue(UserProfile.objects.filter(user=user).exists())
+
+    def test_profile_is_fetched_once_per_user_instance(self):
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(1):
+            self.assertFalse(user.is_admin)
+            self.assertFalse(user.is_admin)
+            self.assertEqual(user.profile, user.profile)
+
+    def test_profile_can_be_selected_with_user(self):
+        users = list(User.objects.select_related('userprofile'))
+        with self.assertNumQueries(0):
+            for user in users:
+                user.is_admin
+
+    def test_profile_is_created_for_users_without_it(self):
+        UserProfile.objects.filter(user=self.user).delete()
+        user = User.objects.get(pk=self.user.pk)
+        self.assertFalse(user.is_admin)
+        self.assertTrue(UserProfile.objects.filter(user=self.user).exists())
+
+    def test_request_user_is_loaded_with_profile(self):
+        self.client.login(username=self.user.username, password=self.password)
+        with CaptureQueriesContext(connection) as context:
+            response = self.can_get("profiles.views.profile.index")
+        self.assertFalse(response.context['user'].is_admin)
+        self.assertFalse([query for query in context.captured_queries
+                          if query['sql'].startswith('SELECT "profiles_userprofile"')])
+        self.client.logout()
+
+    @TestCaseEx.superuser
+    def test_user_is_added_in_admin_with_profile(self):
+        response = self.client.post("/admin/auth/user/add/", {
+            'username': "new", 'password1': "new", 'password2': "new",
+            'userprofile-TOTAL_FORMS': 1, 'userprofile-INITIAL_FORMS': 0,
+            'userprofile-MIN_NUM_FORMS': 0, 'userprofile-MAX_NUM_FORMS': 1,
+            'userprofile-0-is_admin': "on",
+        })
+        self.assertEqual(response.status_code, 302)
+        user = User.objects.get(username="new")
+        self.assertTrue(user.is_admin)
+        self.assertEqual(UserProfile.objects.filter(user=user).count(), 1)
+
+    def test_sessions_of_model_backend_stay_logged_in(self):
+        self.client.login(username=self.user.username, password=self.password)
+        session = self.client.session
+        session[BACKEND_SESSION_KEY] = 'django.contrib.auth.backends.ModelBackend'
+        session.save()
+
+        response = self.can_get("profiles.views.profile.index")
+        self.assertEqual(response.context['user'], self.user)
+        self.client.logout()
+
+
+class TestHashedPasskeys(TestCaseEx):
+    def setUp(self):
+        super(TestHashedPasskeys, self).setUp()
+        self.profile = Profile.objects.create(name=u"private")
+        self.passkey = ProfilePasskeys.objects.create(user=self.user, profile=self.profile, passkey="coolpasskey")
+        self.client.login(username=self.user.username, password=self.password)
+
+    def tearDown(self):
+        self.client.logout()
+        super(TestHashedPasskeys, self).tearDown()
+
+    def set_session_passkey(self, value):
+        session = self.client.session
+        session[session_passkeys] = {self.profile.id: value}
+        session.save()
+
+    def session_passkey(self):
+        return SessionPasskeys(self.client.session, session_passkeys).get(self.profile.pk)
+
+    def test_passkeys_are_stored_hashed(self):
+        self.assertTrue(is_hashed(self.passkey.passkey))
+        self.assertTrue(self.passkey.check_passkey("coolpasskey"))
+        self.assertFalse(self.passkey.check_passkey("wrong"))
+        self.assertTrue(self.profile.can_be_accessed("coolpasskey", self.user))
+
+    def test_provided_passkey_is_kept_in_session_as_token(self):
+        self.client.post(reverse("profiles.views.profile.provide_passkey", args=[self.profile.pk]),
+                         {"passkey": "coolpasskey"})
+
+        self.assertEqual(read_token(self.session_passkey()), [self.profile.pk, self.user.pk, 1])
+        self.can_get("profiles.views.profile.show", pargs=[self.profile.pk])
+
+    def test_wrong_passkey_is_not_kept_in_session(self):
+        response = self.client.post(reverse("profiles.views.profile.provide_passkey", args=[self.profile.pk]),
+                                    {"passkey": "coolpasskey1"})
+        self.assertEqual(response.status_code, 302)
+
+        self.assertIs(self.session_passkey(), False)
+        response = self.redirect_on_get("profiles.views.profile.show", pargs=[self.profile.pk])
+        self.assertRedirects(response, reverse("profiles.views.profile.provide_passkey", args=[self.profile.pk]))
+
+    def test_plain_passkey_in_session_is_replaced_by_token(self):
+        self.set_session_passkey("coolpasskey")
+
+        self.can_get("profiles.views.profile.show", pargs=[self.profile.pk])
+        self.assertEqual(read_token(self.session_passkey()), [self.profile.pk, self.user.pk, 1])
+
+    def test_token_is_invalid_after_passkey_is_changed(self):
+        self.set_session_passkey(make_token(self.profile.pk, self.user.pk, 1))
+        self.can_get("profiles.views.profile.show", pargs=[self.profile.pk])
+
+        self.passkey.set_passkey("newpasskey")
+        self.passkey.save()
+
+        response = self.redirect_on_get("profiles.views.profile.show", pargs=[self.profile.pk])
+        self.assertRedirects(response, reverse("profiles.views.profile.provide_passkey", args=[self.profile.pk]))
+
+    def test_token_is_invalid_after_passkey_is_changed_in_bulk(self):
+        self.set_session_passkey(make_token(self.profile.pk, self.user.pk, 1))
+        apply_profile_passkeys(self.root, [{"profile": self.profile.pk, "user": self.user.pk, "passkey": "new"}])
+
+        self.assertEqual(ProfilePasskeys.objects.get(pk=self.passkey.pk).passkey_version, 2)
+        self.redirect_on_get("profiles.views.profile.show", pargs=[self.profile.pk])
+
+    def test_token_of_other_user_is_rejected(self):
+        self.set_session_passkey(make_token(self.profile.pk, self.root.pk, 1))
+        self.redirect_on_get("profiles.views.profile.show", pargs=[self.profile.pk])
+
+
+class TestSessionPasskeys(TestCaseEx):
+    def setUp(self):
+        super(TestSessionPasskeys, self).setUp()
+        self.session = import_module(settings.SESSION_ENGINE).SessionStore()
+        self.max_passkeys = passkeys_module.SESSION_MAX_PASSKEYS
+        passkeys_module.SESSION_MAX_PASSKEYS = 4
+
+    def tearDown(self):
+        passkeys_module.SESSION_MAX_PASSKEYS = self.max_passkeys
+        super(TestSessionPasskeys, self).tearDown()
+
+    def passkeys(self):
+        return SessionPasskeys(self.session, session_passkeys)
+
+    def test_least_recently_used_profiles_are_dropped(self):
+        for profile_id in range(1, 5):
+            self.passkeys().set(profile_id, "token %s" % profile_id)
+        # the oldest entry is used and survives
+        self.assertEqual(self.passkeys().get(1), "token 1")
+        self.passkeys().set(5, "token 5")
+
+        self.assertEqual([self.passkeys().get(profile_id) for profile_id in (2, 1, 3)], [None, "token 1", "token 3"])
+        self.assertEqual(len(self.session[session_passkeys]), 4)
+
+    def test_reading_recent_entries_does_not_write_session(self):
+        for profile_id in range(1, 5):
+            self.passkeys().set(profile_id, "token %s" % profile_id)
+        self.session.save()
+        self.session.modified = False
+
+        self.assertEqual(self.passkeys().get(4), "token 4")
+        self.assertFalse(self.session.modified)
+
+    def test_sessions_with_passkeys_dict_are_read(self):
+        self.session[session_passkeys] = {u"7": "token 7"}
+        self.assertEqual(self.passkeys().get("7"), "token 7")
+
+
+class TestShowQueries(TestCaseEx):
+    def setUp(self):
+        super(TestShowQueries, self).setUp()
+        self.public = Profile.objects.create(name=u"public")
+        self.private = Profile.objects.create(name=u"private")
+        ProfilePasskeys.objects.create(user=self.user, profile=self.private, passkey="coolpasskey")
+
+    def test_guest_sees_public_profile_with_one_query(self):
+        with self.assertNumQueries(1):
+            self.can_get("profiles.views.profile.show", pargs=[self.public.pk])
+        with self.assertNumQueries(1):
+            self.can_get("profiles.views.profile.show_by_slug", pargs=[self.public.slug])
+
+    def test_guest_is_redirected_from_private_profile_with_one_query(self):
+        with self.assertNumQueries(1):
+            self.redirect_to_login_on_get("profiles.views.profile.show", pargs=[self.private.pk])
+
+    def test_user_with_passkey_sees_private_profile_with_one_query(self):
+        self.client.login(username=self.user.username, password=self.password)
+        session = self.client.session
+        session[session_passkeys] = {
+            self.private.id: make_token(self.private.pk, self.user.pk, 1)
+        }
+        session.save()
+
+        # session is read from cache, user with profile is loaded by middleware
+        with self.assertNumQueries(2):
+            self.can_get("profiles.views.profile.show", pargs=[self.private.pk])
+        self.client.logout()
+
+    def test_admin_sees_managed_profile_with_one_query(self):
+        admin = User.objects.create_user("admin", password="admin")
+        userprofile = admin.profile
+        userprofile.is_admin = True
+        userprofile.save()
+        userprofile.profiles.add(self.private)
+
+        self.client.login(username="admin", password="admin")
+        with self.assertNumQueries(2):
+            self.can_get("profiles.views.profile.show", pargs=[self.private.pk])
+        self.client.logout()
+
+    def test_user_without_provided_passkey_is_redirected_with_one_query(self):
+        self.client.login(username=self.user.username, password=self.password)
+        with self.assertNumQueries(2):
+            response = self.redirect_on_get("profiles.views.profile.show", pargs=[self.private.pk])
+        self.assertRedirects(response, reverse("profiles.views.profile.provide_passkey", args=[self.private.pk]))
+        self.client.logout()
+
+
+class TestPublicPageCache(TestCaseEx):
+    def setUp(self):
+        super(TestPublicPageCache, self).setUp()
+        self.profile = Profile.objects.create(name=u"public", text=u"first text")
+
+    def test_guest_gets_cached_page_without_queries(self):
+        self.can_get("profiles.views.profile.show", pargs=[self.profile.pk])  # profile id is remembered
+        self.can_get("profiles.views.profile.show", pargs=[self.profile.pk])  # page is cached
+        with self.assertNumQueries(0):
+            response = self.can_get("profiles.views.profile.show", pargs=[self.profile.pk])
+        self.assertContains(response, self.profile.text)
+        self.assertTrue(response.has_header('ETag'))
+        self.assertTrue(response.has_header('Last-Modified'))
+
+        self.can_get("profiles.views.profile.show_by_slug", pargs=[self.profile.slug])
+        self.can_get("profiles.views.profile.show_by_slug", pargs=[self.profile.slug])
+        with self.assertNumQueries(0):
+            self.can_get("profiles.views.profile.show_by_slug", pargs=[self.profile.slug])
+
+    def test_conditional_get_returns_not_modified(self):
+        response = self.can_get("profiles.views.profile.show", pargs=[self.profile.pk])
+        url = reverse("profiles.views.profile.show", args=[self.profile.pk])
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified']).status_code, 304)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH='"other"').status_code, 200)
+
+    def test_page_is_purged_on_save(self):
+        for i in range(3):
+            self.can_get("profiles.views.profile.show", pargs=[self.profile.pk])
+
+        self.profile.text = u"second text"
+        self.profile.save()
+
+        response = self.can_get("profiles.views.profile.show", pargs=[self.profile.pk])
+        self.assertContains(response, u"second text")
+
+    def test_cache_is_bypassed_once_passkey_is_attached(self):
+        for i in range(3):
+            self.can_get("profiles.views.profile.show", pargs=[self.profile.pk])
+
+        ProfilePasskeys.objects.create(user=self.user, profile=self.profile, passkey="12345")
+        self.redirect_to_login_on_get("profiles.views.profile.show", pargs=[self.profile.pk])
+
+    def test_cache_is_bypassed_once_passkey_is_attached_in_bulk(self):
+        for i in range(3):
+            self.can_get("profiles.views.profile.show", pargs=[self.profile.pk])
+
+        apply_profile_passkeys(self.root, [{"profile": self.profile.pk, "user": self.user.pk, "passkey": "12345"}])
+        self.redirect_to_login_on_get("profiles.views.profile.show", pargs=[self.profile.pk])
+
+    def test_long_slugs_give_valid_keys(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", CacheKeyWarning)
+            self.assertEqual(get_cached_page('slug', u"x" * 300), (None, None))
+            set_cached_page('slug', u"x" * 300, self.profile, None, HttpResponse("page"))
+            self.assertEqual(get_cached_page('slug', u"x" * 300)[1], self.profile.pk)
+            self.assertEqual(get_cached_page('slug', u"\u044f"), (None, None))
+
+    def test_logged_user_is_not_served_from_cache(self):
+        for i in range(3):
+            self.can_get("profiles.views.profile.show", pargs=[self.profile.pk])
+
+        self.client.login(username=self.user.username, password=self.password)
+        response = self.can_get("profiles.views.profile.show", pargs=[self.profile.pk])
+        self.assertContains(response, "Logout")
+        self.client.logout()
+
+
+class TestProfileSlugs(TestCaseEx):
+
+    def test_duplicated_names_get_suffixed_slugs(self):
+        slugs = [Profile.objects.create(name=u"Same Name").slug for i in range(3)]
+        self.assertEqual(slugs, [u"same-name", u"same-name-2", u"same-name-3"])
+
+        long_name = u"x" * 50
+        self.assertEqual(Profile.objects.create(name=long_name).slug, long_name)
+        self.assertEqual(Profile.objects.create(name=long_name).slug, u"x" * 48 + u"-2")
+
+    def test_slug_is_allocated_with_single_query(self):
+        for i in range(5):
+            Profile.objects.create(name=u"Same Name")
+
+        # slug candidates and insert inside savepoint
+        with self.assertNumQueries(4):
+            profile = Profile.objects.create(name=u"Same Name")
+        self.assertEqual(profile.slug, u"same-name-6")
+
+    def test_slug_taken_by_concurrent_save_is_allocated_again(self):
+        def take_slug(sender, instance, **kwargs):
+            pre_save.disconnect(take_slug, sender=Profile)
+            # the other process inserts after the check of free slugs
+            now = datetime.datetime.today()
+            Profile.objects.bulk_create([Profile(name=instance.name, slug=instance.slug, created=now, modified=now)])
+
+        pre_save.connect(take_slug, sender=Profile)
+        try:
+            profile = Profile.objects.create(name=u"Same Name")
+        finally:
+            pre_save.disconnect(take_slug, sender=Profile)
+        self.assertEqual(profile.slug, u"same-name-2")
+        self.assertEqual(Profile.objects.get(pk=profile.pk).slug, u"same-name-2")
+
+    def test_profiles_without_name_get_id_as_slug(self):
+        p1 = Profile.objects.create()
+        p2 = Profile.objects.create()
+        self.assertEqual(p1.slug, unicode(p1.pk))
+        self.assertEqual(Profile.objects.get(pk=p2.pk).slug, unicode(p2.pk))
+
+    def test_saving_keeps_suffixed_slug(self):
+        Profile.objects.create(name=u"Same Name")
+        profile = Profile.objects.create(name=u"Same Name")
+        profile.text = u"new text"
+        profile.save()
+        self.assertEqual(Profile.objects.get(pk=profile.pk).slug, u"same-name-2")
+        self.assertFalse(ProfileSlugHistory.objects.exists())
+
+    def test_renamed_profile_is_resolved_by_old_slug(self):
+        profile = Profile.objects.create(name=u"Old Name")
+        profile.name = u"New Name"
+        profile.save()
+
+        response = self.client.get(reverse("profiles.views.profile.show_by_slug", args=[u"old-name"]))
+        self.assertRedirects(response, reverse("profiles.views.profile.show_by_slug", args=[u"new-name"]),
+                             status_code=301)
+
+        # redirect is cached
+        with self.assertNumQueries(1):
+            self.client.get(reverse("profiles.views.profile.show_by_slug", args=[u"old-name"]))
+
+        # and follows next renames
+        profile.name = u"Newest Name"
+        profile.save()
+        response = self.client.get(reverse("profiles.views.profile.show_by_slug", args=[u"old-name"]))
+        self.assertRedirects(response, reverse("profiles.views.profile.show_by_slug", args=[u"newest-name"]),
+                             status_code=301)
+
+    def test_url_names_are_not_given_as_slugs(self):
+        for name in (u"Export", u"More", u"Search", u"Add", u"Manager", u"Api"):
+            profile = Profile.objects.create(name=name)
+            self.assertEqual(profile.slug, name.lower() + u"-2")
+            self.assertEqual(resolve("/%s/" % profile.slug).func.__name__, "show_by_slug")
+
+        for name in (u"fx export", u"tell me more", u"research"):
+            profile = Profile.objects.create(name=name)
+            self.assertEqual(resolve("/%s/" % profile.slug).func.__name__, "show_by_slug")
+
+    def test_profiles_with_url_names_get_new_slugs(self):
+        profile = Profile.objects.create(name=u"Export")
+        Profile.objects.filter(pk=profile.pk).update(slug=u"export")
+        Profile.objects.create(name=u"export 2")  # takes export-2
+
+        migration = import_module("profiles.migrations.0015_rename_reserved_slugs")
+        migration.rename_reserved_slugs(apps, None)
+
+        self.assertEqual(Profile.objects.get(pk=profile.pk).slug, u"export-3")
+        self.assertEqual(ProfileSlugHistory.resolve(u"export"), u"export-3")
+        self.can_get("profiles.views.profile.show_by_slug", pargs=[u"export-3"])
+
+    def test_unknown_slug_is_not_found(self):
+        response = self.client.get(reverse("profiles.views.profile.show_by_slug", args=[u"unknown"]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_unknown_long_slug_is_not_found(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", CacheKeyWarning)
+            response = self.client.get(reverse("profiles.views.profile.show_by_slug", args=[u"x" * 300]))
+        self.assertEqual(response.status_code, 404)
+
+
+class TestProfileExport(TestCaseEx):
+    def setUp(self):
+        super(TestProfileExport, self).setUp()
+        self.public = [Profile.objects.create(name=u"public %s" % i) for i in range(3)]
+        self.private = Profile.objects.create(name=u"private")
+        ProfilePasskeys.objects.create(user=self.user, profile=self.private, passkey="coolpasskey")
+
+    def exported(self, **headers):
+        response = self.client.get(reverse("profiles.views.profile.export"), **headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return "".join(response.streaming_content)
+
+    def exported_names(self):
+        return sorted(profile['name'] for profile in json.loads(self.exported()))
+
+    def test_guest_gets_public_profiles(self):
+        data = json.loads(self.exported())
+
+        self.assertEqual(sorted(profile['name'] for profile in data), [profile.name for profile in self.public])
+        self.assertEqual(sorted(data[0].keys()), ['created', 'id', 'modified', 'name', 'slug', 'text'])
+
+    def test_private_profile_is_exported_after_passkey_is_provided(self):
+        self.client.login(username=self.user.username, password=self.password)
+        self.assertNotIn(self.private.name, self.exported_names())
+
+        session = self.client.session
+        session[session_passkeys] = {self.private.id: make_token(self.private.pk, self.user.pk, 1)}
+        session.save()
+        self.assertIn(self.private.name, self.exported_names())
+        self.client.logout()
+
+    @TestCaseEx.superuser
+    def test_superuser_gets_all_profiles(self):
+        self.assertEqual(len(self.exported_names()), 4)
+
+    def test_export_does_not_change_session(self):
+        # passkey kept in session before tokens were introduced is upgraded by show view, but not by export
+        entries = {self.private.id: u"coolpasskey"}
+        request = type('Request', (object, ), {'user': self.user, 'session': {session_passkeys: entries}})()
+
+        data = json.loads("".join(export_chunks(request, passkey_verified)))
+
+        self.assertIn(self.private.name, [profile['name'] for profile in data])
+        self.assertIs(request.session[session_passkeys], entries)
+        self.assertEqual(entries, {self.private.id: u"coolpasskey"})
+
+    def test_rows_are_sent_by_chunks(self):
+        request = type('Request', (object, ), {'user': AnonymousUser(), 'session': {}})()
+        chunks = list(export_chunks(request, passkey_verified, chunk_size=2))
+
+        # opening bracket, two chunks of public profiles, closing bracket
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(len(json.loads("".join(chunks))), 3)
+
+    def test_export_is_compressed_on_the_fly(self):
+        content = self.exported(HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(len(json.loads(gzip.GzipFile(fileobj=StringIO(content)).read())), 3)
+
+
+class TestIndexPages(TestCaseEx):
+    def setUp(self):
+        super(TestIndexPages, self).setUp()
+        self.profiles = [Profile.objects.create(name=u"profile %s" % i, text=u"text %s " % i + u"x" * 1000)
+                         for i in range(5)]
+        self.page_size = profile_views.INDEX_PAGE_SIZE
+        profile_views.INDEX_PAGE_SIZE = 2
+
+    def tearDown(self):
+        profile_views.INDEX_PAGE_SIZE = self.page_size
+        super(TestIndexPages, self).tearDown()
+
+    def test_index_shows_first_page_with_excerpts(self):
+        response = self.can_get("profiles.views.profile.index")
+
+        self.assertEqual(response.context['profiles'], self.profiles[:2])
+        self.assertEqual(response.context['next'], self.profiles[1].pk)
+        excerpt = self.profiles[0].text[:profile_views.EXCERPT_LENGTH - 3] + "..."
+        self.assertContains(response, excerpt)
+        self.assertNotContains(response, self.profiles[0].text[:profile_views.EXCERPT_LENGTH + 1])
+
+    def test_text_is_not_loaded(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.can_get("profiles.views.profile.index")
+        text = '"%s"."text"' % Profile._meta.db_table
+        # text is read only by SUBSTR of excerpt
+        for query in queries:
+            self.assertEqual(query['sql'].count(text), query['sql'].count('SUBSTR(' + text))
+
+    def test_next_pages_are_sent_as_fragments(self):
+        pages = []
+        after = 0
+        while after is not None:
+            data = json.loads(self.can_get("profiles.views.profile.index_more", {'after': after}).content)
+            pages.append(data['html'])
+            after = data['next']
+
+        self.assertEqual(len(pages), 3)
+        for profile, page in zip(self.profiles[::2], pages):
+            self.assertIn(profile.name, page)
+        self.assertNotIn(self.profiles[2].name, pages[0])
+
+    def test_managed_profiles_are_fetched_once_per_page(self):
+        userprofile = self.user.profile
+        userprofile.is_admin = True
+        userprofile.save()
+        userprofile.profiles.add(*self.profiles)
+        self.client.login(username=self.user.username, password=self.password)
+        profile_views.INDEX_PAGE_SIZE = 5
+
+        # user with profile, access set, page of profiles and managed ids,
+        # session is read from cache
+        with self.assertNumQueries(4):
+            response = self.can_get("profiles.views.profile.index")
+        self.assertEqual(response.context['allowed_profiles'], set(profile.pk for profile in self.profiles))
+        self.assertContains(response, "glyphicon-edit", count=5)
+        self.client.logout()
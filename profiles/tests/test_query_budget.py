@@ -0,0 +1,53 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.core.urlresolvers import resolve, Resolver404
+from django.test.utils import override_settings
+from app.utils import TestCaseEx
+from profiles import benchmark
+from profiles.urls import urlpatterns, v1_api
+
+
+class TestQueryBudget(TestCaseEx):
+    """
+    views should not make more queries than recorded in baselines,
+    run `bench_views --update-baselines` after intended changes of queries
+    """
+
+    def setUp(self):
+        super(TestQueryBudget, self).setUp()
+        self.baselines = benchmark.load_baselines()
+        dataset = self.baselines['dataset']
+        self.fixtures = benchmark.seed(dataset['profiles'], dataset['users'], dataset['density'])
+
+    def test_views_keep_query_budget(self):
+        results = benchmark.run(self.fixtures)
+
+        self.assertEqual(sorted(results), sorted(self.baselines['endpoints']))
+        for name, measures in results.items():
+            baseline = self.baselines['endpoints'][name]
+            self.assertEqual(measures['status'], baseline['status'], name)
+            self.assertLessEqual(measures['queries'], baseline['queries'],
+                                 "%s makes %s queries, its budget is %s" % (name, measures['queries'],
+                                                                           baseline['queries']))
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+    def test_other_caches_are_not_cleared(self):
+        self.assertRaises(ImproperlyConfigured, benchmark.measure, None, benchmark.endpoints(self.fixtures)[0])
+
+    def test_every_url_is_measured(self):
+        urls = [endpoint.url for endpoint in benchmark.endpoints(self.fixtures)]
+
+        # the first pattern which resolves url serves it
+        served = set()
+        for url in urls:
+            for pattern in urlpatterns:
+                try:
+                    match = pattern.resolve(url.lstrip("/"))
+                except Resolver404:
+                    match = None
+                if match is not None:
+                    served.add(pattern.regex.pattern)
+                    break
+        self.assertEqual(served, set(pattern.regex.pattern for pattern in urlpatterns))
+
+        resources = set(resolve(url).kwargs.get('resource_name') for url in urls)
+        self.assertTrue(set(v1_api._registry).issubset(resources))
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+from django.apps import apps
+from django.core.urlresolvers import reverse
+from django.db import connection
+from django.db.models.signals import post_migrate
+from django.test.utils import override_settings
+from app.utils import TestCaseEx
+from profiles.bulk import create_profiles
+from profiles.explain import explain
+from profiles.models import Profile, ProfilePasskeys
+from profiles.search import search, search_terms
+import profiles.search as search_module
+
+
+class TestProfileSearch(TestCaseEx):
+    def setUp(self):
+        super(TestProfileSearch, self).setUp()
+        self.apple = Profile.objects.create(name=u"apple tree", text=u"grows in the garden")
+        self.garden = Profile.objects.create(name=u"garden", text=u"apple and pear")
+        self.private = Profile.objects.create(name=u"private apple", text=u"")
+        ProfilePasskeys.objects.create(profile=self.private, user=self.root, passkey="12345")
+
+    def found(self, query, user=None):
+        return list(search(user or self.user, query))
+
+    def test_matches_are_ranked_by_name_first(self):
+        self.assertEqual(self.found(u"garden"), [self.garden, self.apple])
+        self.assertEqual(self.found(u"apple"), [self.apple, self.garden])
+
+    def test_every_term_should_match(self):
+        self.assertEqual(self.found(u"apple garden"), [self.garden, self.apple])
+        self.assertEqual(self.found(u"apple pear"), [self.garden])
+        self.assertEqual(self.found(u"appl"), [])
+
+    def test_results_follow_access_rules(self):
+        self.assertNotIn(self.private, self.found(u"apple"))
+        self.assertIn(self.private, self.found(u"apple", self.root))
+
+    def test_index_follows_changes_and_bulk_inserts(self):
+        self.apple.name = u"яблоня"
+        self.apple.save()
+        self.garden.delete()
+        create_profiles([{'name': u"Яблоко", 'text': u"imported"}])
+
+        self.assertEqual([profile.name for profile in self.found(u"ЯБЛОНЯ")], [u"яблоня"])
+        self.assertEqual([profile.name for profile in self.found(u"яблоко")], [u"Яблоко"])
+        self.assertEqual(self.found(u"garden"), [self.apple])
+        self.assertEqual(self.found(u"pear"), [])
+
+    def test_query_syntax_is_not_passed_to_database(self):
+        self.assertEqual(search_terms(u'"apple" OR * -pear: (tree)'), [u"apple", u"OR", u"pear", u"tree"])
+        self.assertEqual(self.found(u'"apple*'), [self.apple, self.garden])
+        self.assertEqual(self.found(u'*'), [])
+
+    def test_only_newest_matches_are_ranked(self):
+        candidates = search_module.SEARCH_CANDIDATES
+        search_module.SEARCH_CANDIDATES = 1
+        try:
+            self.assertEqual(self.found(u"garden"), [self.garden])
+        finally:
+            search_module.SEARCH_CANDIDATES = candidates
+
+    @override_settings(PROFILES_SEARCH_BACKEND='profiles.search.LikeSearchBackend')
+    def test_like_backend_finds_the_same_profiles(self):
+        self.assertEqual(set(self.found(u"apple garden")), set([self.garden, self.apple]))
+
+    def test_search_reads_index(self):
+        if connection.vendor != 'sqlite':
+            return
+        plan = explain(search(self.user, u"apple"))
+        self.assertIn("VIRTUAL TABLE INDEX", plan)
+
+    def test_dropped_triggers_are_installed_again_after_migrations(self):
+        if connection.vendor != 'sqlite':
+            return
+        backend = search_module.SqliteSearchBackend()
+        # what sqlite does when a migration recreates profiles table
+        backend.drop_triggers(connection)
+        self.assertFalse(backend.is_current(connection))
+
+        post_migrate.send(sender=apps.get_app_config('profiles'), app_config=apps.get_app_config('profiles'),
+                          verbosity=0, interactive=False, using=connection.alias)
+
+        self.assertTrue(backend.is_current(connection))
+        pear = Profile.objects.create(name=u"pear")
+        self.assertEqual(self.found(u"pear"), [pear, self.garden])
+
+    def test_search_page_shows_results(self):
+        response = self.can_get("profiles.views.profile.search", {'q': u"apple"})
+        self.assertEqual(response.context['profiles'], [self.apple, self.garden])
+        self.assertContains(response, reverse("profiles.views.profile.show_by_slug", args=[self.garden.slug]))
@@ -0,0 +1,77 @@
+import warnings
+from StringIO import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.test import RequestFactory
+from app.utils import TestCaseEx
+from profiles import timing
+from profiles.models import Profile
+
+
+class TestTimingMiddleware(TestCaseEx):
+    def setUp(self):
+        super(TestTimingMiddleware, self).setUp()
+        # set without override_settings, its signal makes django_assets lose its defaults
+        self.middleware_classes = settings.MIDDLEWARE_CLASSES
+        settings.MIDDLEWARE_CLASSES = ('profiles.timing.TimingMiddleware', ) + self.middleware_classes
+
+    def tearDown(self):
+        settings.MIDDLEWARE_CLASSES = self.middleware_classes
+        super(TestTimingMiddleware, self).tearDown()
+
+    def test_response_has_server_timing(self):
+        profile = Profile.objects.create(name=u"name")
+
+        response = self.can_get("profiles.views.profile.show", pargs=[profile.pk])
+
+        self.assertIn('sql;dur=', response['Server-Timing'])
+        self.assertIn('1 queries, 0 repeated', response['Server-Timing'])
+        self.assertIn('template;dur=', response['Server-Timing'])
+
+    def test_repeated_queries_are_counted(self):
+        middleware = timing.TimingMiddleware()
+        request = RequestFactory().get("/")
+        middleware.process_request(request)
+        list(Profile.objects.filter(name=u"name"))
+        list(Profile.objects.filter(name=u"name"))
+        list(Profile.objects.filter(name=u"other"))
+
+        response = middleware.process_response(request, HttpResponse())
+
+        self.assertIn('3 queries, 1 repeated', response['Server-Timing'])
+        self.assertEqual(sum(timing.histograms()['unresolved']['repeated']), 1)
+
+    def test_stats_are_collected_per_url_name(self):
+        profile = Profile.objects.create(name=u"name")
+        for i in range(3):
+            self.can_get("profiles.views.profile.show", pargs=[profile.pk])
+        self.client.get("/api/v1/profile/?format=json")
+
+        out = StringIO()
+        call_command('timing_stats', stdout=out, reset=True)
+
+        lines = out.getvalue().splitlines()
+        self.assertTrue(any(line.startswith("profiles.views.profile.show ") and " 3 " in line for line in lines))
+        self.assertTrue(any(line.startswith("api_dispatch_list:profile ") for line in lines))
+        self.assertEqual(timing.histograms(), {})
+
+    def test_url_names_are_counted_once(self):
+        measures = dict((metric, 1) for metric, bounds in timing.METRICS)
+        for name in ("first", "second", "first"):
+            timing.record(name, measures)
+
+        self.assertEqual(timing.url_names(), set(["first", "second"]))
+        self.assertEqual(sum(timing.histograms()['first']['total']), 2)
+
+    def test_missing_shared_cache_is_reported(self):
+        with self.settings(CACHE_SHARED=False):
+            err = StringIO()
+            call_command('timing_stats', stdout=StringIO(), stderr=err)
+            self.assertIn("shared cache", err.getvalue())
+
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                timing.TimingMiddleware()
+            self.assertTrue([warning for warning in caught if "shared cache" in str(warning.message)])
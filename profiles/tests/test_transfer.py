@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import shutil
+import tempfile
+from StringIO import StringIO
+
+from django.core.management import call_command
+from app.utils import TestCaseEx
+from profiles.bulk import create_profiles, CREATED, INVALID
+from profiles.changes import changes_since, current_version
+from profiles.models import Profile, ProfilePasskeys
+
+
+class TestImportExportProfiles(TestCaseEx):
+    def setUp(self):
+        super(TestImportExportProfiles, self).setUp()
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+        super(TestImportExportProfiles, self).tearDown()
+
+    def write(self, name, content):
+        path = os.path.join(self.dir, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def call(self, *args, **options):
+        out = StringIO()
+        call_command(*args, stdout=out, stderr=StringIO(), **options)
+        return out.getvalue()
+
+    def test_slugs_are_allocated_like_on_save(self):
+        Profile.objects.create(name=u"taken")
+        results = create_profiles([{'name': u"taken"}, {'name': u"taken"}, {'name': u"Имя"},
+                                   {'name': u"other", 'slug': u"Custom Slug"}, {'text': u"no name"}])
+
+        self.assertEqual([result['status'] for result in results], [CREATED] * 4 + [INVALID])
+        unnamed = Profile.objects.get(name=u"Имя")
+        self.assertEqual([result['slug'] for result in results],
+                         [u"taken-2", u"taken-3", unicode(unnamed.pk), u"custom-slug", None])
+        self.assertEqual(Profile.objects.filter(slug__in=[u"taken-2", u"taken-3", u"custom-slug"]).count(), 3)
+        self.assertIsNotNone(unnamed.created)
+
+    def test_profiles_are_imported_from_csv_by_chunks(self):
+        path = self.write("profiles.csv", "name,text\n" + "".join("name %s,text %s\n" % (i, i) for i in range(7)))
+
+        output = self.call('import_profiles', path, chunk_size=3, verbosity=2).splitlines()
+
+        # progress of each chunk and summary
+        self.assertEqual(len(output), 3 + 1)
+        self.assertIn("created: 7", output[-1])
+        self.assertEqual(sorted(Profile.objects.values_list("slug", "text")),
+                         sorted((u"name-%s" % i, u"text %s" % i) for i in range(7)))
+
+    def test_passkeys_are_imported_and_logged(self):
+        profile = Profile.objects.create(name=u"profile")
+        version = current_version()
+        path = self.write("passkeys.jsonl", "\n".join(json.dumps(record) for record in [
+            {'profile': u"profile", 'user': self.user.username, 'passkey': u"12345"},
+            {'profile': u"missing", 'user': self.user.username, 'passkey': u"12345"},
+        ]))
+
+        output = self.call('import_profiles', path, passkeys=True)
+
+        self.assertIn("created: 1", output)
+        self.assertIn("invalid: 1", output)
+        self.assertTrue(ProfilePasskeys.objects.get(profile=profile, user=self.user).check_passkey(u"12345"))
+        self.assertEqual(changes_since(self.root, version)['changes']['user'], [self.user.pk])
+
+    def test_export_can_be_imported_back(self):
+        profile = Profile.objects.create(name=u"Профиль", text=u"текст, \"кавычки\"\nи перенос")
+        ProfilePasskeys.objects.create(profile=profile, user=self.user, passkey=u"12345")
+
+        for format in ('csv', 'jsonl'):
+            profiles = os.path.join(self.dir, "profiles." + format)
+            passkeys = os.path.join(self.dir, "passkeys." + format)
+            self.call('export_profiles', profiles, chunk_size=1)
+            self.call('export_profiles', passkeys, passkeys=True)
+
+            Profile.objects.all().delete()
+            self.call('import_profiles', profiles)
+            self.call('import_profiles', passkeys, passkeys=True)
+
+            imported = Profile.objects.get()
+            self.assertEqual((imported.name, imported.slug, imported.text), (profile.name, profile.slug, profile.text))
+            # hashes are imported as is
+            self.assertTrue(ProfilePasskeys.objects.get(profile=imported, user=self.user).check_passkey(u"12345"))
+            profile = imported
@@ -0,0 +1,211 @@
+"""
+opt-in request instrumentation enabled by PROFILES_TIMING setting: number and time of sql queries,
+repeated queries, template and view time are sent in Server-Timing header
+and counted into histograms per url name kept in cache, see `timing_stats` command
+"""
+import threading
+import time
+import warnings
+from bisect import bisect_left
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.template.base import Template
+
+# upper bounds of histogram buckets, the last bucket counts bigger values
+TIME_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+METRICS = (
+    ('total', TIME_BUCKETS),
+    ('view', TIME_BUCKETS),
+    ('template', TIME_BUCKETS),
+    ('sql', TIME_BUCKETS),
+    ('queries', COUNT_BUCKETS),
+    ('repeated', COUNT_BUCKETS),
+)
+
+# url names are numbered once by incr of URLS_KEY, so concurrent requests dont drop them
+URLS_KEY = "profiles:timing:urls"
+URL_KEY = "profiles:timing:url:%s"
+URL_NAME_KEY = "profiles:timing:url-name:%s"
+BUCKET_KEY = "profiles:timing:%s:%s:%s"
+TIMING_TIMEOUT = getattr(settings, "PROFILES_TIMING_TIMEOUT", 60 * 60 * 24 * 7)
+
+# template time of current request, templates are rendered in the thread of request
+_state = threading.local()
+
+
+def instrument_templates():
+    """
+    wraps `Template.render` to sum time of templates rendered while request is timed,
+    included templates are counted as a part of outer ones
+    """
+    render = Template.render
+    if getattr(render, 'timed', False):
+        return
+
+    def timed_render(self, context):
+        if not getattr(_state, 'active', False):
+            return render(self, context)
+        _state.depth += 1
+        started = time.time()
+        try:
+            return render(self, context)
+        finally:
+            _state.depth -= 1
+            if not _state.depth:
+                _state.template += time.time() - started
+
+    timed_render.timed = True
+    Template.render = timed_render
+
+
+def url_name(request):
+    """
+    :return: name of url pattern which served request, api urls are told apart by resource
+    """
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return "unresolved"
+    if 'resource_name' in match.kwargs:
+        return "%s:%s" % (match.view_name, match.kwargs['resource_name'])
+    return match.view_name
+
+
+def increment(key):
+    """
+    :return: new value of counter
+    """
+    try:
+        return cache.incr(key)
+    except ValueError:
+        if cache.add(key, 1, TIMING_TIMEOUT):
+            return 1
+        return cache.incr(key)
+
+
+def shared_cache_warning():
+    """
+    :return: warning text if measures cannot be collected, histograms are kept in default cache
+    """
+    if not getattr(settings, "CACHE_SHARED", False):
+        return "PROFILES_TIMING needs shared cache in credentials.json, measures are not collected without it"
+    return None
+
+
+def record(name, measures):
+    """
+    counts measures of request into histograms of url name
+    :param measures: dict of values of `METRICS`
+    """
+    for metric, bounds in METRICS:
+        increment(BUCKET_KEY % (name, metric, bisect_left(bounds, measures[metric])))
+    if cache.add(URL_KEY % name, True, TIMING_TIMEOUT):
+        cache.set(URL_NAME_KEY % increment(URLS_KEY), name, TIMING_TIMEOUT)
+
+
+def url_names():
+    """
+    :return: set of timed url names
+    """
+    count = cache.get(URLS_KEY) or 0
+    return set(cache.get_many([URL_NAME_KEY % i for i in xrange(1, count + 1)]).values())
+
+
+def histograms():
+    """
+    :return: dict of url name to dict of metric to list of counts of `METRICS` buckets
+    """
+    names = url_names()
+    keys = [BUCKET_KEY % (name, metric, i) for name in names for metric, bounds in METRICS
+            for i in xrange(len(bounds) + 1)]
+    counts = cache.get_many(keys)
+    return dict((name, dict((metric, [counts.get(BUCKET_KEY % (name, metric, i), 0) for i in xrange(len(bounds) + 1)])
+                            for metric, bounds in METRICS))
+                for name in names)
+
+
+def reset():
+    names = url_names()
+    count = cache.get(URLS_KEY) or 0
+    cache.delete_many([BUCKET_KEY % (name, metric, i) for name in names for metric, bounds in METRICS
+                       for i in xrange(len(bounds) + 1)] +
+                      [URL_KEY % name for name in names] +
+                      [URL_NAME_KEY % i for i in xrange(1, count + 1)] + [URLS_KEY])
+
+
+def percentile(counts, bounds, share):
+    """
+    :return: upper bound of bucket holding the given share of requests, None for the last unbounded bucket
+    """
+    rank = sum(counts) * share
+    seen = 0
+    for bound, count in zip(bounds, counts):
+        seen += count
+        if seen >= rank:
+            return bound
+    return None
+
+
+def server_timing(measures):
+    return ", ".join([
+        'sql;dur=%.1f;desc="%s queries, %s repeated"' % (measures['sql'], measures['queries'], measures['repeated']),
+        'template;dur=%.1f' % measures['template'],
+        'view;dur=%.1f' % measures['view'],
+        'total;dur=%.1f' % measures['total'],
+    ])
+
+
+class TimingMiddleware(object):
+    """
+    should be the first middleware, so time of others is counted in total,
+    queries made while streamed response is sent are not counted
+    """
+
+    def __init__(self):
+        instrument_templates()
+        warning = shared_cache_warning()
+        if warning:
+            warnings.warn(warning, RuntimeWarning)
+
+    def process_request(self, request):
+        # queries are logged like with DEBUG while request is served
+        request._timing = {
+            'started': time.time(),
+            'connections': [(connection, connection.use_debug_cursor, len(connection.queries))
+                            for connection in connections.all()],
+        }
+        for connection in connections.all():
+            connection.use_debug_cursor = True
+        _state.active = True
+        _state.depth = 0
+        _state.template = 0.0
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._timing['view_started'] = time.time()
+
+    def process_response(self, request, response):
+        timing = getattr(request, '_timing', None)
+        if timing is None:
+            return response
+        finished = time.time()
+        _state.active = False
+
+        queries = []
+        for connection, use_debug_cursor, start in timing['connections']:
+            queries.extend(connection.queries[start:])
+            connection.use_debug_cursor = use_debug_cursor
+
+        measures = {
+            'total': (finished - timing['started']) * 1000,
+            'view': (finished - timing.get('view_started', finished)) * 1000,
+            'template': _state.template * 1000,
+            'sql': sum(float(query['time']) for query in queries) * 1000,
+            'queries': len(queries),
+            'repeated': sum(count - 1 for count in Counter(query['sql'] for query in queries).values()),
+        }
+        response['Server-Timing'] = server_timing(measures)
+        record(url_name(request), measures)
+        return response
@@ -0,0 +1,80 @@
+"""
+streaming readers and writers of files used by `import_profiles` and `export_profiles` commands,
+files are JSONL (one object per line) or CSV with header row, both are read and written record by record
+"""
+import csv
+import json
+from collections import OrderedDict
+from itertools import islice
+
+FORMATS = ('jsonl', 'csv')
+
+PROFILE_FIELDS = ('name', 'slug', 'text')
+# slug of profile, username and hashed passkey, raw passkeys are accepted on import too
+PASSKEY_FIELDS = ('profile', 'user', 'passkey')
+
+
+def guess_format(path):
+    return 'csv' if path.lower().endswith('.csv') else 'jsonl'
+
+
+def read_records(stream, format):
+    """
+    yields records of file one by one
+    :return: iterator of dicts with unicode values
+    """
+    if format == 'csv':
+        for row in csv.DictReader(stream):
+            yield dict((key.decode('utf-8'), value.decode('utf-8')) for key, value in row.items()
+                       if key is not None and value is not None)
+    else:
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_chunks(records, size):
+    """
+    splits iterator of records to lists of size records, only one chunk is kept in memory
+    """
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_records(stream, format, fields, rows):
+    """
+    writes rows one by one
+    :param rows: iterator of tuples of values in order of fields
+    :return: number of written rows
+    """
+    count = 0
+    if format == 'csv':
+        writer = csv.writer(stream)
+        writer.writerow(fields)
+        for row in rows:
+            writer.writerow([unicode(value).encode('utf-8') for value in row])
+            count += 1
+    else:
+        for row in rows:
+            stream.write(json.dumps(OrderedDict(zip(fields, row))) + "\n")
+            count += 1
+    return count
+
+
+def iterate_rows(queryset, columns, chunk_size):
+    """
+    yields values of columns of queryset rows in order of ids,
+    rows are read by chunks of chunk_size starting after the last read id, so memory use does not depend on table size
+    """
+    last = 0
+    while True:
+        rows = list(queryset.filter(pk__gt=last).order_by('pk').values_list('pk', *columns)[:chunk_size])
+        for row in rows:
+            yield row[1:]
+        if len(rows) < chunk_size:
+            return
+        last = rows[-1][0]
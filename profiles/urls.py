@@ -17,10 +17,16 @@ urlpatterns = patterns("profiles.views",
    url(r'(?P<id>\d+)/remove/$', "profile.remove"),
    url(r'(?P<id>\d+)/enter-passkey/', "profile.provide_passkey"),
    url(r'add/$', "profile.add"),
+   url(r'^export/$', "profile.export"),
+   url(r'^more/$', "profile.index_more"),
+   url(r'^search/$', "profile.search"),
 
    url(r'manager/update-profile-passkeys/', "manager.update_profile_passkeys"),
    url(r'manager/update-allowed-profiles/', "manager.update_allowed_profiles"),
    url(r'manager/send-passkey-email$', "manager.send_passkey_to_email"),
+   url(r'manager/send-profile-passkey-emails$', "manager.send_profile_passkeys_to_email"),
+   url(r'manager/bootstrap$', "manager.bootstrap"),
+   url(r'manager/changes$', "manager.changes"),
    url(r'manager/$', "manager.manager"),
 
    url(r'api/', include(v1_api.urls)),
@@ -1,21 +1,29 @@
+import hashlib
 import json
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib.auth.models import User
-from django.core.mail import send_mail
 from django.core.serializers import serialize
 from django.core.urlresolvers import reverse
 from django.db.transaction import atomic
-from django.http.response import HttpResponse, HttpResponseBadRequest
+from django.http.response import HttpResponse, HttpResponseBadRequest, HttpResponseNotModified
 from django.shortcuts import render, get_object_or_404, redirect
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.crypto import get_random_string
+from django.utils.http import parse_etags, quote_etag
+from django.views.decorators.gzip import gzip_page
 from django.views.decorators.http import require_POST
 from app.utils import require_in_POST, require_in_GET
+from profiles import outbox
+from profiles.bootstrap import manager_bootstrap
+from profiles.cache import access_transaction
+from profiles.bulk import apply_profile_passkeys, apply_allowed_profiles, update_passkeys
+from profiles.changes import record, changes_since
 
-from profiles.forms import ProfileForm, PasskeyForm, ProfilePasskeysForm, AllowedProfilesForm
-from profiles.models import Profile, ProfilePasskeys
+from profiles.forms import ProfileForm, PasskeyForm, ProfilePasskeysForm
+from profiles.models import Profile, ProfilePasskeys, MatrixChange
+from profiles.passkeys import hash_passkey
 
 
 @user_passes_test(lambda u: hasattr(u, 'is_admin') and u.is_admin)
@@ -27,38 +35,104 @@ def manager(request):
     return render(request, "profiles/manager/manager.html", {})
 
 
+@user_passes_test(lambda u: hasattr(u, 'is_admin') and u.is_admin)
+@gzip_page
+def bootstrap(request):
+    """
+    returns users, profiles and passkeys needed by manager page as columns of values,
+    see `profiles.bootstrap.manager_bootstrap`
+    ETag is a hash of content, unchanged data is answered with 304
+    """
+    content = json.dumps(manager_bootstrap(request.user), separators=(',', ':'))
+    etag = hashlib.md5(content).hexdigest()
+
+    # gzip_page marks etags of compressed responses
+    etags = [value.replace(';gzip', '') for value in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))]
+    if etag in etags:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(content, content_type="application/json")
+    response['ETag'] = quote_etag(etag)
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ('Cookie', ))
+    return response
+
+
+@user_passes_test(lambda u: hasattr(u, 'is_admin') and u.is_admin)
+@require_in_GET('since')
+def changes(request):
+    """
+    returns changes of passkeys and allowed profiles made after `since` version,
+    see `profiles.changes.changes_since`, the first version is sent with bootstrap data
+    """
+    try:
+        since = int(request.GET['since'])
+    except ValueError:
+        return HttpResponseBadRequest("since should be a version number")
+    return HttpResponse(json.dumps(changes_since(request.user, since), separators=(',', ':')),
+                        content_type="application/json")
+
+
 @user_passes_test(lambda u: u.is_superuser)
-@require_in_POST("user_id", "profile_id")
+@require_in_POST("user_id", "profile_id", "passkey")
 def send_passkey_to_email(request, ):
     """
-    sends message to user with info about new password
-    :return:
+    queues message to user with info about new password, it is delivered by `send_passkey_emails` command
+    passkeys are stored hashed, so the sender posts passkey itself and it is checked against stored one,
+    existing passkeys are unknown to manager page, new one should be generated and saved to send it
+    :return: 202 when message is queued
+    """
+    if not request.POST['passkey']:
+        return HttpResponseBadRequest("passkey is stored hashed, generate and save a new one to send it")
+    passkey = get_object_or_404(ProfilePasskeys.objects.select_related('user', 'profile'),
+                                user_id=request.POST['user_id'], profile_id=request.POST['profile_id'])
+    if not passkey.user.email:
+        return HttpResponseBadRequest("user doesn't have email")
+    if not passkey.check_passkey(request.POST['passkey']):
+        return HttpResponseBadRequest("passkey doesn't match stored one")
+
+    outbox.enqueue([outbox.build_passkey_email(passkey, request.POST['passkey'],
+                                               profile_update_url(request, passkey.profile))])
+    return HttpResponse(status=202)
+
+
+@user_passes_test(lambda u: u.is_superuser)
+@require_POST
+@require_in_POST("profile_id")
+def send_profile_passkeys_to_email(request):
+    """
+    generates new passkeys for all users of profile who have email and queues messages with them,
+    stored passkeys are hashed and cant be sent as is
+    :return: 202 with the number of queued messages
     """
-    user = get_object_or_404(User, pk=request.POST['user_id'])
     profile = get_object_or_404(Profile, pk=request.POST['profile_id'])
+    url = profile_update_url(request, profile)
 
-    passkey = get_object_or_404(ProfilePasskeys, user=user, profile=profile)
+    passkeys = ProfilePasskeys.objects.filter(profile=profile).exclude(user__email='').select_related('user')
+    emails = []
+    new_passkeys = []
+    for passkey in passkeys:
+        passkey.profile = profile
+        plain_passkey = get_random_string(10)
+        new_passkeys.append((passkey.pk, hash_passkey(plain_passkey)))
+        emails.append(outbox.build_passkey_email(passkey, plain_passkey, url))
 
-    message_html = render_to_string("profiles/emails/passkey_update.html", {
-        "user": user,
-        "profile": profile,
-        "passkey": passkey,
-        "profile_update_url": request.build_absolute_uri(reverse('profiles.views.profile.update', args=[profile.pk]))
-    })
+    with atomic():
+        update_passkeys(new_passkeys)
+        record(MatrixChange.PASSKEY, MatrixChange.SET, [(profile.pk, passkey.user_id) for passkey in passkeys])
+        outbox.enqueue(emails)
+
+    return HttpResponse(json.dumps({"queued": len(emails)}), content_type="application/json", status=202)
 
-    try:
-        user.email_user("New passkey", strip_tags(message_html), settings.EMAIL_USERNAME,
-                        html_message=message_html)
-    except Exception as e:
-        return HttpResponseBadRequest()
 
-    return HttpResponse()
+def profile_update_url(request, profile):
+    return request.build_absolute_uri(reverse('profiles.views.profile.update', args=[profile.pk]))
 
 
 @user_passes_test(lambda u: hasattr(u, 'is_admin') and u.is_admin)
 @require_POST
 @require_in_POST('profile_passkeys')
-@atomic
+@access_transaction
 def update_profile_passkeys(request):
     """
     this view expects POST method,
@@ -70,42 +144,26 @@ def update_profile_passkeys(request):
 
       {profile: 'profile_id', user: 'user_id', passkey: 'some_passkey', allowed: 'false'}
 
+    returns the list of {profile, user, status} results for each triple
     """
     profiles_passkeys = json.loads(request.POST['profile_passkeys'])
-    allowed_profiles = request.user.profile.profiles.values_list("id", flat=True)
-    for profile_passkey in profiles_passkeys:
-        profile_id = int(profile_passkey['profile'])
-        user_id = int(profile_passkey['user'])
-
-        # check for user can update profiles passkeys:
-        if request.user.is_superuser or profile_id in allowed_profiles:
-            if 'allowed' in profile_passkey:
-                if profile_passkey['allowed'] == False:
-                    ppk = ProfilePasskeys.objects.filter(profile_id=profile_id, user_id=user_id)
-                    ppk.delete()
-                    continue
-
-            passkey = profile_passkey['passkey']
-            if passkey == '':
-                continue
-            ppk, _ = ProfilePasskeys.objects.get_or_create(profile_id=profile_id, user_id=user_id)
-            ppk.passkey = passkey
-            ppk.save()
-        # else:
-        #     messages.warning("You cant update profile with id=%s", profile_id)
-    return HttpResponse()
+    results = apply_profile_passkeys(request.user, profiles_passkeys)
+    return HttpResponse(json.dumps(results), content_type="application/json")
 
 
 @user_passes_test(lambda u: u.is_superuser)
 @require_POST
 @require_in_POST('admins')
-@atomic
+@access_transaction
 def update_allowed_profiles(request):
-    admins = json.loads(request.POST['admins'])
-    for admin in admins:
-        user = get_object_or_404(User, pk=admin['user'])
-        form = AllowedProfilesForm(admin, instance=user.profile)
-        if form.is_valid():
-            form.save()
+    """
+    this view expects POST method,
+    expects the list of admins with profiles they can manage in admins parameter
 
-    return HttpResponse()
\ No newline at end of file
+      {user: 'user_id', profiles: ['profile_id', ...]}
+
+    returns the list of {user, status} results for each admin
+    """
+    admins = json.loads(request.POST['admins'])
+    results = apply_allowed_profiles(admins)
+    return HttpResponse(json.dumps(results), content_type="application/json")
@@ -1,18 +1,67 @@
+import json
+from functools import wraps
+
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib.auth.models import User
-from django.core.serializers import json, serialize
+from django.core.serializers import serialize
 from django.core.urlresolvers import reverse
+from django.db import connection
 from django.db.models import Q
-from django.http.response import HttpResponse, HttpResponseBadRequest
+from django.http import Http404
+from django.http.response import HttpResponse, HttpResponseBadRequest, HttpResponseNotModified, \
+    StreamingHttpResponse
 from django.shortcuts import render, get_object_or_404, redirect
+from django.template import RequestContext
+from django.template.loader import render_to_string
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags, quote_etag, parse_http_date_safe, http_date
+from django.views.decorators.gzip import gzip_page
 
 # Create your views here.
+from profiles.access import AccessMatrix
+from profiles.cache import get_cached_page, set_cached_page, page_generation
+from profiles.export import export_chunks
 from profiles.forms import ProfileForm, PasskeyForm
-from profiles.models import Profile, ProfilePasskeys
+from profiles.models import Profile, ProfilePasskeys, ProfileSlugHistory
+from profiles.passkeys import make_token, read_token, passkey_matches, SessionPasskeys
+from profiles.search import search as search_profiles, SEARCH_LIMIT
 
 session_passkeys = "passkeys"  # const, session variable which keeps all data
 
+INDEX_PAGE_SIZE = getattr(settings, "PROFILES_INDEX_PAGE_SIZE", 30)
+EXCERPT_LENGTH = getattr(settings, "PROFILES_INDEX_EXCERPT_LENGTH", 300)
+
+
+def passkey_verified(request, profile_id, passkey, version, update_session=True):
+    """
+    checks token kept in session for profile, no queries are made
+    passkeys kept in session before tokens were introduced are checked against hash and replaced by tokens
+    :param passkey: hashed passkey of request user for profile
+    :param version: version of that passkey
+    :param update_session: False when session can't be saved anymore, e.g. while response is streamed
+    :return: True if session has token of current passkey, False if session has outdated one
+     or wrong passkey was provided, None if nothing was provided
+    """
+    passkeys = SessionPasskeys(request.session, session_passkeys)
+    value = passkeys.get(profile_id) if update_session else passkeys.peek(profile_id)
+    if value is None:
+        return None
+    if value is False:
+        # wrong passkey was provided
+        return False
+
+    token = read_token(value)
+    if token is not None:
+        return token == [int(profile_id), request.user.pk, version]
+
+    if not passkey_matches(value, passkey):
+        return False
+    if update_session:
+        passkeys.set(profile_id, make_token(profile_id, request.user.pk, version))
+    return True
+
 
 def check_passkey(fn):
     """
@@ -20,16 +69,18 @@ def check_passkey(fn):
     :return:
     """
 
+    @wraps(fn)
     def wrapper(request, id):
         if request.user.is_superuser:
             return fn(request, id)
 
-        passkeys = request.session.get(session_passkeys)
-        pkk = get_object_or_404(ProfilePasskeys, user_id=request.user.pk, profile_id=id)
-        if passkeys and unicode(id) in passkeys and passkeys[unicode(id)] == pkk.passkey:
+        pkk = get_object_or_404(ProfilePasskeys.objects.only("passkey", "passkey_version"),
+                                user_id=request.user.pk, profile_id=id)
+        verified = passkey_verified(request, id, pkk.passkey, pkk.passkey_version)
+        if verified:
             return fn(request, id)
         else:
-            if passkeys and unicode(id) in passkeys:
+            if verified is not None:
                 messages.warning(request, 'wrong passkey')
             return redirect(reverse("profiles.views.profile.provide_passkey", args=[id, ]))
 
@@ -41,14 +92,11 @@ def check_is_admin(fn):
     :param fn:
     :return:
     """
+    @wraps(fn)
     def wrapper(request, id):
-        if request.user.is_superuser:
+        if AccessMatrix(request.user).can_manage(id):
             return fn(request, id)
 
-        if hasattr(request.user, 'is_admin') and request.user.is_admin:
-            if request.user.is_superuser or request.user.profile.profiles.filter(pk=id).count():
-                return fn(request, id)
-
         # if user dont have access for that profile
         return redirect(reverse("django.contrib.auth.views.login") + '?next=%s' % request.path)
     return wrapper
@@ -66,9 +114,13 @@ def provide_passkey(request, id):
     elif request.method == "POST":
         form = PasskeyForm(request.POST)
         if form.is_valid():
-            passkeys = request.session.get(session_passkeys, {})
-            passkeys[id] = form.cleaned_data['passkey']
-            request.session[session_passkeys] = passkeys
+            pkk = ProfilePasskeys.objects.filter(user_id=request.user.pk, profile_id=id).first()
+            passkeys = SessionPasskeys(request.session, session_passkeys)
+            if pkk is not None and pkk.check_passkey(form.cleaned_data['passkey']):
+                passkeys.set(id, make_token(id, request.user.pk, pkk.passkey_version))
+            else:
+                # marks wrong attempt, `show` warns about it, the attempt itself is not kept
+                passkeys.set(id, False)
             return redirect(reverse("profiles.views.profile.update", args=[id]))
         else:
             return render(request, "profiles/manager/enter_passkey.html", {
@@ -79,52 +131,190 @@ def provide_passkey(request, id):
     return HttpResponseBadRequest()
 
 
+def index_page(request):
+    """
+    loads page of profiles following the profile with `after` id, text of profiles is not loaded, only its excerpt
+    :return: context of `profiles/index_items.html`
+    """
+    try:
+        after = int(request.GET.get('after', 0))
+    except ValueError:
+        after = 0
+
+    profiles = list(with_excerpt(Profile.list_accessed_by(request.user).filter(pk__gt=after).order_by('pk'))
+                    [:INDEX_PAGE_SIZE + 1])
+    has_next = len(profiles) > INDEX_PAGE_SIZE
+    profiles = profiles[:INDEX_PAGE_SIZE]
+
+    return {
+        'profiles': profiles,
+        'allowed_profiles': managed_ids(request.user, profiles),
+        'excerpt_length': EXCERPT_LENGTH,
+        'next': profiles[-1].pk if has_next else None,
+    }
+
+
+def with_excerpt(profiles):
+    """
+    :return: profiles loaded without text, only with its excerpt
+    """
+    text = "%s.%s" % (connection.ops.quote_name(Profile._meta.db_table),
+                      connection.ops.quote_name(Profile._meta.get_field('text').column))
+    # one more char lets template tell truncated excerpt from short text
+    return profiles.defer('text').extra(select={'excerpt': "SUBSTR(%s, 1, %%s)" % text},
+                                        select_params=(EXCERPT_LENGTH + 1, ))
+
+
+def managed_ids(user, profiles):
+    """
+    ids of listed profiles which can be managed by user are fetched at once instead of lookup per row
+    :return: set of ids
+    """
+    if hasattr(user, 'is_admin') and user.is_admin and not user.is_superuser:
+        return AccessMatrix(user).managed_among(profile.pk for profile in profiles)
+    return set()
+
+
 def index(request):
-    return render(request, "profiles/index.html", {
-        'profiles': Profile.list_accessed_by(request.user),
-        'allowed_profiles': request.user.profile.profiles.values_list("id", flat=True)
-                            if hasattr(request.user,'profile') else [],
+    return render(request, "profiles/index.html", index_page(request))
+
+
+def index_more(request):
+    """
+    next page of index for infinite scroll
+    :return: json {html: rendered profiles, next: `after` parameter of the next page or null}
+    """
+    context = index_page(request)
+    html = render_to_string("profiles/index_items.html", context, context_instance=RequestContext(request))
+    return HttpResponse(json.dumps({'html': html, 'next': context['next']}), content_type="application/json")
+
+
+def search(request):
+    """
+    profiles which user can see matching `q` parameter, best first
+    """
+    query = request.GET.get('q', '')
+    profiles = list(with_excerpt(search_profiles(request.user, query))[:SEARCH_LIMIT])
+    return render(request, "profiles/search.html", {
+        'query': query,
+        'profiles': profiles,
+        'allowed_profiles': managed_ids(request.user, profiles),
+        'excerpt_length': EXCERPT_LENGTH,
     })
 
 
+@gzip_page
+def export(request):
+    """
+    sends all profiles which user can see as json array, the response is streamed while rows are read
+    and compressed on the fly for clients accepting gzip
+    """
+    response = StreamingHttpResponse(export_chunks(request, passkey_verified), content_type="application/json")
+    response['Cache-Control'] = 'private, no-cache'
+    patch_vary_headers(response, ('Cookie', ))
+    return response
+
+
+def public_page_cache(kind):
+    """
+    serves pages of public profiles to guests from cache, supports conditional GET with ETag and Last-Modified
+    the view should mark cacheable responses with public_profile attribute
+    :param kind: 'id' or 'slug', name of view argument
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(request, **kwargs):
+            value = kwargs[kind]
+            if request.method != "GET" or request.user.is_authenticated():
+                return fn(request, value)
+
+            page, profile_id = get_cached_page(kind, value)
+            if page is None:
+                generation = page_generation(profile_id) if profile_id is not None else None
+                response = fn(request, value)
+                profile = getattr(response, 'public_profile', None)
+                if profile is None or response.status_code != 200:
+                    return response
+                if profile.pk != profile_id:
+                    generation = None
+                page = set_cached_page(kind, value, profile, generation, response)
+
+            return page_response(request, page)
+        return wrapper
+    return decorator
+
+
+def page_response(request, page):
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE'))
+    if if_none_match:
+        etags = parse_etags(if_none_match)
+        not_modified = page['etag'] in etags or '*' in etags
+    else:
+        not_modified = if_modified_since is not None and if_modified_since >= page['last_modified']
+
+    if not_modified:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(page['content'], content_type=page['content_type'])
+    response['ETag'] = quote_etag(page['etag'])
+    response['Last-Modified'] = http_date(page['last_modified'])
+    patch_vary_headers(response, ('Cookie', ))
+    return response
+
+
+@public_page_cache('id')
 def show(request, id):
-    profile = get_object_or_404(Profile, pk=id)
+    profile = get_object_or_404(Profile.with_access_flags(request.user), pk=id)
+    return show_profile(request, profile)
+
 
+@public_page_cache('slug')
+def show_by_slug(request, slug):
+    try:
+        profile = Profile.with_access_flags(request.user).get(slug=slug)
+    except Profile.DoesNotExist:
+        # profile could be renamed
+        current_slug = ProfileSlugHistory.resolve(slug)
+        if current_slug is None:
+            raise Http404
+        return redirect(reverse("profiles.views.profile.show_by_slug", args=[current_slug]), permanent=True)
+    return show_profile(request, profile)
+
+
+def show_profile(request, profile):
+    """
+    renders profile if user can see it, all flags are loaded by Profile.with_access_flags
+    :param profile: profile annotated by Profile.with_access_flags
+    """
     def render_show_view(prf):
         return render(request, "profiles/show.html", {
             'profile': prf
         })
 
-    passkeys = ProfilePasskeys.objects.filter(profile=profile)
-
-
     # anyone can see profile without passkey
-    if passkeys.count() == 0:
-        return render_show_view(profile)
+    if not profile.has_any_passkey:
+        response = render_show_view(profile)
+        response.public_profile = profile
+        return response
 
     # if user is admin, check has he access for that profile
     if hasattr(request.user, 'is_admin') and request.user.is_admin:
-        if request.user.is_superuser or request.user.profile.profiles.filter(pk=profile.id).count():
+        if request.user.is_superuser or profile.user_is_manager:
             return render_show_view(profile)
 
     # if user dont have access for that profile we'll redirect him to login
-    if passkeys.filter(user_id=request.user.pk).count() == 0:
+    if profile.user_passkey is None:
         return redirect(reverse("django.contrib.auth.views.login") + '?next=%s' % request.path)
 
     # if user has access to that profile he should provide correct passkey
-    pkk = get_object_or_404(ProfilePasskeys, user_id=request.user.pk, profile_id=id)
-    passkeys = request.session.get(session_passkeys)
-    if passkeys and unicode(id) in passkeys and passkeys[unicode(id)] == pkk.passkey:
+    verified = passkey_verified(request, profile.pk, profile.user_passkey, profile.user_passkey_version)
+    if verified:
         return render_show_view(profile)
     else:
-        if passkeys and unicode(id) in passkeys:
+        if verified is not None:
             messages.warning(request, 'wrong passkey')
-        return redirect(reverse("profiles.views.profile.provide_passkey", args=[id, ]))
-
-
-def show_by_slug(request, slug):
-    profile = get_object_or_404(Profile, slug=slug)
-    return show(request, profile.pk)
+        return redirect(reverse("profiles.views.profile.provide_passkey", args=[profile.pk, ]))
 
 
 @user_passes_test(lambda u: u.is_superuser)